@@ -0,0 +1,40 @@
+"""
+NDJSON/CSV 대량 가져오기
+
+    $ python -m admin.cli members members.ndjson
+    $ python -m admin.cli posts posts.csv --format csv
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+from fastapi import HTTPException
+
+from admin.enums import ImportTable
+from admin.service import import_rows, shutdown_import_hash_executor
+from database import engine
+from export import ExportFormat
+
+
+async def main(args: argparse.Namespace) -> None:
+    started = perf_counter()
+    try:
+        with open(args.path, "rb") as file:
+            rows = await import_rows(args.table, file, args.format)
+    except HTTPException as e:
+        raise SystemExit(e.detail[0]["message"])
+    finally:
+        shutdown_import_hash_executor()
+        await engine.dispose()
+
+    elapsed = perf_counter() - started
+    print(f"{args.table}: {rows} rows in {elapsed:.1f}s ({rows / elapsed:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("table", type=ImportTable, choices=list(ImportTable))
+    parser.add_argument("path")
+    parser.add_argument("--format", type=ExportFormat, choices=list(ExportFormat), default=ExportFormat.NDJSON)
+    asyncio.run(main(parser.parse_args()))
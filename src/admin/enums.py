@@ -0,0 +1,19 @@
+from enum import StrEnum
+
+
+class ImportTable(StrEnum):
+    """
+    대량 가져오기 대상
+
+    MEMBERS: 회원
+    POSTS: 게시물
+    COMMENTS: 댓글
+    POST_LIKES: 게시물 좋아요
+    COMMENT_LIKES: 댓글 좋아요
+    """
+
+    MEMBERS = "members"
+    POSTS = "posts"
+    COMMENTS = "comments"
+    POST_LIKES = "post_likes"
+    COMMENT_LIKES = "comment_likes"
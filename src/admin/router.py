@@ -0,0 +1,32 @@
+from time import perf_counter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+
+from admin.enums import ImportTable
+from admin.schemas import ImportResponse
+from admin.service import import_rows
+from auth.schemas import TokenPayload
+from dependencies import get_current_user
+from export import ExportFormat
+from member.enums import MemberRole
+
+router = APIRouter(prefix="/v1/admin", tags=["admin"])
+
+
+@router.post("/import/{table}", response_model=ImportResponse, status_code=status.HTTP_201_CREATED)
+async def import_table(
+    current_user: Annotated[TokenPayload, Depends(get_current_user)],
+    table: ImportTable,
+    file: UploadFile,
+    format: ExportFormat = ExportFormat.NDJSON,
+):
+    if current_user.role != MemberRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=[{"message": "권한이 없습니다."}],
+        )
+
+    started = perf_counter()
+    rows = await import_rows(table, file.file, format)
+    return ImportResponse(table=table, rows=rows, elapsed=perf_counter() - started)
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from admin.enums import ImportTable
+
+
+class ImportResponse(BaseModel):
+    """대량 가져오기 응답 구조"""
+
+    table: ImportTable
+    rows: int
+    elapsed: float
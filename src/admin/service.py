@@ -0,0 +1,236 @@
+import asyncio
+import csv
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import BinaryIO, Callable, Iterable, Iterator
+from uuid import UUID, uuid4
+
+from asyncpg.exceptions import DataError, IntegrityConstraintViolationError
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from ulid import ULID
+
+from admin.enums import ImportTable
+from auth.service import hash_password_sync
+from config import get_settings
+from database import engine
+from export import ExportFormat
+from likes import recount_like_counts
+from member.enums import MemberRole
+from models import Comment, CommentLike, Post, PostLike
+
+settings = get_settings()
+
+# 가져오기용 비밀번호 해싱 풀 (첫 가져오기 시 생성)
+_import_hash_executor: ProcessPoolExecutor | None = None
+
+# 한 번에 해싱 풀에 넘기는 비밀번호 수
+HASH_CHUNK_SIZE = 64
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _ulid_key(value: str | None, created_at: datetime) -> UUID:
+    """ULID 문자열을 uuid 컬럼에 COPY 할 값으로 변환 (없으면 created_at 기준으로 생성)"""
+    return (ULID.from_str(value) if value else ULID.from_datetime(created_at)).to_uuid()
+
+
+def _member_record(row: dict, now: datetime) -> tuple:
+    return (
+        row.get("id") or str(uuid4()),
+        row["email"],
+        row.get("password_hash") or row["password"],
+        row["address"],
+        row["name"],
+        MemberRole(row.get("role") or MemberRole.USER),
+        _parse_datetime(row.get("created_at")) or now,
+    )
+
+
+def _post_record(row: dict, now: datetime) -> tuple:
+    created_at = _parse_datetime(row.get("created_at")) or now
+    return (
+        _ulid_key(row.get("id"), created_at),
+        row["member_id"],
+        row["title"],
+        row["content"],
+        int(row.get("like_count") or 0),
+        created_at,
+        _parse_datetime(row.get("updated_at")) or created_at,
+    )
+
+
+def _comment_record(row: dict, now: datetime) -> tuple:
+    created_at = _parse_datetime(row.get("created_at")) or now
+    return (
+        _ulid_key(row.get("id"), created_at),
+        row["member_id"],
+        ULID.from_str(row["post_id"]).to_uuid(),
+        row["content"],
+        int(row.get("like_count") or 0),
+        created_at,
+        _parse_datetime(row.get("updated_at")) or created_at,
+    )
+
+
+def _post_like_record(row: dict, now: datetime) -> tuple:
+    return (ULID.from_str(row["post_id"]).to_uuid(), row["member_id"])
+
+
+def _comment_like_record(row: dict, now: datetime) -> tuple:
+    return (ULID.from_str(row["comment_id"]).to_uuid(), row["member_id"])
+
+
+# 대상별 (테이블, 컬럼, 행 변환 함수)
+IMPORTERS: dict[ImportTable, tuple[str, list[str], Callable[[dict, datetime], tuple]]] = {
+    ImportTable.MEMBERS: (
+        "member",
+        ["id", "email", "password", "address", "name", "role", "created_at"],
+        _member_record,
+    ),
+    ImportTable.POSTS: (
+        "post",
+        ["id", "member_id", "title", "content", "like_count", "created_at", "updated_at"],
+        _post_record,
+    ),
+    ImportTable.COMMENTS: (
+        "comment",
+        ["id", "member_id", "post_id", "content", "like_count", "created_at", "updated_at"],
+        _comment_record,
+    ),
+    ImportTable.POST_LIKES: ("post_like", ["post_id", "member_id"], _post_like_record),
+    ImportTable.COMMENT_LIKES: ("comment_like", ["comment_id", "member_id"], _comment_like_record),
+}
+
+# 좋아요 가져오기 후 like_count 를 다시 계산할 대상
+LIKE_TARGETS = {
+    ImportTable.POST_LIKES: (Post, PostLike, PostLike.post_id),
+    ImportTable.COMMENT_LIKES: (Comment, CommentLike, CommentLike.comment_id),
+}
+
+
+def _read_rows(file: BinaryIO, format: ExportFormat) -> Iterator[dict]:
+    """NDJSON/CSV 파일을 한 행씩 읽기 (내보내기 형식과 동일)"""
+    text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    try:
+        if format == ExportFormat.CSV:
+            yield from csv.DictReader(text)
+        else:
+            for line in text:
+                if line.strip():
+                    yield json.loads(line)
+    finally:
+        text.detach()
+
+
+def _batched(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _parse_batch(batches: Iterator[list[dict]], to_record: Callable, now: datetime) -> tuple[list[dict], list[tuple]]:
+    """다음 배치를 읽어 COPY 레코드로 변환 (파일이 끝났으면 빈 배치)"""
+    rows = next(batches, [])
+    return rows, [to_record(row, now) for row in rows]
+
+
+def _hash_passwords(passwords: list[str]) -> list[str]:
+    return [hash_password_sync(password) for password in passwords]
+
+
+async def _hash_member_passwords(rows: list[dict], records: list[tuple]) -> list[tuple]:
+    """
+    평문 비밀번호를 프로세스 풀에서 병렬로 해싱
+
+    password_hash 가 주어진 행은 그대로 사용한다.
+    """
+    global _import_hash_executor
+    if _import_hash_executor is None:
+        _import_hash_executor = ProcessPoolExecutor(max_workers=settings.IMPORT_HASH_WORKERS)
+
+    indexes = [i for i, row in enumerate(rows) if not row.get("password_hash")]
+    if not indexes:
+        return records
+
+    loop = asyncio.get_running_loop()
+    chunks = [indexes[i : i + HASH_CHUNK_SIZE] for i in range(0, len(indexes), HASH_CHUNK_SIZE)]
+    hashed = await asyncio.gather(
+        *[
+            loop.run_in_executor(_import_hash_executor, _hash_passwords, [rows[i]["password"] for i in chunk])
+            for chunk in chunks
+        ]
+    )
+
+    records = list(records)
+    for chunk, passwords in zip(chunks, hashed):
+        for i, password in zip(chunk, passwords):
+            records[i] = records[i][:2] + (password,) + records[i][3:]
+    return records
+
+
+def shutdown_import_hash_executor() -> None:
+    """가져오기용 비밀번호 해싱 풀 종료"""
+    global _import_hash_executor
+    if _import_hash_executor is not None:
+        _import_hash_executor.shutdown(wait=False, cancel_futures=True)
+        _import_hash_executor = None
+
+
+async def import_rows(table: ImportTable, file: BinaryIO, format: ExportFormat) -> int:
+    """
+    NDJSON/CSV 파일을 COPY 로 대량 가져오기
+
+    IMPORT_BATCH_SIZE 행씩 읽어 asyncpg copy_records_to_table 로 적재하고, 전체를 하나의 트랜잭션으로 처리한다.
+    파일 읽기와 파싱은 이벤트 루프를 막지 않도록 배치마다 스레드 풀에서 실행한다.
+    id 가 없는 게시물/댓글은 created_at 기준 ULID 를, 회원은 UUID 를 생성한다.
+    회원의 평문 password 는 프로세스 풀에서 해싱하고, password_hash 가 있으면 그대로 사용한다.
+    좋아요를 가져오면 대상의 like_count 를 좋아요 기록 수로 다시 계산한다.
+
+    Args:
+        table: 가져오기 대상
+        file: NDJSON/CSV 파일 (바이너리)
+        format: 파일 형식
+
+    Returns:
+        int: 가져온 행 수
+    """
+    table_name, columns, to_record = IMPORTERS[table]
+    now = datetime.now()
+    count = 0
+    target_ids: set[UUID] = set()
+
+    try:
+        async with engine.begin() as connection:
+            driver_connection = (await connection.get_raw_connection()).driver_connection
+
+            batches = _batched(_read_rows(file, format), settings.IMPORT_BATCH_SIZE)
+            while True:
+                rows, records = await run_in_threadpool(_parse_batch, batches, to_record, now)
+                if not rows:
+                    break
+                if table == ImportTable.MEMBERS:
+                    records = await _hash_member_passwords(rows, records)
+
+                await driver_connection.copy_records_to_table(table_name, records=records, columns=columns)
+                count += len(records)
+
+                if table in LIKE_TARGETS:
+                    target_ids.update(record[0] for record in records)
+
+            if table in LIKE_TARGETS:
+                target, like, like_target_id = LIKE_TARGETS[table]
+                for rows in _batched(target_ids, settings.IMPORT_BATCH_SIZE):
+                    await connection.execute(recount_like_counts(target, like, like_target_id, rows))
+    except (KeyError, ValueError, DataError, IntegrityConstraintViolationError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[{"message": f"가져오기에 실패했습니다. ({count + 1}번째 행 부근): {e!r}"}],
+        )
+
+    return count
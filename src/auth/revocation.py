@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import logging
+import math
+from time import time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    블룸 필터
+
+    capacity 개를 넣었을 때 오탐률이 error_rate 가 되도록 비트 수와 해시 수를 정한다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class TokenDenylist:
+    """
+    폐기된 토큰(jti) 목록
+
+    Redis 에 jti 를 토큰 만료 시각까지 보관하고, 각 워커는 로컬 블룸 필터를 pub/sub 로 갱신한다.
+    블룸 필터에 없는 jti 는 Redis 조회 없이 유효하다고 판단하고, 있는 경우에만 Redis 에서 확인한다.
+    구독이 끊긴 동안에는 누락된 폐기가 있을 수 있으므로 모든 jti 를 Redis 에서 확인한다.
+    Redis 를 조회할 수 없으면 마지막 블룸 필터로 판단한다 (fail open, 끊긴 뒤의 폐기는 놓칠 수 있다).
+    """
+
+    def __init__(self, redis: Redis, capacity: int, error_rate: float, rebuild_interval: float):
+        self.redis = redis
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.key = "revoked_jti"
+        self.channel = "auth:revoked"
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.synced = False
+        self._listener: asyncio.Task | None = None
+
+    def _jti_key(self, jti: str) -> str:
+        return f"{self.key}:{jti}"
+
+    async def revoke(self, jti: str, exp: float) -> None:
+        """
+        토큰 폐기
+
+        Args:
+            jti: 토큰 고유 식별자
+            exp: 토큰 만료 시각 (unix timestamp)
+        """
+        now = time()
+        if exp <= now:
+            return
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._jti_key(jti), 1, ex=math.ceil(exp - now))
+            pipe.zadd(self.key, {jti: exp})
+            pipe.zremrangebyscore(self.key, "-inf", now)
+            pipe.publish(self.channel, jti)
+            await pipe.execute()
+
+        self.bloom.add(jti)
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self.synced and jti not in self.bloom:
+            return False
+
+        try:
+            return bool(await self.redis.exists(self._jti_key(jti)))
+        except RedisError:
+            logger.warning("token revocation check failed, falling back to bloom filter", exc_info=True)
+            return jti in self.bloom
+
+    async def _reload(self) -> None:
+        """만료되지 않은 폐기 jti 로 블룸 필터 재구성"""
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        async for jti, _ in self.redis.zscan_iter(self.key):
+            bloom.add(jti.decode())
+        self.bloom = bloom
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    # 구독 후 전체 목록을 읽어야 그 사이의 폐기를 놓치지 않는다.
+                    await pubsub.subscribe(self.channel)
+                    await self._reload()
+                    self.synced = True
+                    reloaded_at = time()
+
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message is not None:
+                            self.bloom.add(message["data"].decode())
+
+                        # 만료된 jti 가 필터에 계속 쌓이지 않도록 주기적으로 재구성
+                        if time() - reloaded_at >= self.rebuild_interval:
+                            await self.redis.zremrangebyscore(self.key, "-inf", time())
+                            await self._reload()
+                            reloaded_at = time()
+            except RedisError:
+                logger.warning("token revocation listener disconnected", exc_info=True)
+                self.synced = False
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        """폐기 메시지 구독 시작"""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+            self.synced = False
@@ -1,16 +1,19 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
+from auth.schemas import TokenPayload
 from database import AsyncSession
-from dependencies import get_db_session
+from dependencies import get_current_user, get_db_session
 from member.schemas import LoginResponse
-from auth.service import authenticate
+from auth.service import authenticate, revoke_access_token
+from serializers import ResponseSerializer
 
 router = APIRouter(prefix="/v1", tags=["auth"])
 
+login_serializer = ResponseSerializer(LoginResponse)
+
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
 async def login(
@@ -18,4 +21,9 @@ async def login(
     oauth2_request: Annotated[OAuth2PasswordRequestForm, Depends()],
 ):
     token = await authenticate(db_session, oauth2_request.username, oauth2_request.password)
-    return JSONResponse(content={"token": token})
+    return login_serializer({"token": token})
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(current_user: Annotated[TokenPayload, Depends(get_current_user)]):
+    await revoke_access_token(current_user.jti, current_user.exp)
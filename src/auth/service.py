@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from uuid import uuid4
 from passlib.context import CryptContext
@@ -7,14 +9,67 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from jose import jwt, JWTError
 
+from auth.revocation import TokenDenylist
 from models import Member
 from config import get_settings
+from redis_client import redis_client
 
 settings = get_settings()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 연산은 이벤트 루프를 막지 않도록 별도 풀에서 실행하고, 동시 실행 수를 제한한다.
+hash_executor: Executor = (
+    ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+    if settings.PASSWORD_HASH_EXECUTOR == "process"
+    else ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+)
+hash_semaphore = asyncio.Semaphore(settings.PASSWORD_HASH_MAX_CONCURRENCY)
 
-def hash_password(password: str) -> str:
+# 폐기된 토큰 목록
+token_denylist = TokenDenylist(
+    redis_client,
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    rebuild_interval=settings.REVOCATION_REBUILD_INTERVAL,
+)
+
+
+def hash_password_sync(password: str) -> str:
+    """
+    비밀번호 해싱 (호출한 스레드/프로세스에서 실행)
+
+    이벤트 루프에서는 hash_password 를 사용하고, 이 함수는 별도 풀(가져오기 해싱 풀 등)에서 직접 호출할 때 사용한다.
+    """
+    return pwd_context.hash(password)
+
+
+def _check_password(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+async def _run_in_hash_executor(func, *args):
+    """
+    해싱 풀에서 실행
+
+    동시 실행 수가 한도에 도달하면 PASSWORD_HASH_QUEUE_TIMEOUT 초까지 대기하고,
+    그 안에 차례가 오지 않으면 503 으로 거절한다.
+    """
+    try:
+        await asyncio.wait_for(hash_semaphore.acquire(), timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=[{"message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."}],
+            headers={"Retry-After": "1"},
+        )
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(hash_executor, func, *args)
+    finally:
+        hash_semaphore.release()
+
+
+async def hash_password(password: str) -> str:
     """
     비밀번호 해싱
 
@@ -24,10 +79,10 @@ def hash_password(password: str) -> str:
     Returns:
         str: 해싱된 비밀번호
     """
-    return pwd_context.hash(password)
+    return await _run_in_hash_executor(hash_password_sync, password)
 
 
-def check_password(password: str, hashed_password: str) -> bool:
+async def check_password(password: str, hashed_password: str) -> bool:
     """
     비밀번호 검증
 
@@ -38,7 +93,7 @@ def check_password(password: str, hashed_password: str) -> bool:
     Returns:
         bool: 검증 결과
     """
-    return pwd_context.verify(password, hashed_password)
+    return await _run_in_hash_executor(_check_password, password, hashed_password)
 
 
 def create_access_token(payload: dict, expires_delta: timedelta = timedelta(hours=6)):
@@ -92,7 +147,7 @@ def decode_access_token(token: str) -> dict:
 
 
 async def authenticate(db_session: AsyncSession, email: str, password: str) -> str:
-    _member = await db_session.scalar(select(Member).where(Member.email == email))
+    _member = await db_session.scalar(select(Member).where(Member.email == email, Member.deleted_at.is_(None)))
 
     if not _member:
         raise HTTPException(
@@ -100,10 +155,21 @@ async def authenticate(db_session: AsyncSession, email: str, password: str) -> s
             detail=[{"message": "인증에 실패했습니다. 이메일 또는 비밀번호를 확인해주세요."}],
         )
 
-    if not check_password(password, _member.password):
+    if not await check_password(password, _member.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=[{"message": "인증에 실패했습니다. 이메일 또는 비밀번호를 확인해주세요."}],
         )
 
     return create_access_token(payload={"sub": _member.id, "role": _member.role})
+
+
+async def revoke_access_token(jti: str, exp: datetime) -> None:
+    """
+    액세스 토큰 폐기
+
+    Args:
+        jti: 토큰 고유 식별자
+        exp: 토큰 만료 시간
+    """
+    await token_denylist.revoke(jti, exp.timestamp())
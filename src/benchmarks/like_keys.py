@@ -0,0 +1,105 @@
+"""
+좋아요 테이블 키 벤치마크
+
+post_like, comment_like 의 테이블/인덱스 크기와 좋아요 테이블을 조인하는 쿼리의 p50/p99 지연 시간을 측정한다.
+키 컬럼 전환(key_migration.py) 전후에 같은 시드 데이터(benchmarks.load_test seed)로 실행해 비교한다.
+
+    $ python -m benchmarks.like_keys --samples 200
+"""
+
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+from sqlalchemy import text
+
+from database import AsyncSessionLocal, engine
+
+LIKE_TABLES = ("post_like", "comment_like")
+
+SIZE_SQL = text(
+    """
+    SELECT c.relname, pg_relation_size(c.oid)
+    FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+    WHERE i.indrelid = CAST(:table AS regclass)
+    ORDER BY c.relname
+    """
+)
+
+# 회원이 좋아요 누른 게시물 최신순 (post_like.member_id 인덱스 -> post 기본키 조인)
+MEMBER_LIKED_POSTS_SQL = text(
+    """
+    SELECT post.id, post.title FROM post_like JOIN post ON post.id = post_like.post_id
+    WHERE post_like.member_id = :member_id ORDER BY post.id DESC LIMIT 20
+    """
+)
+# 게시물의 댓글 좋아요 합계 (comment 복합 인덱스 -> comment_like 기본키 조인)
+POST_COMMENT_LIKES_SQL = text(
+    """
+    SELECT count(*) FROM comment JOIN comment_like ON comment_like.comment_id = comment.id
+    WHERE comment.post_id = :post_id
+    """
+)
+# 좋아요 수 다시 계산 (좋아요 테이블 전체 집계 후 조인)
+RECOUNT_SQL = text(
+    """
+    SELECT count(*) FROM post JOIN (SELECT post_id, count(*) AS likes FROM post_like GROUP BY post_id) AS c
+        ON c.post_id = post.id
+    WHERE post.like_count <> c.likes
+    """
+)
+
+
+def percentiles(samples: list[float]) -> str:
+    p99 = statistics.quantiles(samples, n=100, method="inclusive")[98] if len(samples) > 1 else samples[0]
+    return f"p50={statistics.median(samples):8.2f}ms p99={p99:8.2f}ms"
+
+
+async def report_sizes(session) -> None:
+    for table in LIKE_TABLES:
+        heap = await session.scalar(text("SELECT pg_relation_size(CAST(:table AS regclass))"), {"table": table})
+        print(f"{table:<32} {heap / 1024**2:10.1f} MB")
+        for index, size in (await session.execute(SIZE_SQL, {"table": table})).all():
+            print(f"  {index:<30} {size / 1024**2:10.1f} MB")
+
+
+async def timed(session, sql, params: list[dict]) -> list[float]:
+    samples = []
+    for param in params:
+        started = perf_counter()
+        await session.execute(sql, param)
+        samples.append((perf_counter() - started) * 1000)
+    return samples
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        await report_sizes(session)
+
+        member_ids = (
+            await session.scalars(
+                text("SELECT member_id FROM post_like TABLESAMPLE SYSTEM (1) LIMIT :n"), {"n": args.samples}
+            )
+        ).all()
+        post_ids = (
+            await session.scalars(text("SELECT id FROM post TABLESAMPLE SYSTEM (1) LIMIT :n"), {"n": args.samples})
+        ).all()
+
+        queries = {
+            "member liked posts": (MEMBER_LIKED_POSTS_SQL, [{"member_id": member_id} for member_id in member_ids]),
+            "post comment likes": (POST_COMMENT_LIKES_SQL, [{"post_id": post_id} for post_id in post_ids]),
+            "recount": (RECOUNT_SQL, [{}] * args.recount_repeat),
+        }
+        for name, (sql, params) in queries.items():
+            # 캐시 상태를 맞추기 위해 한 번씩 먼저 실행한다.
+            await timed(session, sql, params[:1])
+            print(f"{name:<20} {percentiles(await timed(session, sql, params))}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=200, help="조인 쿼리별 조회할 회원/게시물 수")
+    parser.add_argument("--recount-repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,95 @@
+"""
+목록 API 응답 직렬화 비교
+
+같은 행 목록을 FastAPI 기본 경로(response_model 검증 + jsonable_encoder + json)와
+ResponseSerializer 경로로 응답할 때의 초당 요청 수를 비교한다. DB 없이 응답 단계만 측정한다.
+
+    $ python -m benchmarks.list_serialization --rows 100 --requests 2000
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from time import perf_counter
+from types import SimpleNamespace
+from typing import List
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from member.enums import MemberRole
+from member.schemas import GetMemberResponse
+from pagination import CursorPage
+from post.schemas import GetPostListResponse
+from serializers import ResponseSerializer
+
+
+def build_app(rows: int) -> FastAPI:
+    now = datetime.now()
+    posts = {
+        "items": [
+            SimpleNamespace(id=f"{i:026d}", publisher_name=f"member{i}", title=f"title {i}", created_at=now)
+            for i in range(rows)
+        ],
+        "next_cursor": None,
+    }
+    members = [
+        SimpleNamespace(
+            id=f"{i:036d}",
+            email=f"member{i}@email.com",
+            address="address",
+            name=f"member{i}",
+            role=MemberRole.USER,
+            created_at=now,
+        )
+        for i in range(rows)
+    ]
+
+    app = FastAPI()
+    posts_serializer = ResponseSerializer(CursorPage[GetPostListResponse])
+    members_serializer = ResponseSerializer(List[GetMemberResponse])
+
+    @app.get("/default/posts", response_model=CursorPage[GetPostListResponse])
+    async def default_posts():
+        return posts
+
+    @app.get("/serializer/posts", response_model=CursorPage[GetPostListResponse])
+    async def serializer_posts():
+        return posts_serializer(posts)
+
+    @app.get("/default/members", response_model=List[GetMemberResponse])
+    async def default_members():
+        return members
+
+    @app.get("/serializer/members", response_model=List[GetMemberResponse])
+    async def serializer_members():
+        return members_serializer(members)
+
+    return app
+
+
+async def measure(client: AsyncClient, path: str, requests: int) -> float:
+    started = perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return requests / (perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = build_app(args.rows)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://benchmark") as client:
+        for resource in ("posts", "members"):
+            default = await measure(client, f"/default/{resource}", args.requests)
+            serializer = await measure(client, f"/serializer/{resource}", args.requests)
+            print(
+                f"{resource:<8} rows={args.rows:<5} default={default:8.1f} req/s "
+                f"serializer={serializer:8.1f} req/s ({serializer / default:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,415 @@
+"""
+부하 테스트 및 지연 시간 벤치마크
+
+로컬 PostgreSQL/Redis 에 회원, 게시물, 댓글, 좋아요를 원하는 규모로 채우고,
+동시 비동기 클라이언트로 모든 라우터(auth, member, post, comment)를 호출해
+라우트별 처리량과 p50/p95/p99 지연 시간을 JSON 으로 저장한다.
+이전 결과와 비교해 기준치 이상 느려진 라우트가 있으면 종료 코드 1 을 반환한다.
+
+    $ python -m benchmarks.load_test seed --members 10000 --posts 100000 --comments 500000 --likes 1000000
+    $ python -m benchmarks.load_test run --concurrency 50 --duration 60 --output results.json
+    $ python -m benchmarks.load_test compare baseline.json results.json --threshold 0.1
+    $ python -m benchmarks.load_test cleanup
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+from collections import defaultdict
+from datetime import datetime
+from time import perf_counter
+from uuid import UUID, uuid4
+
+import httpx
+from sqlalchemy import text
+from ulid import ULID
+
+from auth.service import hash_password
+from database import AsyncSessionLocal, engine
+from redis_client import redis_client
+
+EMAIL_DOMAIN = "load-test.com"
+PASSWORD = "password"
+ADMIN_EMAIL = f"admin@{EMAIL_DOMAIN}"
+SEED_KEY = "load_test:seed"
+SEED_BATCH_SIZE = 100_000
+
+# 시드 데이터 식별자는 순번으로 계산할 수 있도록 만든다. (uuid 앞 16자리 + 순번 16진수 16자리)
+POST_PREFIX = "0000000000000000"
+COMMENT_PREFIX = "0000000000000001"
+ID_DIGITS = 16
+MIN_SEQ, MAX_SEQ = "0" * ID_DIGITS, "f" * ID_DIGITS
+
+LOAD_MEMBERS = f"SELECT id FROM member WHERE email LIKE '%@{EMAIL_DOMAIN}'"
+LOAD_POSTS = f"SELECT id FROM post WHERE member_id IN ({LOAD_MEMBERS})"
+LOAD_COMMENTS = f"SELECT id FROM comment WHERE member_id IN ({LOAD_MEMBERS}) OR post_id IN ({LOAD_POSTS})"
+
+SEED_MEMBERS_SQL = f"""
+    INSERT INTO member (id, email, password, address, name, role, created_at)
+    SELECT md5('load-member-' || i)::uuid, 'member' || i || '@{EMAIL_DOMAIN}', :password, 'address', 'member' || i, 'USER', now()
+    FROM generate_series(:start, :stop) AS i
+    ON CONFLICT DO NOTHING
+"""
+SEED_POSTS_SQL = f"""
+    INSERT INTO post (id, member_id, title, content, like_count, created_at, updated_at)
+    SELECT ('{POST_PREFIX}' || lpad(to_hex(i), {ID_DIGITS}, '0'))::uuid, md5('load-member-' || (1 + i % :members))::uuid,
+           'post title ' || i, repeat('post content ' || i || ' ', 20), 0, now(), now()
+    FROM generate_series(:start, :stop) AS i
+    ON CONFLICT DO NOTHING
+"""
+SEED_COMMENTS_SQL = f"""
+    INSERT INTO comment (id, member_id, post_id, content, like_count, created_at, updated_at)
+    SELECT ('{COMMENT_PREFIX}' || lpad(to_hex(i), {ID_DIGITS}, '0'))::uuid, md5('load-member-' || (1 + i % :members))::uuid,
+           ('{POST_PREFIX}' || lpad(to_hex(1 + i % :posts), {ID_DIGITS}, '0'))::uuid, 'comment content ' || i, 0, now(), now()
+    FROM generate_series(:start, :stop) AS i
+    ON CONFLICT DO NOTHING
+"""
+SEED_POST_LIKES_SQL = f"""
+    INSERT INTO post_like (post_id, member_id)
+    SELECT ('{POST_PREFIX}' || lpad(to_hex((1 + floor(random() * :posts))::int), {ID_DIGITS}, '0'))::uuid,
+           md5('load-member-' || (1 + floor(random() * :members))::int)::uuid
+    FROM generate_series(:start, :stop)
+    ON CONFLICT DO NOTHING
+"""
+SEED_COMMENT_LIKES_SQL = f"""
+    INSERT INTO comment_like (comment_id, member_id)
+    SELECT ('{COMMENT_PREFIX}' || lpad(to_hex((1 + floor(random() * :comments))::int), {ID_DIGITS}, '0'))::uuid,
+           md5('load-member-' || (1 + floor(random() * :members))::int)::uuid
+    FROM generate_series(:start, :stop)
+    ON CONFLICT DO NOTHING
+"""
+RECOUNT_SQL = [
+    f"""UPDATE post SET like_count = c.count FROM (SELECT post_id, count(*) FROM post_like GROUP BY post_id) AS c
+        WHERE post.id = c.post_id AND post.id BETWEEN '{POST_PREFIX}{MIN_SEQ}' AND '{POST_PREFIX}{MAX_SEQ}'""",
+    f"""UPDATE comment SET like_count = c.count FROM (SELECT comment_id, count(*) FROM comment_like GROUP BY comment_id) AS c
+        WHERE comment.id = c.comment_id AND comment.id BETWEEN '{COMMENT_PREFIX}{MIN_SEQ}' AND '{COMMENT_PREFIX}{MAX_SEQ}'""",
+]
+CLEANUP_SQL = [
+    f"DELETE FROM comment_like WHERE member_id IN ({LOAD_MEMBERS}) OR comment_id IN ({LOAD_COMMENTS})",
+    f"DELETE FROM comment WHERE id IN ({LOAD_COMMENTS})",
+    f"DELETE FROM post_like WHERE member_id IN ({LOAD_MEMBERS}) OR post_id IN ({LOAD_POSTS})",
+    f"DELETE FROM post WHERE id IN ({LOAD_POSTS})",
+    f"DELETE FROM member WHERE id IN ({LOAD_MEMBERS})",
+]
+
+
+def seeded_id(prefix: str, i: int) -> str:
+    """시드 SQL 이 만든 i 번째 게시물/댓글의 id (ULID 문자열)"""
+    return str(ULID.from_uuid(UUID(hex=f"{prefix}{i:0{ID_DIGITS}x}")))
+
+
+async def _seed_in_batches(session, sql: str, total: int, params: dict, name: str) -> None:
+    for start in range(1, total + 1, SEED_BATCH_SIZE):
+        stop = min(start + SEED_BATCH_SIZE - 1, total)
+        await session.execute(text(sql), {**params, "start": start, "stop": stop})
+        await session.commit()
+        print(f"{name}: {stop}/{total}")
+
+
+async def seed(args: argparse.Namespace) -> None:
+    """회원/게시물/댓글/좋아요 시드 데이터 생성 및 Redis 초기화"""
+    password = await hash_password(PASSWORD)
+    volumes = {"members": args.members, "posts": args.posts, "comments": args.comments}
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            text(
+                "INSERT INTO member (id, email, password, address, name, role, created_at) "
+                "VALUES (md5('load-admin')::uuid, :email, :password, 'address', 'admin', 'ADMIN', now()) "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"email": ADMIN_EMAIL, "password": password},
+        )
+        await _seed_in_batches(session, SEED_MEMBERS_SQL, args.members, {"password": password}, "members")
+        await _seed_in_batches(session, SEED_POSTS_SQL, args.posts, volumes, "posts")
+        await _seed_in_batches(session, SEED_COMMENTS_SQL, args.comments, volumes, "comments")
+        await _seed_in_batches(session, SEED_POST_LIKES_SQL, args.likes // 2, volumes, "post likes")
+        await _seed_in_batches(session, SEED_COMMENT_LIKES_SQL, args.likes - args.likes // 2, volumes, "comment likes")
+        for sql in RECOUNT_SQL:
+            await session.execute(text(sql))
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+
+    # 이전 실행의 캐시와 좋아요 버퍼가 결과에 영향을 주지 않도록 비운다.
+    for pattern in ("cache:post:*", "like_delta:*"):
+        async for key in redis_client.scan_iter(pattern):
+            await redis_client.delete(key)
+    await redis_client.hset(SEED_KEY, mapping=volumes)
+
+
+async def cleanup(args: argparse.Namespace) -> None:
+    """시드 데이터와 부하 테스트 중 생성된 데이터 삭제"""
+    async with AsyncSessionLocal() as session:
+        for sql in CLEANUP_SQL:
+            await session.execute(text(sql))
+        await session.commit()
+    await redis_client.delete(SEED_KEY)
+
+
+class LoadTest:
+    """
+    부하 테스트 실행기
+
+    각 가상 사용자는 시드 회원으로 로그인한 뒤 가중치에 따라 시나리오를 골라 반복 실행한다.
+    지연 시간은 라우트 템플릿(예: GET /v1/post/{id}) 단위로 모은다.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, volumes: dict):
+        self.client = client
+        self.members = volumes["members"]
+        self.posts = volumes["posts"]
+        self.comments = volumes["comments"]
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.scenarios = [
+            (self.get_post, 20),
+            (self.get_posts, 10),
+            (self.get_post_comments, 10),
+            (self.get_member, 5),
+            (self.like_post, 5),
+            (self.like_comment, 3),
+            (self.search_posts, 3),
+            (self.post_lifecycle, 2),
+            (self.comment_lifecycle, 2),
+            (self.update_member, 1),
+            (self.get_members, 1),
+            (self.member_lifecycle, 1),
+            (self.relogin, 1),
+        ]
+
+    async def request(self, route: str, method: str, url: str, token: str | None = None, **kwargs) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        started = perf_counter()
+        response = await self.client.request(method, url, headers=headers, **kwargs)
+        self.latencies[route].append((perf_counter() - started) * 1000)
+        self.statuses[route][response.status_code] += 1
+        return response
+
+    async def login(self, email: str) -> str | None:
+        response = await self.request(
+            "POST /v1/login", "POST", "/v1/login", data={"username": email, "password": PASSWORD}
+        )
+        return response.json().get("token") if response.status_code == 200 else None
+
+    def random_post_id(self) -> str:
+        return seeded_id(POST_PREFIX, random.randint(1, self.posts))
+
+    def random_comment_id(self) -> str:
+        return seeded_id(COMMENT_PREFIX, random.randint(1, self.comments))
+
+    async def get_post(self, user: dict) -> None:
+        await self.request("GET /v1/post/{id}", "GET", f"/v1/post/{self.random_post_id()}")
+
+    async def get_posts(self, user: dict) -> None:
+        params = {"limit": 20, "order": random.choice(["desc", "asc"])}
+        if random.random() < 0.5:
+            params["after"] = self.random_post_id()
+        await self.request("GET /v1/posts", "GET", "/v1/posts", params=params)
+
+    async def search_posts(self, user: dict) -> None:
+        q = f"post {random.randint(1, self.posts)}"
+        await self.request("GET /v1/posts/search", "GET", "/v1/posts/search", params={"q": q})
+
+    async def get_post_comments(self, user: dict) -> None:
+        await self.request("GET /v1/post/{id}/comments", "GET", f"/v1/post/{self.random_post_id()}/comments")
+
+    async def get_member(self, user: dict) -> None:
+        await self.request("GET /v1/member", "GET", "/v1/member", user["token"])
+
+    async def get_members(self, user: dict) -> None:
+        await self.request("GET /v1/members", "GET", "/v1/members", user["admin_token"])
+
+    async def update_member(self, user: dict) -> None:
+        body = {"email": user["email"], "address": f"address {random.random()}", "name": user["name"]}
+        await self.request("PATCH /v1/member", "PATCH", "/v1/member", user["token"], json=body)
+
+    async def like_post(self, user: dict) -> None:
+        await self.request("POST /v1/post/{id}/like", "POST", f"/v1/post/{self.random_post_id()}/like", user["token"])
+
+    async def like_comment(self, user: dict) -> None:
+        comment_id = self.random_comment_id()
+        await self.request("POST /v1/comment/{id}/like", "POST", f"/v1/comment/{comment_id}/like", user["token"])
+
+    async def post_lifecycle(self, user: dict) -> None:
+        body = {"title": "load test", "content": "load test content"}
+        response = await self.request("POST /v1/post", "POST", "/v1/post", user["token"], json=body)
+        if response.status_code != 201:
+            return
+        post_id = response.json()["id"]
+        await self.request("PUT /v1/post/{id}", "PUT", f"/v1/post/{post_id}", user["token"], json=body)
+        await self.request("DELETE /v1/post/{id}", "DELETE", f"/v1/post/{post_id}", user["token"])
+
+    async def comment_lifecycle(self, user: dict) -> None:
+        body = {"post_id": self.random_post_id(), "content": "load test comment"}
+        response = await self.request("POST /v1/comment", "POST", "/v1/comment", user["token"], json=body)
+        if response.status_code != 201:
+            return
+        comment_id = response.json()["id"]
+        await self.request(
+            "PUT /v1/comment/{id}", "PUT", f"/v1/comment/{comment_id}", user["token"], json={"content": "updated"}
+        )
+        await self.request("DELETE /v1/comment/{id}", "DELETE", f"/v1/comment/{comment_id}", user["token"])
+
+    async def member_lifecycle(self, user: dict) -> None:
+        email = f"join-{uuid4().hex}@{EMAIL_DOMAIN}"
+        body = {"email": email, "password": PASSWORD, "address": "address", "name": "join"}
+        response = await self.request("POST /v1/join", "POST", "/v1/join", json=body)
+        if response.status_code != 201:
+            return
+        token = await self.login(email)
+        if token:
+            await self.request("DELETE /v1/member", "DELETE", "/v1/member", token)
+
+    async def relogin(self, user: dict) -> None:
+        await self.request("POST /v1/logout", "POST", "/v1/logout", user["token"])
+        user["token"] = await self.login(user["email"]) or user["token"]
+
+    async def virtual_user(self, deadline: float, admin_token: str) -> None:
+        i = random.randint(1, self.members)
+        user = {"email": f"member{i}@{EMAIL_DOMAIN}", "name": f"member{i}", "admin_token": admin_token}
+        user["token"] = await self.login(user["email"])
+        if not user["token"]:
+            return
+
+        scenarios, weights = zip(*self.scenarios)
+        while perf_counter() < deadline:
+            await random.choices(scenarios, weights)[0](user)
+
+    async def run(self, concurrency: int, duration: float) -> float:
+        admin_token = await self.login(ADMIN_EMAIL)
+        if not admin_token:
+            raise SystemExit("관리자 로그인 실패: seed 를 먼저 실행하세요.")
+
+        self.latencies.clear()
+        self.statuses.clear()
+        started = perf_counter()
+        await asyncio.gather(*[self.virtual_user(started + duration, admin_token) for _ in range(concurrency)])
+        return perf_counter() - started
+
+    def summary(self, elapsed: float) -> dict:
+        routes = {}
+        for route, samples in sorted(self.latencies.items()):
+            quantiles = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+            statuses = self.statuses[route]
+            routes[route] = {
+                "requests": len(samples),
+                "errors": sum(count for status_code, count in statuses.items() if status_code >= 500),
+                "statuses": {str(status_code): count for status_code, count in sorted(statuses.items())},
+                "throughput": len(samples) / elapsed,
+                "p50": quantiles[49],
+                "p95": quantiles[94],
+                "p99": quantiles[98],
+            }
+        return routes
+
+
+def print_summary(routes: dict) -> None:
+    print(f"{'route':<32} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for route, stats in routes.items():
+        print(
+            f"{route:<32} {stats['requests']:>9} {stats['errors']:>7} {stats['throughput']:>9.1f} "
+            f"{stats['p50']:>7.1f}ms {stats['p95']:>7.1f}ms {stats['p99']:>7.1f}ms"
+        )
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    이전 결과 대비 성능 저하 라우트 목록
+
+    p95/p99 가 threshold 비율 이상 늘었거나 처리량이 threshold 비율 이상 줄면 저하로 본다.
+    """
+    regressions = []
+    for route, stats in current["routes"].items():
+        base = baseline["routes"].get(route)
+        if base is None:
+            continue
+        for metric in ("p95", "p99"):
+            if stats[metric] > base[metric] * (1 + threshold):
+                regressions.append(f"{route} {metric}: {base[metric]:.1f}ms -> {stats[metric]:.1f}ms")
+        if stats["throughput"] < base["throughput"] * (1 - threshold):
+            regressions.append(f"{route} throughput: {base['throughput']:.1f} -> {stats['throughput']:.1f} req/s")
+    return regressions
+
+
+def report_regressions(baseline: dict, current: dict, threshold: float) -> None:
+    regressions = compare(baseline, current, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+async def run(args: argparse.Namespace) -> None:
+    volumes = {key.decode(): int(value) for key, value in (await redis_client.hgetall(SEED_KEY)).items()}
+    if not volumes:
+        raise SystemExit("시드 정보가 없습니다: seed 를 먼저 실행하세요.")
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        load_test = LoadTest(client, volumes)
+        if args.warmup:
+            await load_test.run(args.concurrency, args.warmup)
+        elapsed = await load_test.run(args.concurrency, args.duration)
+
+    result = {
+        "meta": {
+            "started_at": datetime.now().isoformat(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration": elapsed,
+            "volumes": volumes,
+        },
+        "routes": load_test.summary(elapsed),
+    }
+    print_summary(result["routes"])
+
+    with open(args.output, "w") as f:
+        json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            report_regressions(json.load(f), result, args.threshold)
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        if args.command == "compare":
+            with open(args.baseline) as f, open(args.current) as g:
+                report_regressions(json.load(f), json.load(g), args.threshold)
+        else:
+            await {"seed": seed, "run": run, "cleanup": cleanup}[args.command](args)
+    finally:
+        await engine.dispose()
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="시드 데이터 생성")
+    seed_parser.add_argument("--members", type=int, default=10_000)
+    seed_parser.add_argument("--posts", type=int, default=100_000)
+    seed_parser.add_argument("--comments", type=int, default=500_000)
+    seed_parser.add_argument("--likes", type=int, default=1_000_000)
+
+    run_parser = commands.add_parser("run", help="부하 테스트 실행")
+    run_parser.add_argument("--base-url", default="http://localhost:8000")
+    run_parser.add_argument("--concurrency", type=int, default=50)
+    run_parser.add_argument("--duration", type=float, default=60)
+    run_parser.add_argument("--warmup", type=float, default=5, help="측정 전 예열 시간(초)")
+    run_parser.add_argument("--output", default="load_test_result.json")
+    run_parser.add_argument("--baseline", help="비교할 이전 결과 파일")
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+
+    compare_parser = commands.add_parser("compare", help="두 결과 파일 비교")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    commands.add_parser("cleanup", help="시드 데이터 삭제")
+
+    asyncio.run(main(parser.parse_args()))
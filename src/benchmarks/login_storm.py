@@ -0,0 +1,72 @@
+"""
+로그인 폭주 중 다른 API 지연 시간 측정
+
+로그인(bcrypt 검증) 요청을 동시에 대량으로 보내는 동안 관련 없는 API 의 p50/p99 지연 시간이
+로그인 요청이 없을 때와 비교해 유지되는지 확인한다.
+
+    $ python -m benchmarks.login_storm --base-url http://localhost:8000 --email admin@email.com --password password
+"""
+
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+import httpx
+
+
+def percentile(samples: list[float], p: float) -> float:
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(p) - 1] if len(samples) > 1 else samples[0]
+
+
+async def probe(client: httpx.AsyncClient, path: str, duration: float) -> list[float]:
+    """duration 초 동안 path 를 순차 호출하며 지연 시간(ms) 수집"""
+    samples = []
+    deadline = perf_counter() + duration
+    while perf_counter() < deadline:
+        started = perf_counter()
+        await client.get(path)
+        samples.append((perf_counter() - started) * 1000)
+    return samples
+
+
+async def login_storm(client: httpx.AsyncClient, email: str, password: str, concurrency: int, duration: float):
+    """duration 초 동안 concurrency 개의 로그인 요청을 계속 유지"""
+    deadline = perf_counter() + duration
+
+    async def worker():
+        while perf_counter() < deadline:
+            await client.post("/v1/login", data={"username": email, "password": password})
+
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+
+def report(name: str, samples: list[float]) -> None:
+    print(
+        f"{name:<12} requests={len(samples):<6} "
+        f"p50={percentile(samples, 50):.1f}ms p99={percentile(samples, 99):.1f}ms max={max(samples):.1f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency + 10)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        baseline = await probe(client, args.probe_path, args.duration)
+        storm, _ = await asyncio.gather(
+            probe(client, args.probe_path, args.duration),
+            login_storm(client, args.email, args.password, args.concurrency, args.duration),
+        )
+
+    report("baseline", baseline)
+    report("login storm", storm)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--probe-path", default="/v1/posts?limit=1")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    asyncio.run(main(parser.parse_args()))
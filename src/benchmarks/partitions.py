@@ -0,0 +1,160 @@
+"""
+게시물 파티션 벤치마크
+
+월별로 게시물을 채워 가며(generate_series) 단계마다 단건 INSERT 와 목록 범위 탐색(첫 페이지, 중간 커서 페이지)의
+p50/p99 지연 시간을 측정한다. 파티션 테이블에서는 데이터가 늘어도 지연 시간이 일정해야 한다.
+스키마는 미리 최신 상태(partitions.py)여야 한다.
+
+    $ python -m benchmarks.partitions --months 12 --posts-per-month 500000
+    $ python -m benchmarks.partitions --cleanup
+"""
+
+import argparse
+import asyncio
+import statistics
+from datetime import date, datetime
+from time import perf_counter
+from uuid import UUID
+
+from sqlalchemy import delete, text
+from ulid import ULID
+
+from database import AsyncSessionLocal, engine
+from member.enums import MemberRole
+from models import Member, Post
+from pagination import DEFAULT_PAGE_SIZE, SortOrder
+from partitions import add_months, create_partitions, month_boundary
+from post.schemas import CreatePostRequest
+from post.service import create, get_all
+
+BENCH_MEMBER_ID = "00000000-0000-0000-0000-0000000a1b2c"
+SEED_BATCH_SIZE = 100_000
+
+# 해당 월의 ULID 시간 부분(uuid 앞 12자리) + 일련번호로 id 생성
+SEED_SQL = text(
+    """
+    INSERT INTO post (id, member_id, title, content, like_count, created_at, updated_at)
+    SELECT (:prefix || lpad(to_hex(i), 20, '0'))::uuid, :member_id, 'partition bench', 'partition bench', 0, :created_at, :created_at
+    FROM generate_series(:start, :stop) AS i
+    """
+)
+
+
+async def ensure_member() -> None:
+    async with AsyncSessionLocal() as session:
+        if not await session.get(Member, BENCH_MEMBER_ID):
+            session.add(
+                Member(
+                    id=BENCH_MEMBER_ID,
+                    email="partition-bench@email.com",
+                    password="",
+                    address="",
+                    name="partition-bench",
+                    role=MemberRole.USER,
+                    created_at=datetime.now(),
+                )
+            )
+            await session.commit()
+
+
+def _time_prefix(month: date) -> str:
+    return ULID.from_str(month_boundary(month)).hex[:12]
+
+
+def seeded_id(month: date, i: int) -> str:
+    """SEED_SQL 이 month 에 i 번째로 만든 게시물의 id"""
+    return str(ULID.from_uuid(UUID(hex=_time_prefix(month) + format(i, "020x"))))
+
+
+async def seed_month(month: date, posts: int) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(create_partitions, "post", month, 1)
+
+    prefix = _time_prefix(month)
+    async with AsyncSessionLocal() as session:
+        for start in range(1, posts + 1, SEED_BATCH_SIZE):
+            stop = min(start + SEED_BATCH_SIZE - 1, posts)
+            await session.execute(
+                SEED_SQL,
+                {
+                    "prefix": prefix,
+                    "member_id": BENCH_MEMBER_ID,
+                    "created_at": datetime(month.year, month.month, 1),
+                    "start": start,
+                    "stop": stop,
+                },
+            )
+            await session.commit()
+        await session.execute(text("ANALYZE post"))
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(Post).where(Post.member_id == BENCH_MEMBER_ID))
+        await session.execute(delete(Member).where(Member.id == BENCH_MEMBER_ID))
+        await session.commit()
+
+
+def percentiles(samples: list[float]) -> str:
+    p99 = statistics.quantiles(samples, n=100, method="inclusive")[98] if len(samples) > 1 else samples[0]
+    return f"p50={statistics.median(samples):6.2f}ms p99={p99:6.2f}ms"
+
+
+async def measure(repeat: int, middle_cursor: str) -> tuple[list[float], list[float], list[float]]:
+    inserts, first_pages, middle_pages = [], [], []
+    request = CreatePostRequest(publisher_id=BENCH_MEMBER_ID, title="partition bench", content="partition bench")
+
+    async with AsyncSessionLocal() as session:
+        for _ in range(repeat):
+            started = perf_counter()
+            await create(session, request)
+            await session.commit()
+            inserts.append((perf_counter() - started) * 1000)
+
+            started = perf_counter()
+            await get_all(session, None, DEFAULT_PAGE_SIZE, SortOrder.DESC)
+            first_pages.append((perf_counter() - started) * 1000)
+
+            started = perf_counter()
+            await get_all(session, middle_cursor, DEFAULT_PAGE_SIZE, SortOrder.DESC)
+            middle_pages.append((perf_counter() - started) * 1000)
+
+    return inserts, first_pages, middle_pages
+
+
+async def run(months: int, posts_per_month: int, repeat: int) -> None:
+    await ensure_member()
+    this_month = date.today().replace(day=1)
+    first_month = add_months(this_month, -months)
+
+    for step in range(months):
+        month = add_months(first_month, step)
+        await seed_month(month, posts_per_month)
+
+        # 채운 범위의 가운데 월 중간 지점에서 시작하는 커서
+        middle_month = add_months(first_month, step // 2)
+        middle_cursor = seeded_id(middle_month, posts_per_month // 2)
+
+        inserts, first_pages, middle_pages = await measure(repeat, middle_cursor)
+        total = posts_per_month * (step + 1)
+        print(
+            f"{total:>12,} posts | insert {percentiles(inserts)} | first page {percentiles(first_pages)} "
+            f"| cursor page {percentiles(middle_pages)}"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.cleanup:
+        await cleanup()
+    else:
+        await run(args.months, args.posts_per_month, args.repeat)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--posts-per-month", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--cleanup", action="store_true", help="벤치마크용 회원과 게시물 삭제")
+    asyncio.run(main(parser.parse_args()))
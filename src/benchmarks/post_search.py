@@ -0,0 +1,128 @@
+"""
+게시물 전문 검색 벤치마크
+
+로컬 PostgreSQL 에 게시물을 대량으로 채운 뒤(generate_series), 검색어별 첫 페이지와
+커서로 넘긴 이후 페이지의 p50/p99 지연 시간을 측정한다. 스키마는 미리 최신 상태여야 한다.
+
+    $ python -m benchmarks.post_search --posts 2000000 --seed
+    $ python -m benchmarks.post_search --cleanup
+"""
+
+import argparse
+import asyncio
+import statistics
+from datetime import datetime
+from time import perf_counter
+
+from sqlalchemy import delete, text
+
+from database import AsyncSessionLocal, engine
+from member.enums import MemberRole
+from models import Member, Post
+from post.service import search
+
+BENCH_MEMBER_ID = "00000000-0000-0000-0000-00000000be0c"
+# 벤치마크 게시물 id(uuid) 의 앞 8자리
+BENCH_POST_PREFIX = "0000be0c"
+SEED_BATCH_SIZE = 100_000
+WORDS = [
+    "fastapi", "postgres", "redis", "celery", "docker", "kubernetes", "python", "async", "index", "cache",
+    "query", "latency", "backend", "server", "deploy", "migration", "search", "vector", "queue", "worker",
+    "benchmark", "profile", "memory", "thread", "pool", "cursor", "partition", "replica", "token", "session",
+]  # fmt: skip
+QUERIES = ["fastapi", "postgres index", "redis cache latency", '"async worker"', "docker -kubernetes"]
+
+SEED_SQL = text(
+    """
+    INSERT INTO post (id, member_id, title, content, like_count, created_at, updated_at)
+    SELECT
+        (:prefix || lpad(to_hex(i), 24, '0'))::uuid,
+        :member_id,
+        (SELECT string_agg(w[1 + floor(random() * array_length(w, 1))::int], ' ') FROM generate_series(1, 6) WHERE i > 0),
+        (SELECT string_agg(w[1 + floor(random() * array_length(w, 1))::int], ' ') FROM generate_series(1, 60) WHERE i > 0),
+        0,
+        now(),
+        now()
+    FROM generate_series(:start, :stop) AS i, (SELECT CAST(:words AS text[]) AS w) AS vocabulary
+    """
+)
+
+
+async def seed(posts: int) -> None:
+    async with AsyncSessionLocal() as session:
+        if not await session.get(Member, BENCH_MEMBER_ID):
+            session.add(
+                Member(
+                    id=BENCH_MEMBER_ID,
+                    email="search-bench@email.com",
+                    password="",
+                    address="",
+                    name="search-bench",
+                    role=MemberRole.USER,
+                    created_at=datetime.now(),
+                )
+            )
+            await session.commit()
+
+        for start in range(1, posts + 1, SEED_BATCH_SIZE):
+            stop = min(start + SEED_BATCH_SIZE - 1, posts)
+            await session.execute(
+                SEED_SQL,
+                {"prefix": BENCH_POST_PREFIX, "member_id": BENCH_MEMBER_ID, "start": start, "stop": stop, "words": WORDS},
+            )
+            await session.commit()
+            print(f"seeded {stop}/{posts}")
+
+        await session.execute(text("ANALYZE post"))
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(Post).where(Post.member_id == BENCH_MEMBER_ID))
+        await session.execute(delete(Member).where(Member.id == BENCH_MEMBER_ID))
+        await session.commit()
+
+
+def report(name: str, samples: list[float]) -> None:
+    p99 = statistics.quantiles(samples, n=100, method="inclusive")[98] if len(samples) > 1 else samples[0]
+    print(f"{name:<28} p50={statistics.median(samples):7.1f}ms p99={p99:7.1f}ms")
+
+
+async def run(repeat: int, pages: int, limit: int) -> None:
+    async with AsyncSessionLocal() as session:
+        for q in QUERIES:
+            first_page, later_pages = [], []
+            for _ in range(repeat):
+                after = None
+                for page in range(pages):
+                    started = perf_counter()
+                    result = await search(session, q, after, limit)
+                    (first_page if page == 0 else later_pages).append((perf_counter() - started) * 1000)
+                    after = result["next_cursor"]
+                    if after is None:
+                        break
+
+            report(f"{q} (page 1)", first_page)
+            if later_pages:
+                report(f"{q} (page 2-{pages})", later_pages)
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.cleanup:
+        await cleanup()
+    else:
+        if args.seed:
+            await seed(args.posts)
+        await run(args.repeat, args.pages, args.limit)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=2_000_000)
+    parser.add_argument("--seed", action="store_true", help="게시물을 채운 뒤 측정")
+    parser.add_argument("--cleanup", action="store_true", help="벤치마크용 회원과 게시물 삭제")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,113 @@
+"""
+조회 전용 세션 벤치마크
+
+조회 엔드포인트의 서비스 함수를 기존 세션(트랜잭션 + 커밋)과 조회 전용 세션(AUTOCOMMIT)으로 각각 실행해
+요청당 DB 왕복 횟수와 p50/p99 지연 시간을 비교한다. 왕복 횟수는 쿼리 수(track_queries)와
+asyncpg 가 보낸 트랜잭션 명령(BEGIN/COMMIT/ROLLBACK) 수의 합이다.
+DB 에 게시물, 댓글, 회원이 하나 이상 있어야 한다.
+
+    $ python -m benchmarks.read_session --repeat 1000
+"""
+
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+from fastapi import HTTPException
+from sqlalchemy import event, select
+
+from comment.service import get_all_filter_by_post_id
+from database import AsyncSessionLocal, ReadSessionLocal, engine
+from member.service import get as get_member
+from models import Member, Post
+from pagination import DEFAULT_PAGE_SIZE, SortOrder
+from post.service import get_all
+from query_stats import track_queries
+
+transaction_commands = 0
+
+
+def _count_transaction_command(record) -> None:
+    # 준비된 문장 실행은 쿼리 로거에 기록되지 않으므로 인자 없는 execute(BEGIN/COMMIT 등)만 기록된다.
+    global transaction_commands
+    transaction_commands += 1
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _add_query_logger(dbapi_connection, connection_record):
+    dbapi_connection.driver_connection.add_query_logger(_count_transaction_command)
+
+
+async def request_with_session(handler) -> None:
+    """get_db_session 과 같은 방식: 트랜잭션 안에서 조회 후 커밋"""
+    async with AsyncSessionLocal() as session:
+        try:
+            await handler(session)
+            await session.commit()
+        except HTTPException:
+            await session.rollback()
+
+
+async def request_with_read_session(handler) -> None:
+    """get_read_db_session 과 같은 방식: AUTOCOMMIT, 커밋 없음"""
+    async with ReadSessionLocal() as session:
+        try:
+            await handler(session)
+        except HTTPException:
+            pass
+
+
+def report(name: str, samples: list[float], trips: int) -> None:
+    p99 = statistics.quantiles(samples, n=100, method="inclusive")[98] if len(samples) > 1 else samples[0]
+    print(
+        f"{name:<42} round trips/req={trips / len(samples):4.1f} "
+        f"p50={statistics.median(samples):6.2f}ms p99={p99:6.2f}ms"
+    )
+
+
+async def run(repeat: int) -> None:
+    global transaction_commands
+
+    async with ReadSessionLocal() as session:
+        post_id = await session.scalar(select(Post.id).limit(1))
+        member_id = await session.scalar(select(Member.id).limit(1))
+
+    handlers = {
+        "get_posts": lambda session: get_all(session, None, DEFAULT_PAGE_SIZE, SortOrder.DESC),
+        "get_post_comments": lambda session: get_all_filter_by_post_id(
+            session, post_id, None, DEFAULT_PAGE_SIZE, SortOrder.ASC
+        ),
+        "get_member": lambda session: get_member(session, member_id),
+        "get_member (404)": lambda session: get_member(session, "00000000-0000-0000-0000-000000000000"),
+        # 쿼리 전에 끝나는 요청 (검증 실패, 캐시 적중 등)
+        "no query": lambda session: asyncio.sleep(0),
+    }
+
+    for name, handler in handlers.items():
+        for mode, request in (("session", request_with_session), ("read session", request_with_read_session)):
+            # 준비된 문장 캐시를 채운 뒤 측정
+            for _ in range(10):
+                await request(handler)
+
+            transaction_commands = 0
+            samples = []
+            with track_queries() as queries:
+                for _ in range(repeat):
+                    started = perf_counter()
+                    await request(handler)
+                    samples.append((perf_counter() - started) * 1000)
+            # 쿼리 로거 콜백은 다음 루프 순회에서 호출된다.
+            await asyncio.sleep(0)
+            report(f"{name} [{mode}]", samples, queries.count + transaction_commands)
+
+
+async def main(args: argparse.Namespace) -> None:
+    await run(args.repeat)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,260 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable
+
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """
+    프로세스 내 LRU 캐시
+
+    항목 수가 maxsize 를 넘으면 가장 오래 사용하지 않은 항목을 제거하고,
+    ttl 초(항목별로 지정 가능)가 지난 항목은 조회 시점에 만료 처리한다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        self._data[key] = (monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """캐시 적중/미스/제거 횟수"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "size": len(self),
+        }
+
+
+def _cache_key(namespace: str, key: str) -> str:
+    return f"cache:{namespace}:{key}"
+
+
+def _generation_key(namespace: str, key: str) -> str:
+    return f"cache:{namespace}:{key}:generation"
+
+
+def _invalidation_channel(namespace: str) -> str:
+    return f"cache:invalidate:{namespace}"
+
+
+# 원본을 읽기 전의 세대(generation)가 그대로일 때만 저장 (그 사이 무효화되었으면 읽은 값이 오래된 값일 수 있다)
+FILL_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[2] then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+
+def _queue_invalidation(pipe, namespace: str, keys: list[str], generation_ttl: int) -> None:
+    """
+    세대를 올린 뒤 항목을 지우고 다른 워커에 무효화 전파
+
+    세대 키는 원본을 읽는 데 걸리는 시간보다 오래(generation_ttl) 남아 있어야 진행 중인 채우기를 거절할 수 있다.
+    """
+    for key in keys:
+        pipe.incr(_generation_key(namespace, key))
+        pipe.expire(_generation_key(namespace, key), generation_ttl)
+    pipe.delete(*[_cache_key(namespace, key) for key in keys])
+    for key in keys:
+        pipe.publish(_invalidation_channel(namespace), key)
+
+
+def invalidate_many(redis: SyncRedis, namespace: str, keys: list[str], generation_ttl: int = 3600) -> None:
+    """동기 코드(Celery 워커)에서 TwoTierCache 항목 일괄 무효화"""
+    if not keys:
+        return
+
+    with redis.pipeline(transaction=True) as pipe:
+        _queue_invalidation(pipe, namespace, keys, generation_ttl)
+        pipe.execute()
+
+
+class TwoTierCache:
+    """
+    2단계 read-through 캐시
+
+    1차: 프로세스 내 LRU, 2차: Redis.
+    무효화 시 Redis 항목을 지우고 pub/sub 로 다른 워커의 1차 캐시에도 전파한다.
+    Redis 장애 시에는 캐시를 건너뛰고 원본을 조회하도록 None 을 반환한다.
+
+    원본을 읽는 동안 무효화된 값이 다시 저장되지 않도록, 키별 세대(generation)를 무효화마다 올리고
+    lookup 이 미스 때 돌려준 세대가 그대로일 때만 set 이 저장한다.
+    1차 캐시는 프로세스가 받은 무효화 횟수(epoch)가 Redis 조회 전과 같을 때만 채운다.
+    """
+
+    def __init__(self, redis: Redis, namespace: str, maxsize: int, local_ttl: float, remote_ttl: int):
+        self.redis = redis
+        self.namespace = namespace
+        self.channel = _invalidation_channel(namespace)
+        self.local = LRUCache(maxsize, local_ttl)
+        self.remote_ttl = remote_ttl
+        self.remote_hits = 0
+        self.misses = 0
+        self._fill = redis.register_script(FILL_SCRIPT)
+        self._epoch = 0
+        self._listener: asyncio.Task | None = None
+
+    def _key(self, key: str) -> str:
+        return _cache_key(self.namespace, key)
+
+    def _set_local(self, key: str, value: bytes, epoch: int) -> None:
+        if epoch == self._epoch:
+            self.local.set(key, value)
+
+    async def lookup(self, key: str) -> tuple[bytes | None, str | None]:
+        """
+        read-through 조회
+
+        미스이면 원본을 읽기 전 시점의 세대를 함께 반환한다. 원본에서 읽은 값은 이 세대와 함께 set 에 넘긴다.
+
+        Returns:
+            tuple[bytes | None, str | None]: 캐시된 값, 미스일 때의 세대 (Redis 장애로 세대를 알 수 없으면 None)
+        """
+        value = self.local.get(key)
+        if value is not None:
+            return value, None
+
+        epoch = self._epoch
+        try:
+            value, generation = await self.redis.mget(self._key(key), _generation_key(self.namespace, key))
+        except RedisError:
+            logger.warning("cache get failed: %s", key, exc_info=True)
+            self.misses += 1
+            return None, None
+
+        if value is None:
+            self.misses += 1
+            return None, (generation or b"0").decode()
+
+        self.remote_hits += 1
+        self._set_local(key, value, epoch)
+        return value, None
+
+    async def get(self, key: str) -> bytes | None:
+        return (await self.lookup(key))[0]
+
+    async def set(self, key: str, value: bytes, generation: str | None = None) -> None:
+        """
+        캐시 저장
+
+        generation(lookup 이 반환한 세대)이 주어지면 그 뒤로 무효화되지 않았을 때만 저장한다.
+        """
+        epoch = self._epoch
+        try:
+            if generation is None:
+                await self.redis.set(self._key(key), value, ex=self.remote_ttl)
+            elif not await self._fill(
+                keys=[self._key(key), _generation_key(self.namespace, key)],
+                args=[value, generation, self.remote_ttl],
+            ):
+                return
+        except RedisError:
+            logger.warning("cache set failed: %s", key, exc_info=True)
+            if generation is not None:
+                return
+        self._set_local(key, value, epoch)
+
+    async def invalidate(self, key: str) -> None:
+        await self.invalidate_many([key])
+
+    async def invalidate_many(self, keys: list[str]) -> None:
+        """여러 항목을 한 번의 파이프라인으로 무효화"""
+        if not keys:
+            return
+
+        self._epoch += 1
+        for key in keys:
+            self.local.delete(key)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                _queue_invalidation(pipe, self.namespace, keys, self.remote_ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("cache invalidate failed: %d keys", len(keys), exc_info=True)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._epoch += 1
+                            self.local.delete(message["data"].decode())
+            except RedisError:
+                # 구독이 끊긴 동안의 무효화를 놓칠 수 있으므로 1차 캐시를 비운다.
+                logger.warning("cache invalidation listener disconnected", exc_info=True)
+                self._epoch += 1
+                self.local.clear()
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        """다른 워커의 무효화 메시지 구독 시작"""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    def stats(self) -> dict:
+        """캐시 적중/미스/제거 횟수"""
+        hits = self.local.hits + self.remote_hits
+        lookups = hits + self.misses
+        return {
+            "local_hits": self.local.hits,
+            "remote_hits": self.remote_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": self.local.evictions,
+            "size": len(self.local),
+        }
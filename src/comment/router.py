@@ -1,13 +1,16 @@
-from typing import Annotated, List
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Query, status
 
 from auth.schemas import TokenPayload
 from database import AsyncSession
-from dependencies import get_current_user, get_db_session
-from comment.service import create, get_all_filter_by_post_id, update, delete
+from dependencies import get_current_user, get_db_session, get_read_db_session
+from pagination import CursorPage, SortOrder, ULID_PATTERN, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from serializers import ResponseSerializer
+from comment.service import create, get_all_filter_by_post_id, update, update_comment_like, delete
 from comment.schemas import (
     GetCommentResponse,
+    CommentLikeResponse,
     CreateCommentRequest,
     CreateCommentResponse,
     UpdateCommentRequest,
@@ -16,6 +19,8 @@ from comment.schemas import (
 
 router = APIRouter(prefix="/v1", tags=["comments"])
 
+get_post_comments_serializer = ResponseSerializer(CursorPage[GetCommentResponse])
+
 
 @router.post("/comment", response_model=CreateCommentResponse, status_code=status.HTTP_201_CREATED)
 async def create_comment(
@@ -27,12 +32,15 @@ async def create_comment(
     return await create(db_session, create_comment_request)
 
 
-@router.get("/post/{id}/comments", response_model=List[GetCommentResponse], status_code=status.HTTP_200_OK)
+@router.get("/post/{id}/comments", response_model=CursorPage[GetCommentResponse], status_code=status.HTTP_200_OK)
 async def get_post_comments(
-    db_session: Annotated[AsyncSession, Depends(get_db_session)],
+    db_session: Annotated[AsyncSession, Depends(get_read_db_session)],
     id: str,
+    after: Annotated[str | None, Query(pattern=ULID_PATTERN)] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    order: SortOrder = SortOrder.ASC,
 ):
-    return await get_all_filter_by_post_id(db_session, id)
+    return get_post_comments_serializer(await get_all_filter_by_post_id(db_session, id, after, limit, order))
 
 
 @router.put("/comment/{id}", response_model=UpdateCommentResponse, status_code=status.HTTP_200_OK)
@@ -55,11 +63,10 @@ async def delete_comment(
     return await delete(db_session, id, current_user.sub)
 
 
-@router.post("/comment/{id}/like", status_code=status.HTTP_200_OK)
+@router.post("/comment/{id}/like", response_model=CommentLikeResponse, status_code=status.HTTP_200_OK)
 async def toggle_comment_like(
     db_session: Annotated[AsyncSession, Depends(get_db_session)],
     current_user: Annotated[TokenPayload, Depends(get_current_user)],
     id: str,
 ):
-    # return await post_service.toggle_comment_like(session, current_user.sub, comment_id)
-    pass
+    return await update_comment_like(db_session, id, current_user.sub)
@@ -38,3 +38,10 @@ class GetCommentResponse(BaseModel):
     content: str
     created_at: datetime
     updated_at: datetime
+
+
+class CommentLikeResponse(BaseModel):
+    """댓글 좋아요 응답 구조"""
+
+    liked: bool
+    like_count: int
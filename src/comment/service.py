@@ -2,73 +2,155 @@ from datetime import datetime
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.engine import ScalarResult
+from sqlalchemy import Row, insert, literal, select, update as update_stmt
 from ulid import ULID
 
+from config import get_settings
+from likes import LikeDeltaBuffer, apply_like_delta, toggle_like
+from pagination import SortOrder, apply_cursor, build_page
 from comment.schemas import CreateCommentRequest, UpdateCommentRequest
-from models import Comment, CommentLike
-
-
-async def create(db_session: AsyncSession, create_comment_request: CreateCommentRequest) -> Comment:
-    comment = Comment(
-        id=str(ULID()),
-        member_id=create_comment_request.publisher_id,
-        post_id=create_comment_request.post_id,
-        content=create_comment_request.content,
-        like_count=0,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+from models import Comment, CommentLike, Member, Post
+from partitions import partition_floor
+from redis_client import redis_client
+
+settings = get_settings()
+
+# write-behind 모드에서 댓글 좋아요 수 증감을 모아두는 버퍼
+comment_like_buffer = LikeDeltaBuffer(redis_client, "comment") if settings.LIKE_COUNT_MODE == "write_behind" else None
+
+
+async def create(db_session: AsyncSession, create_comment_request: CreateCommentRequest) -> Row:
+    """
+    댓글 생성
+
+    게시물이 있을 때만 저장하는 INSERT ... SELECT ... RETURNING 한 번으로 게시물 확인과 저장을 처리한다.
+
+    Returns:
+        Row: id
+    """
+    now = datetime.now()
+    _comment = (
+        await db_session.execute(
+            insert(Comment)
+            .from_select(
+                ["id", "member_id", "post_id", "content", "like_count", "created_at", "updated_at"],
+                select(
+                    literal(str(ULID()), Comment.id.type),
+                    literal(create_comment_request.publisher_id, Comment.member_id.type),
+                    Post.id,
+                    literal(create_comment_request.content),
+                    literal(0),
+                    literal(now),
+                    literal(now),
+                ).where(Post.id == create_comment_request.post_id, Post.deleted_at.is_(None)),
+            )
+            .returning(Comment.id)
+        )
+    ).first()
 
-    db_session.add(comment)
-    await db_session.flush()
-    await db_session.refresh(comment)
-    return comment
+    if not _comment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "게시물을 찾을 수 없습니다."}])
 
+    return _comment
 
-async def get_all_filter_by_post_id(db_session: AsyncSession, post_id: str) -> ScalarResult[Comment]:
-    return await db_session.scalars(select(Comment).where(Comment.post_id == post_id))
 
+async def get_all_filter_by_post_id(
+    db_session: AsyncSession, post_id: str, after: str | None, limit: int, order: SortOrder
+) -> dict:
+    """
+    게시물의 댓글 목록 조회
+
+    (post_id, id) 복합 인덱스를 범위 탐색하므로 정렬 없이 한 페이지를 읽는다.
+    작성자 이름은 조인으로 함께 조회한다. 삭제 표시된 게시물의 댓글과 삭제 표시된 회원의 댓글은 제외한다.
+    댓글은 게시물보다 나중에 작성되므로 게시물이 속한 월 이전의 댓글 파티션은 읽지 않는다.
+
+    Args:
+        post_id: 게시물 식별자
+        after: 이전 페이지의 next_cursor (해당 댓글 이후부터 조회)
+        limit: 페이지 크기
+        order: 정렬 순서
+
+    Returns:
+        dict: items, next_cursor
+    """
+    post_visible = (
+        select(Post.id)
+        .join(Member, Post.member_id == Member.id)
+        .where(Post.id == post_id, Post.deleted_at.is_(None), Member.deleted_at.is_(None))
+        .exists()
+    )
+    stmt = (
+        select(
+            Comment.id,
+            Member.name.label("publisher_name"),
+            Comment.content,
+            Comment.created_at,
+            Comment.updated_at,
+        )
+        .join(Member, Comment.member_id == Member.id)
+        .where(Comment.post_id == post_id, Member.deleted_at.is_(None), post_visible)
+    )
+    if (floor := partition_floor(post_id)) is not None:
+        stmt = stmt.where(Comment.id >= floor)
+    stmt = apply_cursor(stmt, Comment.id, after, limit, order)
+    rows = (await db_session.execute(stmt)).all()
+    return build_page(rows, limit)
 
-async def update(db_session: AsyncSession, id: str, update_comment_request: UpdateCommentRequest) -> Comment:
-    _comment = await db_session.scalar(select(Comment).where(Comment.id == id))
 
-    if not _comment:
+async def _raise_write_error(db_session: AsyncSession, id: str) -> None:
+    """수정할 댓글이 없을 때 없는 댓글(404)인지 권한 없음(403)인지 확인해 예외 발생"""
+    if await db_session.scalar(select(Comment.id).where(Comment.id == id)) is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "댓글을 찾을 수 없습니다."}])
 
-    if _comment.member_id != update_comment_request.publisher_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=[{"message": "댓글에 대한 권한이 없습니다."}])
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=[{"message": "댓글에 대한 권한이 없습니다."}])
 
-    for field, value in update_comment_request.model_dump(exclude_unset=True).items():
-        setattr(_comment, field, value)
-
-    await db_session.commit()
-    await db_session.refresh(_comment)
 
-    return _comment
+async def update(db_session: AsyncSession, id: str, update_comment_request: UpdateCommentRequest) -> Row:
+    """
+    댓글 수정
 
+    작성자 확인을 WHERE 조건에 넣은 UPDATE ... RETURNING 한 번으로 수정한다.
+    수정된 행이 없을 때만 원인을 확인하기 위해 추가로 조회한다.
 
-async def update_comment_like(db_session: AsyncSession, id: str, clicker_id: str):
-    _comment = await db_session.scalar(select(Comment).where(Comment.id == id))
+    Returns:
+        Row: id
+    """
+    _comment = (
+        await db_session.execute(
+            update_stmt(Comment)
+            .where(Comment.id == id, Comment.member_id == update_comment_request.publisher_id)
+            .values(**update_comment_request.model_dump(exclude_unset=True, exclude={"publisher_id"}))
+            .returning(Comment.id)
+            .execution_options(synchronize_session=False)
+        )
+    ).first()
 
     if not _comment:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "댓글을 찾을 수 없습니다."}])
+        await _raise_write_error(db_session, id)
+
+    await db_session.commit()
 
-    _comment_like = await db_session.scalar(
-        select(CommentLike).where(CommentLike.member_id == clicker_id, CommentLike.comment_id == id)
+    return _comment
+
+
+async def update_comment_like(db_session: AsyncSession, id: str, clicker_id: str) -> dict:
+    _comment_like = await toggle_like(
+        db_session,
+        Comment,
+        CommentLike,
+        CommentLike.comment_id,
+        id,
+        clicker_id,
+        update_count=comment_like_buffer is None,
     )
 
-    if _comment_like:
-        await db_session.delete(_comment_like)
-        _comment.like_count -= 1
-    else:
-        comment_like = CommentLike(comment_id=id, member_id=clicker_id)
-        db_session.add(comment_like)
-        _comment.like_count += 1
+    if not _comment_like:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "댓글을 찾을 수 없습니다."}])
 
     await db_session.commit()
 
+    return await apply_like_delta(db_session, comment_like_buffer, Comment, id, _comment_like)
+
 
 async def delete(db_session: AsyncSession, id: str, publisher_id: str):
     _comment = await db_session.scalar(select(Comment).where(Comment.id == id))
@@ -1,21 +1,113 @@
+import os
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
+    # development: 디버그 모드, 단일 워커 / production: CPU 수만큼 워커, uvloop/httptools, 시작 시 예열
+    APP_ENV: Literal["development", "production"] = "development"
+    WEB_CONCURRENCY: int = os.cpu_count() or 1
+    # 종료 시 처리 중인 요청을 기다리는 최대 시간(초)
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
+    # 시작 시 미리 만드는 Redis 커넥션 수, 캐시에 미리 올리는 최근 게시물 수
+    WARMUP_REDIS_CONNECTIONS: int = 10
+    WARMUP_POST_COUNT: int = 100
+
     POSTGRESQL_USER: str
     POSTGRESQL_PASSWORD: str
     POSTGRESQL_DB: str
     POSTGRESQL_HOST: str
     POSTGRESQL_PORT: int
 
+    # 읽기 복제본 ("host:port" 목록), 순환에서 제외하는 복제 지연(초), 지연 확인 주기(초)
+    POSTGRESQL_REPLICA_HOSTS: list[str] = []
+    REPLICA_MAX_LAG: float = 5
+    REPLICA_LAG_CHECK_INTERVAL: float = 2
+    # 쓰기 요청 후 같은 클라이언트의 읽기를 기본 DB 로 보내는 시간(초)
+    READ_YOUR_WRITES_WINDOW: int = 10
+
     SECRET_KEY: str
     ALGORITHM: str
 
     REDIS_HOST: str
     REDIS_PORT: int
 
+    POST_CACHE_SIZE: int = 10000
+    POST_CACHE_LOCAL_TTL: float = 30
+    POST_CACHE_REMOTE_TTL: int = 300
+
+    # sync: 좋아요 토글 시 like_count 즉시 반영, write_behind: Redis 에 모아 주기적으로 반영
+    LIKE_COUNT_MODE: Literal["sync", "write_behind"] = "sync"
+    LIKE_FLUSH_INTERVAL: float = 5
+    LIKE_FLUSH_BATCH_SIZE: int = 1000
+
+    # bcrypt 해싱 풀 (thread | process), 동시 실행 한도, 대기 제한 시간(초)
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 8
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = 3
+
+    # 검증된 토큰 페이로드 캐시 크기 (프로세스별)
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # 폐기 토큰 블룸 필터 (예상 최대 개수, 오탐률, 재구성 주기(초))
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_REBUILD_INTERVAL: float = 3600
+
+    # 내보내기 시 서버 측 커서에서 한 번에 읽는 행 수
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    # 대량 가져오기 시 COPY 한 번에 적재하는 행 수, 비밀번호 해싱 프로세스 수
+    IMPORT_BATCH_SIZE: int = 10000
+    IMPORT_HASH_WORKERS: int = os.cpu_count() or 1
+
+    # 하위 행(댓글, 좋아요 등)이 이 수 이하면 요청 안에서 바로 삭제하고, 넘으면 삭제 표시 후 purge 작업이 나누어 삭제한다.
+    PURGE_SYNC_THRESHOLD: int = 1000
+    PURGE_BATCH_SIZE: int = 1000
+    # 삭제 표시 후 purge 되지 않은 행을 다시 처리하는 주기(초)와 한 번에 처리하는 회원/게시물 수
+    PURGE_SWEEP_INTERVAL: float = 300
+    PURGE_SWEEP_LIMIT: int = 100
+    # 같은 회원/게시물을 동시에 purge 하지 않도록 잡는 락의 만료 시간(초)
+    PURGE_LOCK_TIMEOUT: float = 3600
+
+    # 게시물/댓글 월 파티션: 미리 만들어 두는 개월 수, 보관 개월 수(None 이면 분리하지 않음), 분리한 파티션을 옮길 스키마
+    PARTITION_PREMAKE_MONTHS: int = 3
+    PARTITION_RETENTION_MONTHS: int | None = None
+    PARTITION_ARCHIVE_SCHEMA: str = "archive"
+
+    # SMTP 서버, 로그인 정보(없으면 로그인하지 않음), STARTTLS 사용 여부, 워커 프로세스별 커넥션 수, 발신 주소
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 25
+    SMTP_USERNAME: str | None = None
+    SMTP_PASSWORD: str | None = None
+    SMTP_STARTTLS: bool = False
+    SMTP_TIMEOUT: float = 10
+    SMTP_POOL_SIZE: int = 4
+    MAIL_FROM: str = "noreply@localhost"
+
+    # 메일 발송: 한 번에 꺼내는 메일 수, 발송 작업 주기(초)와 한 번 실행하는 최대 시간(초), 배치 하나의 최대 발송 시간(초)
+    EMAIL_BATCH_SIZE: int = 200
+    EMAIL_DISPATCH_INTERVAL: float = 1
+    EMAIL_DISPATCH_MAX_SECONDS: float = 50
+    EMAIL_DISPATCH_BATCH_SECONDS: float = 20
+    # 수신 도메인별 발송 한도 (EMAIL_DOMAIN_RATE_WINDOW 초마다 메일 수)
+    EMAIL_DOMAIN_RATE_LIMIT: int = 1000
+    EMAIL_DOMAIN_RATE_WINDOW: int = 60
+    # 일시적 실패 시 최대 시도 횟수, 첫 재시도 지연(초, 시도마다 두 배)
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_DELAY: float = 30
+
+    # 아웃박스 릴레이: 한 번에 발행하는 메시지 수, outbox 가 비었을 때 다시 확인하는 주기(초)
+    OUTBOX_RELAY_BATCH_SIZE: int = 500
+    OUTBOX_RELAY_INTERVAL: float = 0.5
+
+    # 느린 쿼리 로그 기준(ms)과 기록 비율 (0~1)
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_SAMPLE_RATE: float = 1.0
+
     class Config:
         env_file = ".env"
 
@@ -1,19 +1,22 @@
+from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 from config import get_settings
+from query_stats import instrument_engine
+from replicas import ReplicaPool
 
 settings = get_settings()
 DATABASE_URL = f"postgresql+asyncpg://{settings.POSTGRESQL_USER}:{settings.POSTGRESQL_PASSWORD}@{settings.POSTGRESQL_HOST}:{settings.POSTGRESQL_PORT}/{settings.POSTGRESQL_DB}"
 
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,
     pool_size=20,
     max_overflow=20,
     pool_timeout=30,
     pool_recycle=1800,
 )
+instrument_engine(engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -23,4 +26,43 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# 조회 전용 세션: AUTOCOMMIT 이라 BEGIN/COMMIT 없이 쿼리마다 바로 실행되고, 커넥션은 첫 쿼리에서 획득한다.
+ReadSessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+# 읽기 복제본 (POSTGRESQL_REPLICA_HOSTS 가 비어 있으면 사용하지 않는다)
+replica_pool = ReplicaPool(
+    [
+        f"postgresql+asyncpg://{settings.POSTGRESQL_USER}:{settings.POSTGRESQL_PASSWORD}@{host}/{settings.POSTGRESQL_DB}"
+        for host in settings.POSTGRESQL_REPLICA_HOSTS
+    ],
+    max_lag=settings.REPLICA_MAX_LAG,
+    check_interval=settings.REPLICA_LAG_CHECK_INTERVAL,
+    pool_size=20,
+    max_overflow=20,
+    pool_timeout=30,
+    pool_recycle=1800,
+)
+
+# Celery 워커 등 동기 코드에서 사용하는 엔진
+SYNC_DATABASE_URL = f"postgresql+psycopg2://{settings.POSTGRESQL_USER}:{settings.POSTGRESQL_PASSWORD}@{settings.POSTGRESQL_HOST}:{settings.POSTGRESQL_PORT}/{settings.POSTGRESQL_DB}"
+
+sync_engine = create_engine(
+    SYNC_DATABASE_URL,
+    pool_size=5,
+    max_overflow=5,
+    pool_recycle=1800,
+)
+instrument_engine(sync_engine)
+
+SyncSessionLocal = sessionmaker(
+    sync_engine,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 Base = declarative_base()
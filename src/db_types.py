@@ -0,0 +1,56 @@
+import uuid
+
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import TypeDecorator
+from ulid import ULID
+
+
+class ULIDType(TypeDecorator):
+    """
+    ULID 컬럼 타입
+
+    DB 에는 16바이트 uuid 로 저장하고, 애플리케이션에서는 26자 ULID 문자열로 다룬다.
+    ULID 와 uuid 는 같은 128비트이고 바이트 순서대로 비교되므로 정렬(키셋 커서, 범위 파티션)도 그대로 유지된다.
+    올바른 ULID 가 아닌 값은 NULL 로 바인딩되어 조회 조건에서는 일치하는 행이 없게 된다.
+    """
+
+    impl = UUID(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        try:
+            return ULID.from_str(value).to_uuid()
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(ULID.from_uuid(value))
+
+
+class UUIDType(TypeDecorator):
+    """
+    UUID 컬럼 타입
+
+    DB 에는 16바이트 uuid 로 저장하고, 애플리케이션에서는 36자 문자열로 다룬다.
+    올바른 UUID 가 아닌 값은 NULL 로 바인딩되어 조회 조건에서는 일치하는 행이 없게 된다.
+    """
+
+    impl = UUID(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return None
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(value)
@@ -1,15 +1,23 @@
-from fastapi import Depends, HTTPException, status
+import hashlib
+from time import time
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from typing import Annotated, AsyncGenerator
 
 from auth.schemas import TokenPayload
+from auth.service import token_denylist
+from cache import LRUCache
 from config import get_settings
-from database import AsyncSessionLocal, AsyncSession
+from database import AsyncSessionLocal, AsyncSession, ReadSessionLocal, replica_pool
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 settings = get_settings()
 
+# 검증된 토큰 페이로드 캐시 (토큰 다이제스트 -> TokenPayload), 토큰 만료 시각에 제거된다.
+token_cache = LRUCache(maxsize=settings.TOKEN_CACHE_SIZE, ttl=0)
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -26,16 +34,56 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# 쓰기 요청 후 설정되어 READ_YOUR_WRITES_WINDOW 동안 읽기를 기본 DB 로 고정하는 쿠키
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+
+async def get_read_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 세션 획득
+
+    순환 중인 읽기 복제본의 세션을 반환한다. 복제본이 없거나 최근에 쓰기 요청을 보낸
+    클라이언트(PRIMARY_PIN_COOKIE)라면 자신이 쓴 내용을 읽을 수 있도록 기본 DB 세션을 반환한다.
+    세션은 AUTOCOMMIT 으로 동작해 BEGIN/COMMIT 왕복이 없고, 커넥션은 첫 쿼리에서 획득하므로
+    쿼리 없이 끝나는 요청(캐시 적중, 검증 실패 등)은 커넥션을 사용하지 않는다.
+    """
+    sessionmaker = None if PRIMARY_PIN_COOKIE in request.cookies else replica_pool.sessionmaker()
+
+    async with (sessionmaker or ReadSessionLocal)() as session:
+        yield session
+
+
+async def get_primary_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    기본 DB 조회 전용 세션 획득
+
+    get_read_db_session 과 같이 AUTOCOMMIT 으로 동작하되 항상 기본 DB 를 사용한다.
+    복제 지연이 허용되지 않는 조회(공유 캐시를 채우는 조회 등)에 사용한다.
+    """
+    async with ReadSessionLocal() as session:
+        yield session
+
+
 async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
     """
     JWT 토큰 검증 및 회원 정보 획득
-    """
 
+    한 번 검증한 토큰은 만료 시각까지 캐시해 두고 재검증하지 않는다.
+    폐기 여부는 캐시 여부와 관계없이 매 요청 확인한다.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="토큰이 유효하지 않습니다.",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+    token_digest = hashlib.sha256(token.encode()).digest()
+    token_payload = token_cache.get(token_digest)
+    if token_payload is not None:
+        if await token_denylist.is_revoked(token_payload.jti):
+            raise credentials_exception
+        return token_payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         token_payload = TokenPayload(
@@ -49,4 +97,9 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+
+    if await token_denylist.is_revoked(token_payload.jti):
+        raise credentials_exception
+
+    token_cache.set(token_digest, token_payload, ttl=payload["exp"] - time())
     return token_payload
@@ -0,0 +1,76 @@
+import csv
+import io
+from enum import StrEnum
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy import Select
+
+from config import get_settings
+from database import AsyncSessionLocal
+
+settings = get_settings()
+
+
+class ExportFormat(StrEnum):
+    """
+    내보내기 형식
+
+    NDJSON: 한 줄에 JSON 객체 하나
+    CSV: 첫 줄은 컬럼 이름
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def _stream_rows(stmt: Select, format: ExportFormat, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    서버 측 커서로 chunk_size 개씩 읽어 바로 직렬화
+
+    응답 본문은 의존성(get_db_session)이 정리된 뒤에 전송되므로 별도 세션을 연다.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=chunk_size))
+
+        if format == ExportFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(result.keys())
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+        async for rows in result.partitions():
+            if format == ExportFormat.NDJSON:
+                yield b"".join(to_json(row._asdict()) + b"\n" for row in rows)
+            else:
+                writer.writerows(rows)
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+
+def export_response(stmt: Select, format: ExportFormat, filename: str) -> StreamingResponse:
+    """
+    조회 결과를 NDJSON/CSV 로 스트리밍하는 응답
+
+    테이블 크기와 관계없이 메모리 사용량은 EXPORT_CHUNK_SIZE 개 행으로 일정하다.
+
+    Args:
+        stmt: 내보낼 컬럼을 지정한 조회 쿼리
+        format: 내보내기 형식
+        filename: 내려받을 파일 이름 (확장자 제외)
+    """
+    return StreamingResponse(
+        _stream_rows(stmt, format, settings.EXPORT_CHUNK_SIZE),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
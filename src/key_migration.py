@@ -0,0 +1,269 @@
+"""
+키 컬럼 uuid 전환 (온라인 마이그레이션)
+
+text 로 저장된 키(회원 UUID 36자, 게시물/댓글 ULID 26자)를 16바이트 uuid 컬럼(db_types.py)으로 옮긴다.
+파티션 키(id)는 타입을 바꿀 수 없으므로 모델 정의대로 만든 섀도 테이블에 복사한 뒤 스키마를 맞바꾼다.
+Alembic 마이그레이션에서 op.get_bind() 로 단계별로 호출하며, 마지막 단계 전까지 서비스는 기존 테이블을 그대로 사용한다.
+
+1. prepare: ulid_to_uuid 함수, SHADOW_SCHEMA 의 섀도 테이블/파티션/인덱스, 기존 테이블의 동기화 트리거 생성
+2. backfill: 기존 행을 키 순서대로 batch_size 개씩 복사 (KEY_TABLES 마다 호출)
+3. constrain: 섀도 테이블에 외래키를 NOT VALID 로 추가한 뒤 검증
+4. cutover: 기존 테이블을 RETIRED_SCHEMA 로, 섀도 테이블을 public 으로 옮긴다. uuid 키 모델 배포와 함께 실행한다.
+
+2, 3 단계는 배치/문장마다 커밋해야 하므로 op.get_context().autocommit_block() 안에서 호출한다.
+전환 후 확인이 끝나면 RETIRED_SCHEMA 를 삭제한다.
+"""
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Column, Connection, ForeignKeyConstraint, Table, text
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from db_types import ULIDType, UUIDType
+from models import Member
+from partitions import PARTITIONED_TABLES, create_partitions
+
+# 전환할 기존 테이블의 스키마 (cutover 후 섀도 테이블이 이 스키마로 옮겨진다)
+SOURCE_SCHEMA = "public"
+SHADOW_SCHEMA = "key_migration"
+RETIRED_SCHEMA = "key_migration_retired"
+
+# 키를 uuid 로 옮기는 테이블 (참조되는 테이블이 먼저 오도록 정렬)
+KEY_TABLES = ("member", "post", "comment", "post_like", "comment_like")
+
+# Crockford Base32 ULID(26자, 130비트 중 앞 2비트는 0) -> 128비트 uuid
+ULID_TO_UUID_FUNCTION = """
+CREATE OR REPLACE FUNCTION ulid_to_uuid(ulid text) RETURNS uuid
+LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE AS $$
+DECLARE
+    alphabet CONSTANT text := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    bits varbit := B'';
+    hex text := '';
+BEGIN
+    FOR i IN 1..26 LOOP
+        bits := bits || (strpos(alphabet, upper(substr(ulid, i, 1))) - 1)::bit(5);
+    END LOOP;
+    FOR i IN 0..31 LOOP
+        hex := hex || to_hex(substring(bits FROM 3 + i * 4 FOR 4)::bit(4)::int);
+    END LOOP;
+    RETURN hex::uuid;
+END
+$$
+"""
+
+
+def _table(name: str) -> Table:
+    return Member.metadata.tables[name]
+
+
+def _columns(table: Table) -> list[Column]:
+    """복사할 컬럼 (생성 컬럼 제외)"""
+    return [column for column in table.columns if column.computed is None]
+
+
+def _convert(column: Column, value: str) -> str:
+    """기존 text 키 값을 uuid 로 바꾸는 SQL 식"""
+    if isinstance(column.type, ULIDType):
+        return f"ulid_to_uuid({value})"
+    if isinstance(column.type, UUIDType):
+        return f"{value}::uuid"
+    return value
+
+
+def _partitions(connection: Connection, schema: str, table: str) -> list[str]:
+    return connection.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": f"{schema}.{table}"},
+    ).all()
+
+
+def _create_mirror_trigger(connection: Connection, table: Table) -> None:
+    """
+    기존 테이블의 INSERT/UPDATE/DELETE 를 키를 변환해 섀도 테이블에 반영하는 트리거
+
+    UPDATE 는 ON CONFLICT DO UPDATE 로 반영하고, 섀도 행은 DELETE 이거나 키가 바뀐 UPDATE 일 때만 지운다.
+    constrain 이후에는 섀도 행을 지우면 ON DELETE CASCADE 로 하위 행(게시물, 댓글, 좋아요)도 함께 지워지기 때문이다.
+    """
+    columns = _columns(table)
+    names = ", ".join(column.name for column in columns)
+    primary_key = [column for column in table.primary_key]
+    key_names = ", ".join(column.name for column in primary_key)
+    old_key = ", ".join(_convert(column, f"OLD.{column.name}") for column in primary_key)
+    key_changed = (
+        f"({', '.join(f'OLD.{column.name}' for column in primary_key)}) "
+        f"IS DISTINCT FROM ({', '.join(f'NEW.{column.name}' for column in primary_key)})"
+    )
+    new_values = ", ".join(_convert(column, f"NEW.{column.name}") for column in columns)
+    updates = ", ".join(
+        f"{column.name} = EXCLUDED.{column.name}" for column in columns if not column.primary_key
+    )
+    on_conflict = f"ON CONFLICT ({key_names}) DO UPDATE SET {updates}" if updates else "ON CONFLICT DO NOTHING"
+
+    connection.execute(
+        text(
+            f"""
+            CREATE OR REPLACE FUNCTION {SHADOW_SCHEMA}.mirror_{table.name}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND {key_changed}) THEN
+                    DELETE FROM {SHADOW_SCHEMA}.{table.name} WHERE ({key_names}) = ({old_key});
+                END IF;
+                IF TG_OP <> 'DELETE' THEN
+                    INSERT INTO {SHADOW_SCHEMA}.{table.name} ({names}) VALUES ({new_values}) {on_conflict};
+                END IF;
+                RETURN NULL;
+            END
+            $$
+            """
+        )
+    )
+    connection.execute(
+        text(
+            f"CREATE TRIGGER mirror_{table.name}_keys AFTER INSERT OR UPDATE OR DELETE ON {SOURCE_SCHEMA}.{table.name} "
+            f"FOR EACH ROW EXECUTE FUNCTION {SHADOW_SCHEMA}.mirror_{table.name}()"
+        )
+    )
+
+
+def prepare(connection: Connection, premake_months: int) -> None:
+    """
+    섀도 테이블과 동기화 트리거 생성
+
+    섀도 테이블은 외래키 없이 만든다 (backfill 순서와 관계없이 트리거가 쓸 수 있도록).
+    파티션 테이블은 가장 오래된 행의 생성 월부터 premake_months 개월 뒤까지 파티션을 만든다.
+    트리거가 만들어진 이후의 쓰기는 섀도 테이블에도 반영된다.
+    """
+    connection.execute(text(ULID_TO_UUID_FUNCTION))
+    connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SHADOW_SCHEMA}"))
+
+    # 스키마를 지정하지 않은 DDL 이 섀도 스키마에 만들어지도록 한다 (enum 타입 등은 public 을 그대로 참조).
+    connection.execute(text(f"SET LOCAL search_path TO {SHADOW_SCHEMA}, public"))
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    for name in KEY_TABLES:
+        table = _table(name)
+        connection.execute(CreateTable(table, include_foreign_key_constraints=[]))
+        for index in table.indexes:
+            connection.execute(CreateIndex(index))
+
+        if name in PARTITIONED_TABLES:
+            oldest = connection.scalar(text(f"SELECT min(created_at) FROM {SOURCE_SCHEMA}.{name}")) or this_month
+            start = date(oldest.year, oldest.month, 1)
+            months = (this_month.year - start.year) * 12 + this_month.month - start.month
+            create_partitions(connection, name, start, months + premake_months + 1)
+    connection.execute(text("SET LOCAL search_path TO DEFAULT"))
+
+    for name in KEY_TABLES:
+        _create_mirror_trigger(connection, _table(name))
+
+
+def backfill(connection: Connection, name: str, batch_size: int) -> int:
+    """
+    기존 행을 기본키 순서대로 batch_size 개씩 섀도 테이블에 복사
+
+    복사하는 동안 원본 행을 FOR SHARE 로 잠가, 동시에 수정/삭제된 행은 트리거가 복사 이후에 반영하도록 한다.
+    트리거가 이미 반영한 행은 건너뛴다 (ON CONFLICT DO NOTHING). 중단되면 처음부터 다시 실행해도 된다.
+
+    Returns:
+        int: 복사한 행 수
+    """
+    table = _table(name)
+    columns = _columns(table)
+    primary_key = [column.name for column in table.primary_key]
+    key_names = ", ".join(primary_key)
+    after_params = ", ".join(f":after_{i}" for i in range(len(primary_key)))
+    names = ", ".join(column.name for column in columns)
+    values = ", ".join(_convert(column, f"batch.{column.name}") for column in columns)
+
+    total = 0
+    after: tuple | None = None
+    while True:
+        condition = f"WHERE ({key_names}) > ({after_params})" if after else ""
+        row = connection.execute(
+            text(
+                f"""
+                WITH batch AS (
+                    SELECT * FROM {SOURCE_SCHEMA}.{name} {condition} ORDER BY {key_names} LIMIT :batch_size FOR SHARE
+                ), copied AS (
+                    INSERT INTO {SHADOW_SCHEMA}.{name} ({names}) SELECT {values} FROM batch ON CONFLICT DO NOTHING
+                )
+                SELECT (SELECT count(*) FROM batch) AS copied, {key_names} FROM batch
+                ORDER BY {", ".join(f"{key} DESC" for key in primary_key)} LIMIT 1
+                """
+            ),
+            {"batch_size": batch_size, **{f"after_{i}": value for i, value in enumerate(after or ())}},
+        ).first()
+        if row is None:
+            return total
+
+        total += row.copied
+        after = tuple(row[1:])
+        if row.copied < batch_size:
+            return total
+
+
+def _foreign_key_definition(constraint: ForeignKeyConstraint) -> str:
+    columns = ", ".join(constraint.column_keys)
+    referred = ", ".join(element.column.name for element in constraint.elements)
+    definition = (
+        f"FOREIGN KEY ({columns}) REFERENCES {SHADOW_SCHEMA}.{constraint.referred_table.name} ({referred})"
+    )
+    if constraint.ondelete:
+        definition += f" ON DELETE {constraint.ondelete}"
+    return definition
+
+
+def constrain(connection: Connection) -> None:
+    """
+    섀도 테이블에 모델의 외래키 추가
+
+    NOT VALID 로 추가한 뒤 VALIDATE 하므로 검증하는 동안 쓰기(트리거)를 막지 않는다.
+    파티션 테이블은 NOT VALID 외래키를 추가할 수 없으므로 파티션마다 추가/검증한 뒤
+    부모 테이블에 추가해 검증된 파티션 외래키를 연결한다.
+    """
+    for name in KEY_TABLES:
+        partitions = _partitions(connection, SHADOW_SCHEMA, name)
+        for constraint in _table(name).foreign_key_constraints:
+            constraint_name = f"{name}_{'_'.join(constraint.column_keys)}_fkey"
+            definition = _foreign_key_definition(constraint)
+            for relation in partitions or [name]:
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {SHADOW_SCHEMA}.{relation} "
+                        f"ADD CONSTRAINT {constraint_name} {definition} NOT VALID"
+                    )
+                )
+                connection.execute(
+                    text(f"ALTER TABLE {SHADOW_SCHEMA}.{relation} VALIDATE CONSTRAINT {constraint_name}")
+                )
+            if partitions:
+                connection.execute(
+                    text(f"ALTER TABLE {SHADOW_SCHEMA}.{name} ADD CONSTRAINT {constraint_name} {definition}")
+                )
+
+
+def cutover(connection: Connection) -> None:
+    """
+    기존 테이블과 섀도 테이블 맞바꾸기
+
+    테이블을 잠근 채 스키마만 옮기므로 행 수와 무관하게 짧게 끝난다.
+    기존 테이블(과 동기화 트리거)은 RETIRED_SCHEMA 에 남는다.
+    """
+    connection.execute(
+        text(f"LOCK TABLE {', '.join(f'{SOURCE_SCHEMA}.{name}' for name in KEY_TABLES)} IN ACCESS EXCLUSIVE MODE")
+    )
+    connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {RETIRED_SCHEMA}"))
+
+    for name in KEY_TABLES:
+        for relation in [*_partitions(connection, SOURCE_SCHEMA, name), name]:
+            connection.execute(text(f"ALTER TABLE {SOURCE_SCHEMA}.{relation} SET SCHEMA {RETIRED_SCHEMA}"))
+        connection.execute(text(f"DROP TRIGGER mirror_{name}_keys ON {RETIRED_SCHEMA}.{name}"))
+
+    for name in KEY_TABLES:
+        for relation in [*_partitions(connection, SHADOW_SCHEMA, name), name]:
+            connection.execute(text(f"ALTER TABLE {SHADOW_SCHEMA}.{relation} SET SCHEMA {SOURCE_SCHEMA}"))
+        connection.execute(text(f"DROP FUNCTION {SHADOW_SCHEMA}.mirror_{name}()"))
+
+    connection.execute(text(f"DROP SCHEMA {SHADOW_SCHEMA}"))
@@ -0,0 +1,261 @@
+import logging
+
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+from sqlalchemy import Row, Update, delete, func, literal, select, true, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+logger = logging.getLogger(__name__)
+
+
+async def toggle_like(
+    db_session: AsyncSession,
+    target: type,
+    like: type,
+    like_target_id: InstrumentedAttribute,
+    target_id: str,
+    member_id: str,
+    update_count: bool = True,
+) -> Row | None:
+    """
+    좋아요 토글
+
+    좋아요 기록 삭제/추가와 대상의 like_count 증감을 하나의 쿼리(data-modifying CTE)로 처리한다.
+
+        WITH deleted AS (DELETE FROM like ... RETURNING ...),
+             inserted AS (INSERT INTO like ... WHERE NOT EXISTS (deleted) ON CONFLICT DO NOTHING RETURNING ...)
+        UPDATE target SET like_count = like_count + count(inserted) - count(deleted) ... RETURNING ...
+
+    like_count 는 DB 에서 증감하므로 동시 요청에도 좋아요 기록 수와 일치한다.
+    update_count 가 False 이면 좋아요 기록만 변경하고 like_count 는 그대로 조회한다 (write-behind).
+
+    Args:
+        target: 좋아요 대상 모델 (Post, Comment)
+        like: 좋아요 기록 모델 (PostLike, CommentLike)
+        like_target_id: 좋아요 기록의 대상 식별자 컬럼
+        target_id: 대상 식별자
+        member_id: 좋아요 누른 회원 식별자
+        update_count: like_count 증감 여부
+
+    Returns:
+        Row | None: (liked, like_count, delta), 대상이 없으면 None
+    """
+    deleted = (
+        delete(like)
+        .where(like_target_id == target_id, like.member_id == member_id)
+        .returning(like_target_id)
+        .cte("deleted")
+    )
+    inserted = (
+        insert(like)
+        .from_select(
+            [like_target_id.key, "member_id"],
+            select(literal(target_id, like_target_id.type), literal(member_id, like.member_id.type)).where(
+                ~select(deleted).exists(),
+                select(target.id).where(target.id == target_id).exists(),
+            ),
+        )
+        .on_conflict_do_nothing()
+        .returning(like_target_id)
+        .cte("inserted")
+    )
+    inserted_count = select(func.count()).select_from(inserted).scalar_subquery()
+    deleted_count = select(func.count()).select_from(deleted).scalar_subquery()
+    columns = ((inserted_count > 0).label("liked"), target.like_count, (inserted_count - deleted_count).label("delta"))
+
+    if update_count:
+        stmt = (
+            update(target)
+            .where(target.id == target_id)
+            .values(like_count=target.like_count + inserted_count - deleted_count)
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(*columns).where(target.id == target_id)
+
+    return (await db_session.execute(stmt)).first()
+
+
+class LikeDeltaBuffer:
+    """
+    좋아요 수 증감 버퍼 (write-behind)
+
+    대상별 증감을 Redis 해시에 누적하고, flush_like_deltas 가 주기적으로 DB 에 일괄 반영한다.
+    반영 중인 증감은 별도 키(flushing)로 옮겨 두므로 미반영분은 두 키의 값을 합산한다.
+    """
+
+    def __init__(self, redis: Redis, namespace: str):
+        self.redis = redis
+        self.key = f"like_delta:{namespace}"
+        self.flushing_key = f"{self.key}:flushing"
+
+    async def add(self, target_id: str, delta: int) -> int:
+        """
+        증감 누적
+
+        Returns:
+            int: 아직 DB 에 반영되지 않은 증감 합계
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(self.key, target_id, delta)
+            pipe.hget(self.flushing_key, target_id)
+            pending, flushing = await pipe.execute()
+        return pending + int(flushing or 0)
+
+
+async def apply_like_delta(
+    db_session: AsyncSession, buffer: LikeDeltaBuffer | None, target: type, target_id: str, toggled: Row
+) -> dict:
+    """
+    토글 결과의 like_count 증감 반영
+
+    buffer 가 없으면 toggle_like 에서 이미 반영된 값을 그대로 사용한다.
+    buffer 가 있으면 증감을 Redis 에 누적하고 미반영분을 합산한 값을 반환한다.
+    Redis 장애 시에는 DB 에 직접 반영한다.
+    토글 커밋 후 누적 전에 프로세스가 종료되어 빠진 대상은 repair_like_counts 가 보정한다.
+
+    Returns:
+        dict: liked, like_count
+    """
+    like_count = toggled.like_count
+
+    if buffer is not None and toggled.delta:
+        try:
+            like_count += await buffer.add(target_id, toggled.delta)
+        except RedisError:
+            logger.warning("like delta buffering failed: %s", target_id, exc_info=True)
+            like_count = await db_session.scalar(
+                update(target)
+                .where(target.id == target_id)
+                .values(like_count=target.like_count + toggled.delta)
+                .returning(target.like_count)
+                .execution_options(synchronize_session=False)
+            )
+            await db_session.commit()
+
+    return {"liked": toggled.liked, "like_count": like_count}
+
+
+def recount_like_counts(target: type, like: type, like_target_id: InstrumentedAttribute, target_ids: list[str]) -> Update:
+    """대상들의 like_count 를 좋아요 기록 수로 다시 계산하는 쿼리"""
+    like_count = select(func.count()).select_from(like).where(like_target_id == target.id).scalar_subquery()
+    return (
+        update(target)
+        .where(target.id.in_(target_ids))
+        .values(like_count=like_count)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def flush_like_deltas(
+    session: Session,
+    redis: SyncRedis,
+    target: type,
+    like: type,
+    like_target_id: InstrumentedAttribute,
+    namespace: str,
+    batch_size: int,
+) -> int:
+    """
+    누적된 좋아요 수 증감을 DB 에 일괄 반영
+
+    누적 해시를 flushing 키로 옮긴 뒤 증감이 있었던 대상의 like_count 를 batch_size 단위로
+    좋아요 기록 수로 다시 계산한다. 증감 값을 더하는 대신 기록 수로 덮어쓰므로
+    반영 도중 중단되어 다시 실행하더라도 결과가 좋아요 기록과 정확히 일치한다.
+    대상이 아무리 많은 좋아요를 받아도 대상별로 주기당 한 번만 갱신된다.
+
+    Returns:
+        int: 반영한 대상 수
+    """
+    key = f"like_delta:{namespace}"
+    flushing_key = f"{key}:flushing"
+
+    lock = redis.lock(f"{key}:lock", timeout=300)
+    if not lock.acquire(blocking=False):
+        return 0
+
+    try:
+        # flushing 키가 남아 있으면 이전 반영이 중단된 것이므로 이어서 반영한다.
+        if not redis.exists(flushing_key):
+            try:
+                redis.rename(key, flushing_key)
+            except ResponseError:
+                # 누적된 증감 없음
+                return 0
+
+        target_ids = [target_id.decode() for target_id in redis.hkeys(flushing_key)]
+
+        for i in range(0, len(target_ids), batch_size):
+            batch = target_ids[i : i + batch_size]
+            session.execute(recount_like_counts(target, like, like_target_id, batch))
+            session.commit()
+            redis.hdel(flushing_key, *batch)
+
+        redis.delete(flushing_key)
+        return len(target_ids)
+    finally:
+        lock.release()
+
+
+def repair_like_counts(
+    session: Session,
+    redis: SyncRedis,
+    target: type,
+    like: type,
+    like_target_id: InstrumentedAttribute,
+    namespace: str,
+    batch_size: int,
+) -> int:
+    """
+    like_count 가 좋아요 기록 수와 다른 대상을 찾아 다시 계산 (write-behind 누락 보정)
+
+    토글을 커밋한 뒤 증감을 버퍼에 누적하기 전에 프로세스가 종료되면 그 대상은 flush_like_deltas 가 반영하지 않는다.
+    실행할 때마다 id 순으로 이전 실행에 이어 batch_size 개의 대상을 확인하고, 끝에 도달하면 처음부터 다시 확인한다.
+    아직 반영되지 않은 증감이 있는 대상은 flush_like_deltas 가 다시 계산하므로 건너뛴다.
+
+    Returns:
+        int: 다시 계산한 대상 수
+    """
+    key = f"like_delta:{namespace}"
+    cursor_key = f"{key}:repair_cursor"
+
+    after = redis.get(cursor_key)
+    target_ids = session.scalars(
+        select(target.id)
+        .where(target.id > after.decode() if after else true())
+        .order_by(target.id)
+        .limit(batch_size)
+    ).all()
+    if len(target_ids) < batch_size:
+        redis.delete(cursor_key)
+    else:
+        redis.set(cursor_key, target_ids[-1])
+    if not target_ids:
+        return 0
+
+    with redis.pipeline(transaction=False) as pipe:
+        pipe.hmget(key, target_ids)
+        pipe.hmget(f"{key}:flushing", target_ids)
+        pending, flushing = pipe.execute()
+    target_ids = [
+        target_id for target_id, *deltas in zip(target_ids, pending, flushing) if not any(deltas)
+    ]
+    if not target_ids:
+        return 0
+
+    like_count = select(func.count()).select_from(like).where(like_target_id == target.id).scalar_subquery()
+    repaired = session.scalars(
+        update(target)
+        .where(target.id.in_(target_ids), target.like_count != like_count)
+        .values(like_count=like_count)
+        .returning(target.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    session.commit()
+    if repaired:
+        logger.warning("repaired like_count of %d %s targets", len(repaired), namespace)
+    return len(repaired)
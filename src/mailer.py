@@ -0,0 +1,465 @@
+"""
+메일 발송
+
+메일은 우선순위별 Redis 큐에 넣고(EmailQueue.push), dispatch_emails 가 배치로 꺼내 SMTP 커넥션 풀로 발송한다.
+transactional 큐를 먼저 비운 뒤 bulk 큐를 꺼내므로 대량 메일이 가입/알림 메일을 막지 않는다.
+수신 도메인별 발송량을 제한하고, 한도를 넘거나 일시적으로 실패한 메일은 지연 큐에 넣었다가 다시 발송한다.
+꺼낸 메일은 처리가 끝날 때까지 처리 중 목록에 남겨 두므로, 워커가 발송 중에 종료되어도 다음 발송 때 다시 큐에 넣는다.
+"""
+
+import json
+import logging
+import smtplib
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from enum import StrEnum
+from queue import Empty, LifoQueue
+from time import monotonic, time
+from typing import NamedTuple
+from uuid import uuid4
+
+from redis import Redis as SyncRedis
+from redis.exceptions import LockError
+
+logger = logging.getLogger(__name__)
+
+
+class MailPriority(StrEnum):
+    """
+    메일 우선순위
+
+    TRANSACTIONAL: 가입, 비밀번호 변경 등 사용자 요청에 따른 메일
+    BULK: 공지, 뉴스레터 등 대량 메일
+    """
+
+    TRANSACTIONAL = "transactional"
+    BULK = "bulk"
+
+
+class SMTPPool:
+    """
+    SMTP 커넥션 풀
+
+    로그인까지 마친 커넥션을 재사용해 메일마다 연결/EHLO/STARTTLS/AUTH 왕복을 반복하지 않는다.
+    동시에 열 수 있는 커넥션은 size 개로 제한하고, 커넥션은 처음 필요할 때 연결한다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        size: int,
+        username: str | None = None,
+        password: str | None = None,
+        starttls: bool = False,
+        timeout: float = 10,
+    ):
+        self.host = host
+        self.port = port
+        self.size = size
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._idle: LifoQueue[smtplib.SMTP] = LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    def acquire(self) -> smtplib.SMTP:
+        """유휴 커넥션을 꺼내거나 새로 연결 (size 개가 모두 사용 중이면 대기)"""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            pass
+        try:
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, smtp: smtplib.SMTP) -> None:
+        """커넥션을 풀에 반환"""
+        self._idle.put(smtp)
+        self._slots.release()
+
+    def discard(self, smtp: smtplib.SMTP) -> None:
+        """끊어졌거나 상태를 알 수 없는 커넥션을 닫고 버림"""
+        smtp.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        """유휴 커넥션 종료"""
+        while True:
+            try:
+                smtp = self._idle.get_nowait()
+            except Empty:
+                return
+            try:
+                smtp.quit()
+            except smtplib.SMTPException:
+                smtp.close()
+
+
+class BatchResult(NamedTuple):
+    """
+    배치 발송 결과
+
+    sent: 발송한 메일
+    retry: 일시적 실패(4xx, 연결 오류)로 다시 보낼 메일
+    failed: 영구 실패(5xx)로 버리는 메일
+    unsent: 배치 제한 시간이 지나 보내지 않은 메일 (시도 횟수에 포함하지 않는다)
+    """
+
+    sent: list[dict]
+    retry: list[dict]
+    failed: list[dict]
+    unsent: list[dict]
+
+
+def _build_message(sender: str, message: dict) -> EmailMessage:
+    email = EmailMessage()
+    email["From"] = sender
+    email["To"] = message["to"]
+    email["Subject"] = message["subject"]
+    email.set_content(message["body"])
+    return email
+
+
+def _error_code(error: smtplib.SMTPException) -> int:
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return min(code for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code
+    return 0
+
+
+def _send_chunk(pool: SMTPPool, sender: str, messages: list[dict], deadline: float | None) -> BatchResult:
+    """
+    하나의 커넥션으로 메일을 차례로 발송
+
+    재사용한 커넥션이 서버 쪽에서 끊겨 있었다면 새 커넥션으로 한 번 더 보낸다.
+    deadline(monotonic)이 지나면 남은 메일은 보내지 않는다.
+    """
+    result = BatchResult([], [], [], [])
+    smtp = None
+
+    for i, message in enumerate(messages):
+        if deadline is not None and monotonic() >= deadline:
+            result.unsent.extend(messages[i:])
+            break
+
+        for _ in range(2):
+            if smtp is None:
+                try:
+                    smtp = pool.acquire()
+                except OSError:
+                    logger.warning("smtp connection failed", exc_info=True)
+                    result.retry.append(message)
+                    break
+
+            try:
+                smtp.send_message(_build_message(sender, message))
+            except smtplib.SMTPServerDisconnected:
+                pool.discard(smtp)
+                smtp = None
+                continue
+            except smtplib.SMTPException as e:
+                code = _error_code(e)
+                if 500 <= code < 600:
+                    logger.warning("email to %s rejected: %r", message["to"], e)
+                    result.failed.append(message)
+                else:
+                    result.retry.append(message)
+                    if not code:
+                        pool.discard(smtp)
+                        smtp = None
+            except OSError:
+                logger.warning("email to %s failed", message["to"], exc_info=True)
+                pool.discard(smtp)
+                smtp = None
+                result.retry.append(message)
+            else:
+                result.sent.append(message)
+            break
+        else:
+            result.retry.append(message)
+
+    if smtp is not None:
+        pool.release(smtp)
+    return result
+
+
+def send_batch(pool: SMTPPool, sender: str, messages: list[dict], deadline: float | None = None) -> BatchResult:
+    """
+    메일을 커넥션 풀 크기만큼 나누어 동시에 발송
+
+    Args:
+        pool: SMTP 커넥션 풀
+        sender: 발신 주소
+        messages: 메일 (to, subject, body)
+        deadline: 이 시각(monotonic) 이후에는 새 메일을 보내지 않는다.
+
+    Returns:
+        BatchResult: 발송/재시도/실패/미발송 메일
+    """
+    if not messages:
+        return BatchResult([], [], [], [])
+
+    workers = min(pool.size, len(messages))
+    chunks = [messages[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda chunk: _send_chunk(pool, sender, chunk, deadline), chunks))
+
+    return BatchResult(
+        [message for result in results for message in result.sent],
+        [message for result in results for message in result.retry],
+        [message for result in results for message in result.failed],
+        [message for result in results for message in result.unsent],
+    )
+
+
+def _domain(address: str) -> str:
+    return address.rpartition("@")[2].lower()
+
+
+# 도메인별로 남은 한도 안에서 요청한 수만큼만 카운터에 더하고, 더한 수(허용한 수)를 반환한다.
+ACQUIRE_SCRIPT = """
+local granted = {}
+for i, key in ipairs(KEYS) do
+    local used = tonumber(redis.call('GET', key) or '0')
+    local count = math.max(0, math.min(tonumber(ARGV[i + 2]), tonumber(ARGV[1]) - used))
+    if count > 0 then
+        redis.call('INCRBY', key, count)
+    end
+    redis.call('EXPIRE', key, ARGV[2])
+    granted[i] = count
+end
+return granted
+"""
+
+
+class DomainRateLimiter:
+    """
+    수신 도메인별 발송 한도 (고정 윈도)
+
+    window 초마다 도메인별로 limit 통까지 허용하고, 카운터는 Redis 에 두어 모든 워커가 공유한다.
+    카운터에는 허용한 수만 더하므로 한도를 넘어 미룬 메일은 같은 윈도의 다음 배치가 쓸 한도를 줄이지 않는다.
+    """
+
+    def __init__(self, redis: SyncRedis, limit: int, window: int):
+        self.redis = redis
+        self.limit = limit
+        self.window = window
+        self._acquire = redis.register_script(ACQUIRE_SCRIPT)
+
+    def acquire(self, counts: dict[str, int]) -> dict[str, int]:
+        """
+        도메인별로 요청한 수만큼 발송 슬롯 확보
+
+        Returns:
+            dict[str, int]: 도메인별 이번 윈도에 보낼 수 있는 메일 수
+        """
+        window_id = int(time() // self.window)
+        domains = list(counts)
+        granted = self._acquire(
+            keys=[f"email:rate:{domain}:{window_id}" for domain in domains],
+            args=[self.limit, self.window * 2, *[counts[domain] for domain in domains]],
+        )
+        return dict(zip(domains, granted))
+
+    def next_window(self) -> float:
+        """다음 윈도 시작 시각 (UNIX 시간)"""
+        return (int(time() // self.window) + 1) * self.window
+
+
+# 큐에서 꺼낸 메일을 같은 명령 안에서 처리 중 해시(메일 id -> 메일)로 옮긴다.
+POP_SCRIPT = """
+local items = redis.call('LPOP', KEYS[1], ARGV[1])
+if not items then
+    return {}
+end
+for _, item in ipairs(items) do
+    redis.call('HSET', KEYS[2], cjson.decode(item)['id'], item)
+end
+return items
+"""
+
+
+class EmailQueue:
+    """
+    우선순위별 메일 큐
+
+    우선순위마다 Redis 리스트를 두고, 나중에 다시 보낼 메일은 보낼 시각을 점수로 하는 정렬 집합에 둔다.
+    꺼낸 메일은 ack/defer 할 때까지 처리 중 해시에 남고, 워커가 그 전에 종료되면 requeue_processing 으로 되돌린다.
+    따라서 발송 직후 종료된 메일은 한 번 더 발송될 수 있다 (최소 한 번 발송).
+    """
+
+    def __init__(self, redis: SyncRedis, namespace: str = "email"):
+        self.redis = redis
+        self.namespace = namespace
+        self.deferred_key = f"{namespace}:deferred"
+        self.processing_key = f"{namespace}:processing"
+        self._pop = redis.register_script(POP_SCRIPT)
+
+    def _queue_key(self, priority: MailPriority) -> str:
+        return f"{self.namespace}:queue:{priority}"
+
+    def push(self, to: str, subject: str, body: str, priority: MailPriority = MailPriority.TRANSACTIONAL) -> None:
+        """메일을 큐에 추가"""
+        message = {"id": str(uuid4()), "to": to, "subject": subject, "body": body, "priority": priority, "attempts": 0}
+        self.redis.rpush(self._queue_key(priority), json.dumps(message))
+
+    def pop_batch(self, size: int) -> list[dict]:
+        """우선순위 순서로 최대 size 개의 메일을 꺼내 처리 중 해시로 옮기기"""
+        messages = []
+        for priority in MailPriority:
+            if len(messages) >= size:
+                break
+            popped = self._pop(keys=[self._queue_key(priority), self.processing_key], args=[size - len(messages)])
+            messages.extend(json.loads(item) for item in popped)
+        return messages
+
+    def ack(self, messages: list[dict]) -> None:
+        """처리가 끝난(발송했거나 버린) 메일을 처리 중 해시에서 제거"""
+        if messages:
+            self.redis.hdel(self.processing_key, *[message["id"] for message in messages])
+
+    def defer(self, messages: list[dict], until: float) -> None:
+        """메일을 until(UNIX 시간) 이후에 다시 보내도록 지연 큐로 옮기기"""
+        if not messages:
+            return
+
+        with self.redis.pipeline() as pipe:
+            pipe.zadd(self.deferred_key, {json.dumps(message): until for message in messages})
+            pipe.hdel(self.processing_key, *[message["id"] for message in messages])
+            pipe.execute()
+
+    def requeue_processing(self) -> int:
+        """
+        처리 중 해시에 남은 메일(발송 중 종료된 워커의 메일)을 우선순위 큐 앞쪽으로 되돌린다.
+
+        다른 발송이 진행 중이지 않을 때(발송 락을 잡은 뒤) 호출해야 한다.
+
+        Returns:
+            int: 되돌린 메일 수
+        """
+        pending = self.redis.hvals(self.processing_key)
+        if not pending:
+            return 0
+
+        with self.redis.pipeline() as pipe:
+            pipe.delete(self.processing_key)
+            for item in pending:
+                pipe.lpush(self._queue_key(json.loads(item)["priority"]), item)
+            pipe.execute()
+        logger.warning("requeued %d emails left in processing", len(pending))
+        return len(pending)
+
+    def promote_due(self) -> int:
+        """
+        보낼 시각이 된 지연 메일을 우선순위 큐 앞쪽으로 옮긴다.
+
+        Returns:
+            int: 옮긴 메일 수
+        """
+        due = self.redis.zrangebyscore(self.deferred_key, 0, time())
+        if not due:
+            return 0
+
+        with self.redis.pipeline() as pipe:
+            pipe.zrem(self.deferred_key, *due)
+            for item in reversed(due):
+                pipe.lpush(self._queue_key(json.loads(item)["priority"]), item)
+            pipe.execute()
+        return len(due)
+
+
+def dispatch_emails(
+    queue: EmailQueue,
+    limiter: DomainRateLimiter,
+    pool: SMTPPool,
+    sender: str,
+    batch_size: int,
+    max_seconds: float,
+    batch_seconds: float,
+    max_attempts: int,
+    retry_delay: float,
+) -> int:
+    """
+    큐에 쌓인 메일을 batch_size 개씩 꺼내 발송
+
+    동시에 하나만 실행되도록 Redis 락을 잡고, 큐가 비거나 max_seconds 가 지나면 끝낸다.
+    시작할 때 이전 발송이 처리하지 못하고 남긴 메일을 큐로 되돌린다.
+    배치마다 최대 batch_seconds 동안 발송하고, 락은 배치를 시작할 때마다 그 배치가 끝날 때까지로 연장한다.
+    락을 잃었으면(다른 발송이 처리 중 메일을 되돌렸을 수 있으므로) 더 꺼내지 않고 끝낸다.
+    도메인 한도를 넘은 메일은 다음 윈도로, 일시적으로 실패한 메일은 retry_delay 부터 두 배씩 늘어나는 간격으로
+    max_attempts 번까지 다시 보낸다.
+
+    Returns:
+        int: 발송한 메일 수
+    """
+    # 제한 시간 직전에 시작한 SMTP 명령이 끝날 때까지의 여유를 둔다.
+    lock_timeout = batch_seconds + max(60, pool.timeout * 4)
+    lock = queue.redis.lock(f"{queue.namespace}:dispatch:lock", timeout=lock_timeout)
+    if not lock.acquire(blocking=False):
+        return 0
+
+    try:
+        queue.requeue_processing()
+        queue.promote_due()
+        started = monotonic()
+        total = 0
+
+        while monotonic() - started < max_seconds:
+            try:
+                lock.extend(lock_timeout, replace_ttl=True)
+            except LockError:
+                logger.warning("email dispatch lock lost, stopping")
+                break
+            if not (batch := queue.pop_batch(batch_size)):
+                break
+
+            allowed = limiter.acquire(Counter(_domain(message["to"]) for message in batch))
+            sendable, limited = [], []
+            for message in batch:
+                domain = _domain(message["to"])
+                if allowed[domain] > 0:
+                    allowed[domain] -= 1
+                    sendable.append(message)
+                else:
+                    limited.append(message)
+            queue.defer(limited, limiter.next_window())
+
+            result = send_batch(pool, sender, sendable, deadline=monotonic() + batch_seconds)
+            total += len(result.sent)
+            queue.ack(result.sent + result.failed)
+            queue.defer(result.unsent, time())
+
+            for message in result.retry:
+                message["attempts"] += 1
+                if message["attempts"] >= max_attempts:
+                    logger.warning("email to %s dropped after %d attempts", message["to"], message["attempts"])
+                    queue.ack([message])
+                    continue
+                queue.defer([message], time() + retry_delay * 2 ** (message["attempts"] - 1))
+
+        return total
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("email dispatch lock expired before release")
@@ -1,26 +1,64 @@
+from contextlib import asynccontextmanager
+import os
+import tempfile
+
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import uvicorn
 
+from admin.router import router as admin_router
+from admin.service import shutdown_import_hash_executor
 from auth.router import router as auth_router
 from member.router import router as member_router
 from post.router import router as post_router
 from comment.router import router as comment_router
+from auth.service import hash_executor, token_denylist
+from config import get_settings
+from database import engine, replica_pool
+from dependencies import token_cache
+from metrics import CACHE_STATS, mark_process_dead, render_metrics
 from middlewares import get_middleware
+from post.service import post_cache
+from redis_client import redis_client
+from warmup import warmup
 from exception_handler import (
     validation_exception_handler,
     http_exception_handler,
 )
 
+settings = get_settings()
+
+CACHE_STATS.register("post", post_cache.stats)
+CACHE_STATS.register("token", token_cache.stats)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    post_cache.start()
+    token_denylist.start()
+    replica_pool.start()
+    if settings.APP_ENV == "production":
+        await warmup()
+    yield
+    # uvicorn 은 처리 중인 요청이 끝난 뒤(최대 GRACEFUL_SHUTDOWN_TIMEOUT) 종료 단계를 실행한다.
+    await post_cache.stop()
+    await token_denylist.stop()
+    await replica_pool.stop()
+    hash_executor.shutdown(wait=False, cancel_futures=True)
+    shutdown_import_hash_executor()
+    await engine.dispose()
+    await redis_client.aclose()
+    mark_process_dead()
+
 
 app = FastAPI(
-    debug=True,
+    debug=settings.APP_ENV == "development",
     title="Backend Practice",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     middleware=get_middleware(),
-    lifespan=None,
+    lifespan=lifespan,
 )
 
 
@@ -44,20 +82,38 @@ app.include_router(auth_router)
 app.include_router(member_router)
 app.include_router(post_router)
 app.include_router(comment_router)
+app.include_router(admin_router)
 
 
 @app.get("/v1/health")
 def health():
-    from tasks import test_job
-
-    test_job.delay()
     return JSONResponse(content={"message": "ok"}, status_code=status.HTTP_200_OK)
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
+
+
 # 예외 처리 핸들러
 app.add_exception_handler(RequestValidationError, validation_exception_handler)  # type: ignore
 app.add_exception_handler(HTTPException, http_exception_handler)  # type: ignore
 
 
 if __name__ == "__main__":
-    uvicorn.run(app=app, host="0.0.0.0", port=8000, workers=1)
+    if settings.APP_ENV == "production":
+        # 워커별 지표를 /metrics 에서 합산하기 위한 공유 디렉터리
+        os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="prometheus-"))
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=settings.WEB_CONCURRENCY,
+            loop="auto",  # uvloop 이 설치되어 있으면 사용
+            http="auto",  # httptools 가 설치되어 있으면 사용
+            timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_TIMEOUT,
+            access_log=False,
+        )
+    else:
+        uvicorn.run(app=app, host="0.0.0.0", port=8000, workers=1)
@@ -4,10 +4,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 
 from database import AsyncSession
-from dependencies import get_current_user, get_db_session
+from dependencies import get_current_user, get_db_session, get_read_db_session
 from auth.schemas import TokenPayload
 from member.enums import MemberRole
-from member.service import create, get, get_all, update, delete
+from export import ExportFormat, export_response
+from member.service import create, get, get_all, get_all_for_export, update, delete
+from serializers import ResponseSerializer
 from member.schemas import (
     JoinRequest,
     JoinResponse,
@@ -18,6 +20,8 @@ from member.schemas import (
 
 router = APIRouter(prefix="/v1", tags=["member"])
 
+get_members_serializer = ResponseSerializer(List[GetMemberResponse])
+
 
 @router.post("/join", response_model=JoinResponse, status_code=status.HTTP_201_CREATED)
 async def join(
@@ -29,7 +33,7 @@ async def join(
 
 @router.get("/member", response_model=GetMemberResponse, status_code=status.HTTP_200_OK)
 async def get_member(
-    db_session: Annotated[AsyncSession, Depends(get_db_session)],
+    db_session: Annotated[AsyncSession, Depends(get_read_db_session)],
     current_user: Annotated[TokenPayload, Depends(get_current_user)],
 ):
     return await get(db_session, current_user.sub)
@@ -41,7 +45,7 @@ async def get_member(
     status_code=status.HTTP_200_OK,
 )
 async def get_members(
-    db_session: Annotated[AsyncSession, Depends(get_db_session)],
+    db_session: Annotated[AsyncSession, Depends(get_read_db_session)],
     current_user: Annotated[TokenPayload, Depends(get_current_user)],
 ):
     print(current_user.role)
@@ -52,7 +56,21 @@ async def get_members(
             detail=[{"message": "권한이 없습니다."}],
         )
 
-    return await get_all(db_session)
+    return get_members_serializer(await get_all(db_session))
+
+
+@router.get("/members/export", status_code=status.HTTP_200_OK)
+async def export_members(
+    current_user: Annotated[TokenPayload, Depends(get_current_user)],
+    format: ExportFormat = ExportFormat.NDJSON,
+):
+    if current_user.role != MemberRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=[{"message": "권한이 없습니다."}],
+        )
+
+    return export_response(get_all_for_export(), format, filename="members")
 
 
 @router.patch(
@@ -3,49 +3,68 @@ from uuid import uuid4
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, Select, delete as delete_stmt, select, update as update_stmt
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.engine import ScalarResult
 
 from auth.service import hash_password
-from tasks import send_welcome_email_task
-from models import Member
+from config import get_settings
+from likes import recount_like_counts
+from outbox import enqueue_task
+from post.service import post_cache
+from purge import bounded_count
+from tasks import purge_member_task, send_welcome_email_task
+from member.enums import MemberRole
+from models import Comment, CommentLike, Member, Post, PostLike
 from member.schemas import JoinRequest, UpdateMemberRequest
 
+settings = get_settings()
+
+
+async def create(db_session: AsyncSession, join_request: JoinRequest) -> Row:
+    """
+    회원 가입
+
+    이메일 중복 확인과 저장을 INSERT ... ON CONFLICT (email) DO NOTHING RETURNING 한 번으로 처리한다.
+    이메일 유니크 제약으로 확인하므로 동시에 같은 이메일로 가입해도 한 명만 저장된다.
+    환영 메일 작업은 같은 트랜잭션에서 outbox 에 저장되어 커밋된 가입에 대해서만 발송된다.
+
+    Returns:
+        Row: id
+    """
+    hashed_password = await hash_password(join_request.password)
+
+    _member = (
+        await db_session.execute(
+            insert(Member)
+            .values(
+                id=str(uuid4()),
+                email=join_request.email,
+                password=hashed_password,
+                address=join_request.address,
+                name=join_request.name,
+                role=join_request.role or MemberRole.USER,
+                created_at=datetime.now(),
+            )
+            .on_conflict_do_nothing(index_elements=[Member.email])
+            .returning(Member.id)
+        )
+    ).first()
 
-async def create(db_session: AsyncSession, join_request: JoinRequest) -> str:
-    _member = await db_session.scalar(select(Member).where(Member.email == join_request.email))
-
-    if _member:
+    if not _member:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=[{"message": "이미 존재하는 이메일입니다."}],
         )
 
-    hashed_password = hash_password(join_request.password)
-
-    member = Member(
-        id=str(uuid4()),
-        email=join_request.email,
-        password=hashed_password,
-        address=join_request.address,
-        name=join_request.name,
-        created_at=datetime.now(),
-    )
-
-    if join_request.role:
-        member.role = join_request.role
-
-    db_session.add(member)
-    await db_session.flush()
-    await db_session.refresh(member)
-
-    send_welcome_email_task.delay()
+    await enqueue_task(db_session, send_welcome_email_task, join_request.email, join_request.name)
 
-    return member
+    return _member
 
 
 async def get(db_session: AsyncSession, id: str) -> Member:
-    _member = await db_session.scalar(select(Member).where(Member.id == id))
+    _member = await db_session.scalar(select(Member).where(Member.id == id, Member.deleted_at.is_(None)))
 
     if not _member:
         raise HTTPException(
@@ -57,11 +76,40 @@ async def get(db_session: AsyncSession, id: str) -> Member:
 
 
 async def get_all(db_session: AsyncSession) -> ScalarResult[Member]:
-    return await db_session.scalars(select(Member))
+    return await db_session.scalars(select(Member).where(Member.deleted_at.is_(None)))
 
 
-async def update(db_session: AsyncSession, id: str, update_member_request: UpdateMemberRequest) -> Member:
-    _member = await db_session.scalar(select(Member).where(Member.id == id))
+def get_all_for_export() -> Select:
+    """회원 목록 내보내기 쿼리 (비밀번호 제외)"""
+    return select(Member.id, Member.email, Member.address, Member.name, Member.role, Member.created_at).where(
+        Member.deleted_at.is_(None)
+    )
+
+
+async def update(db_session: AsyncSession, id: str, update_member_request: UpdateMemberRequest) -> Row:
+    """
+    회원 정보 수정
+
+    UPDATE ... RETURNING 한 번으로 수정한다. 다른 회원의 이메일로 바꾸면 유니크 제약 위반으로 400 을 반환한다.
+
+    Returns:
+        Row: id
+    """
+    try:
+        _member = (
+            await db_session.execute(
+                update_stmt(Member)
+                .where(Member.id == id, Member.deleted_at.is_(None))
+                .values(**update_member_request.model_dump(exclude_unset=True))
+                .returning(Member.id)
+                .execution_options(synchronize_session=False)
+            )
+        ).first()
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=[{"message": "이미 존재하는 이메일입니다."}],
+        )
 
     if not _member:
         raise HTTPException(
@@ -69,17 +117,52 @@ async def update(db_session: AsyncSession, id: str, update_member_request: Updat
             detail=[{"message": "회원을 찾을 수 없습니다."}],
         )
 
-    for field, value in update_member_request.model_dump(exclude_unset=True).items():
-        setattr(_member, field, value)
-
     await db_session.commit()
-    await db_session.refresh(_member)
 
     return _member
 
 
 async def delete(db_session: AsyncSession, id: str) -> None:
-    _member = await db_session.scalar(select(Member).where(Member.id == id))
+    """
+    회원 탈퇴
+
+    삭제 표시(deleted_at)와 함께 CASCADE 로 지워질 행(작성한 게시물, 댓글과 누른 좋아요, 게시물에 달린 다른 회원의
+    댓글/좋아요, 댓글에 달린 좋아요) 수를 PURGE_SYNC_THRESHOLD 를 넘는지 알 수 있을 만큼만 센다.
+    적으면 누른 좋아요를 지워 대상의 like_count 를 다시 계산한 뒤 회원을 삭제하고,
+    게시물, 댓글 등은 DB 의 ON DELETE CASCADE 로 함께 삭제된다.
+    많으면 삭제 표시와 purge_member_task(outbox)만 커밋하고 작업이 나누어 삭제한다.
+    삭제 표시된 회원과 회원의 게시물, 댓글은 즉시 조회에서 제외된다.
+    캐시된 게시물은 적을 때는 요청 안에서, 많을 때는 purge 작업이 시작하면서 배치로 무효화한다.
+    """
+    limit = settings.PURGE_SYNC_THRESHOLD + 1
+    _member = (
+        await db_session.execute(
+            update_stmt(Member)
+            .where(Member.id == id, Member.deleted_at.is_(None))
+            .values(deleted_at=datetime.now())
+            .returning(
+                Member.id,
+                bounded_count(
+                    limit,
+                    select(Post.id).where(Post.member_id == id),
+                    select(Comment.id).where(Comment.member_id == id),
+                    select(PostLike.post_id).where(PostLike.member_id == id),
+                    select(CommentLike.comment_id).where(CommentLike.member_id == id),
+                    # 회원의 게시물/댓글에 달린 다른 회원의 댓글, 좋아요
+                    select(Comment.id).join(Post, Comment.post_id == Post.id).where(Post.member_id == id),
+                    select(PostLike.member_id).join(Post, PostLike.post_id == Post.id).where(Post.member_id == id),
+                    select(CommentLike.member_id)
+                    .join(Comment, CommentLike.comment_id == Comment.id)
+                    .where(Comment.member_id == id),
+                    select(CommentLike.member_id)
+                    .join(Comment, CommentLike.comment_id == Comment.id)
+                    .join(Post, Comment.post_id == Post.id)
+                    .where(Post.member_id == id),
+                ).label("children"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    ).first()
 
     if not _member:
         raise HTTPException(
@@ -87,4 +170,24 @@ async def delete(db_session: AsyncSession, id: str) -> None:
             detail=[{"message": "회원을 찾을 수 없습니다."}],
         )
 
-    await db_session.delete(_member)
+    if _member.children >= limit:
+        await enqueue_task(db_session, purge_member_task, id)
+        await db_session.commit()
+        return
+
+    # 하위 행이 limit 개 미만이므로 게시물도 그보다 적다.
+    post_ids = list((await db_session.scalars(select(Post.id).where(Post.member_id == id))).all())
+
+    for target, like, like_target_id in (
+        (Post, PostLike, PostLike.post_id),
+        (Comment, CommentLike, CommentLike.comment_id),
+    ):
+        target_ids = (
+            await db_session.scalars(delete_stmt(like).where(like.member_id == id).returning(like_target_id))
+        ).all()
+        if target_ids:
+            await db_session.execute(recount_like_counts(target, like, like_target_id, list(target_ids)))
+
+    await db_session.execute(delete_stmt(Member).where(Member.id == id))
+    await db_session.commit()
+    await post_cache.invalidate_many(post_ids)
@@ -0,0 +1,186 @@
+import os
+from time import perf_counter
+from typing import Callable
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from query_stats import track_queries
+
+# 여러 uvicorn 워커의 지표를 합산하려면 PROMETHEUS_MULTIPROC_DIR 환경 변수를 지정한다.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 요청 수",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+RESPONSES = Counter(
+    "http_responses",
+    "상태 코드별 응답 수",
+    ["method", "route", "status"],
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "응답 본문 크기",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "요청당 실행한 쿼리 수",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "요청당 쿼리 실행 시간 합계",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 캐시 stats() 의 적중 횟수 키 -> tier 라벨
+CACHE_HIT_TIERS = {"hits": "local", "local_hits": "local", "remote_hits": "remote"}
+
+
+class CacheStatsCollector:
+    """
+    프로세스 내 캐시 통계 수집기
+
+    등록한 캐시의 stats() 를 /metrics 요청 시점에 읽어 적중/미스/제거 횟수, 항목 수, 적중률로 내보낸다.
+    캐시 통계는 워커별 값이므로 멀티 프로세스 모드에서는 pid 라벨을 붙여 응답한 워커의 값임을 표시한다.
+    """
+
+    def __init__(self):
+        self._caches: dict[str, Callable[[], dict]] = {}
+
+    def register(self, name: str, stats: Callable[[], dict]) -> None:
+        self._caches[name] = stats
+
+    def collect(self):
+        labels = ["cache", "pid"] if MULTIPROCESS else ["cache"]
+        extra = [str(os.getpid())] if MULTIPROCESS else []
+        hits = CounterMetricFamily("cache_hits", "캐시 적중 횟수", labels=[*labels, "tier"])
+        misses = CounterMetricFamily("cache_misses", "캐시 미스 횟수", labels=labels)
+        evictions = CounterMetricFamily("cache_evictions", "용량 초과로 제거한 항목 수", labels=labels)
+        size = GaugeMetricFamily("cache_size", "프로세스 내 캐시 항목 수", labels=labels)
+        hit_rate = GaugeMetricFamily("cache_hit_rate", "캐시 적중률", labels=labels)
+
+        for name, stats in self._caches.items():
+            values = stats()
+            for key, tier in CACHE_HIT_TIERS.items():
+                if key in values:
+                    hits.add_metric([name, *extra, tier], values[key])
+            misses.add_metric([name, *extra], values["misses"])
+            evictions.add_metric([name, *extra], values["evictions"])
+            size.add_metric([name, *extra], values["size"])
+            hit_rate.add_metric([name, *extra], values["hit_rate"])
+
+        yield from (hits, misses, evictions, size, hit_rate)
+
+
+CACHE_STATS = CacheStatsCollector()
+REGISTRY.register(CACHE_STATS)
+
+
+class MetricsMiddleware:
+    """
+    요청 지표 수집 미들웨어
+
+    라우트 템플릿(예: /v1/post/{id}) 단위로 처리 시간, 처리 중인 요청 수, 상태 코드별 응답 수,
+    응답 크기, 쿼리 수와 쿼리 실행 시간을 기록하고 Server-Timing 헤더에 처리 시간과 쿼리 시간을 추가한다.
+    요청마다 비용을 최소화하기 위해 순수 ASGI 미들웨어로 구현하고 라벨별 지표 객체를 캐시한다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._in_progress = {}
+        self._route_metrics = {}
+        self._responses = {}
+
+    def _get_route_metrics(self, method: str, route: str):
+        key = (method, route)
+        metrics = self._route_metrics.get(key)
+        if metrics is None:
+            metrics = self._route_metrics[key] = (
+                REQUEST_DURATION.labels(method, route),
+                RESPONSE_SIZE.labels(method, route),
+                DB_QUERIES.labels(method, route),
+                DB_DURATION.labels(method, route),
+            )
+        return metrics
+
+    def _get_responses(self, method: str, route: str, status: int):
+        key = (method, route, status)
+        counter = self._responses.get(key)
+        if counter is None:
+            counter = self._responses[key] = RESPONSES.labels(method, route, str(status))
+        return counter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_progress = self._in_progress.get(method)
+        if in_progress is None:
+            in_progress = self._in_progress[method] = REQUESTS_IN_PROGRESS.labels(method)
+
+        started = perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                duration = (perf_counter() - started) * 1000
+                server_timing = f'app;dur={duration:.1f}, db;desc="{queries.count} queries";dur={queries.duration * 1000:.1f}'
+                message["headers"] = [*message.get("headers", []), (b"server-timing", server_timing.encode())]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress.inc()
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                in_progress.dec()
+                route = scope.get("route")
+                route = route.path if route is not None else UNMATCHED_ROUTE
+                duration, response_size, db_queries, db_duration = self._get_route_metrics(method, route)
+                duration.observe(perf_counter() - started)
+                response_size.observe(size)
+                db_queries.observe(queries.count)
+                db_duration.observe(queries.duration)
+                self._get_responses(method, route, status).inc()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus 텍스트 형식 지표 (멀티 프로세스 모드면 모든 워커 합산)"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(CACHE_STATS)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """워커 종료 시 해당 프로세스의 livesum 게이지 정리"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
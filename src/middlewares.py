@@ -1,10 +1,49 @@
 from typing import Sequence
 
 from fastapi.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import get_settings
+from dependencies import PRIMARY_PIN_COOKIE
+from metrics import MetricsMiddleware
+
+settings = get_settings()
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 요청 후 읽기를 기본 DB 로 고정하는 미들웨어
+
+    성공한 쓰기 요청(GET/HEAD/OPTIONS 이외) 응답에 READ_YOUR_WRITES_WINDOW 동안 유지되는 쿠키를 설정한다.
+    get_read_db_session 은 이 쿠키가 있으면 복제 지연과 관계없이 기본 DB 에서 읽는다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.cookie = (
+            f"{PRIMARY_PIN_COOKIE}=1; Max-Age={settings.READ_YOUR_WRITES_WINDOW}; Path=/; HttpOnly; SameSite=lax"
+        ).encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", self.cookie)]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
 def get_middleware() -> Sequence[Middleware]:
     """
     미들웨어 목록 반환
     """
-    return []
+    middleware = [Middleware(MetricsMiddleware)]
+    if settings.POSTGRESQL_REPLICA_HOSTS:
+        middleware.append(Middleware(ReadYourWritesMiddleware))
+    return middleware
@@ -1,9 +1,11 @@
 from datetime import datetime
 
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import Computed, String, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
+from db_types import ULIDType, UUIDType
 from member.enums import MemberRole
 
 
@@ -18,20 +20,23 @@ class Member(Base):
     name: 이름
     role: 권한
     created_at: 생성일시
+    deleted_at: 삭제일시 (삭제 표시 후 purge 작업이 실제로 삭제하기 전까지 조회에서 제외)
     """
 
     __tablename__ = "member"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)  # UUID
-    email: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    id: Mapped[str] = mapped_column(UUIDType, primary_key=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     password: Mapped[str] = mapped_column(String(255), nullable=False)
     address: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str] = mapped_column(String(30), nullable=False)
     role: Mapped[MemberRole] = mapped_column(nullable=False, default=MemberRole.USER)
     created_at: Mapped[datetime] = mapped_column(nullable=False)
+    deleted_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
-    posts: Mapped["Post"] = relationship(back_populates="member", cascade="all, delete")
-    comments: Mapped["Comment"] = relationship(back_populates="member", cascade="all, delete")
+    # 하위 행은 DB 의 ON DELETE CASCADE 로 삭제한다 (ORM 이 하위 행을 읽어 하나씩 지우지 않는다).
+    posts: Mapped["Post"] = relationship(back_populates="member", cascade="all, delete", passive_deletes=True)
+    comments: Mapped["Comment"] = relationship(back_populates="member", cascade="all, delete", passive_deletes=True)
 
 
 class Post(Base):
@@ -45,20 +50,38 @@ class Post(Base):
     like_count: 좋아요 수
     created_at: 생성일시
     updated_at: 수정일시
+    deleted_at: 삭제일시 (삭제 표시 후 purge 작업이 실제로 삭제하기 전까지 조회에서 제외)
+    search_vector: 검색용 tsvector (제목 가중치 A, 내용 가중치 B)
     """
 
     __tablename__ = "post"
-
-    id: Mapped[str] = mapped_column(String(26), primary_key=True)  # ULID
-    member_id: Mapped[str] = mapped_column(String(36), ForeignKey("member.id"), nullable=False)
+    __table_args__ = (
+        Index("ix_post_search_vector", "search_vector", postgresql_using="gin"),
+        # ULID 시간 부분 기준 월 단위 파티션 (partitions.py)
+        {"postgresql_partition_by": "RANGE (id)"},
+    )
+
+    id: Mapped[str] = mapped_column(ULIDType, primary_key=True)
+    member_id: Mapped[str] = mapped_column(
+        UUIDType, ForeignKey("member.id", ondelete="CASCADE"), index=True, nullable=False
+    )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     like_count: Mapped[int] = mapped_column(nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(nullable=False)
     updated_at: Mapped[datetime] = mapped_column(nullable=False)
+    deleted_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', content), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     member: Mapped["Member"] = relationship(back_populates="posts")
-    comments: Mapped["Comment"] = relationship(back_populates="post", cascade="all, delete")
+    comments: Mapped["Comment"] = relationship(back_populates="post", cascade="all, delete", passive_deletes=True)
 
 
 class PostLike(Base):
@@ -71,16 +94,26 @@ class PostLike(Base):
 
     __tablename__ = "post_like"
 
-    post_id: Mapped[str] = mapped_column(String(26), ForeignKey("post.id"), primary_key=True)
-    member_id: Mapped[str] = mapped_column(String(26), ForeignKey("member.id"), primary_key=True)
+    post_id: Mapped[str] = mapped_column(ULIDType, ForeignKey("post.id", ondelete="CASCADE"), primary_key=True)
+    member_id: Mapped[str] = mapped_column(
+        UUIDType, ForeignKey("member.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
 
 
 class Comment(Base):
     __tablename__ = "comment"
-
-    id: Mapped[str] = mapped_column(String(26), primary_key=True)  # ULID
-    member_id: Mapped[str] = mapped_column(String(36), ForeignKey("member.id"), nullable=False)
-    post_id: Mapped[str] = mapped_column(String(26), ForeignKey("post.id"), nullable=False, index=True)
+    __table_args__ = (
+        # 게시물별 댓글 목록을 id(ULID) 순으로 범위 탐색하기 위한 복합 인덱스
+        Index("ix_comment_post_id_id", "post_id", "id"),
+        # ULID 시간 부분 기준 월 단위 파티션 (partitions.py)
+        {"postgresql_partition_by": "RANGE (id)"},
+    )
+
+    id: Mapped[str] = mapped_column(ULIDType, primary_key=True)
+    member_id: Mapped[str] = mapped_column(
+        UUIDType, ForeignKey("member.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    post_id: Mapped[str] = mapped_column(ULIDType, ForeignKey("post.id", ondelete="CASCADE"), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     like_count: Mapped[int] = mapped_column(nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(nullable=False)
@@ -93,5 +126,29 @@ class Comment(Base):
 class CommentLike(Base):
     __tablename__ = "comment_like"
 
-    comment_id: Mapped[str] = mapped_column(String(26), ForeignKey("comment.id"), primary_key=True)
-    member_id: Mapped[str] = mapped_column(String(26), ForeignKey("member.id"), primary_key=True)
+    comment_id: Mapped[str] = mapped_column(
+        ULIDType, ForeignKey("comment.id", ondelete="CASCADE"), primary_key=True
+    )
+    member_id: Mapped[str] = mapped_column(
+        UUIDType, ForeignKey("member.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+
+
+class OutboxMessage(Base):
+    """
+    트랜잭션 아웃박스
+
+    도메인 변경과 같은 트랜잭션에 저장하고, 릴레이(outbox.py)가 Celery 로 발행한 뒤 삭제한다.
+
+    id: 메시지 식별자 (ULID, 발행 순서)
+    task: Celery 작업 이름
+    args: 작업 인자
+    created_at: 생성일시
+    """
+
+    __tablename__ = "outbox"
+
+    id: Mapped[str] = mapped_column(ULIDType, primary_key=True)
+    task: Mapped[str] = mapped_column(String(255), nullable=False)
+    args: Mapped[list] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
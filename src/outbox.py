@@ -0,0 +1,102 @@
+"""
+트랜잭션 아웃박스
+
+요청 처리 중에는 브로커에 직접 발행하지 않고, 도메인 변경과 같은 트랜잭션에 outbox 행을 저장한다(enqueue_task).
+트랜잭션이 롤백되면 작업도 함께 사라지고, 브로커 장애나 지연이 요청 처리로 이어지지 않는다.
+릴레이 프로세스가 outbox 를 배치로 가져와 Celery 로 발행하고 같은 트랜잭션에서 삭제한다.
+
+    $ python -m outbox
+"""
+
+import logging
+import signal
+from datetime import datetime
+from threading import Event
+
+from celery import Celery, Task
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from ulid import ULID
+
+from models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+async def enqueue_task(db_session: AsyncSession, task: Task, *args) -> None:
+    """
+    작업을 outbox 에 저장
+
+    세션의 트랜잭션이 커밋되어야 릴레이가 발행한다.
+
+    Args:
+        task: Celery 작업
+        args: 작업 인자 (JSON 으로 직렬화 가능한 값)
+    """
+    await db_session.execute(
+        insert(OutboxMessage).values(id=str(ULID()), task=task.name, args=list(args), created_at=datetime.now())
+    )
+
+
+def relay_outbox(session: Session, app: Celery, batch_size: int) -> int:
+    """
+    outbox 메시지를 batch_size 개씩 Celery 로 발행
+
+    FOR UPDATE SKIP LOCKED 로 가져와 삭제하므로 릴레이를 여러 개 실행하면 서로 다른 메시지를 나누어 발행한다.
+    배치는 하나의 브로커 커넥션으로 발행하고, 발행이 끝난 뒤 커밋한다.
+    발행 도중 실패하면 롤백되어 배치 전체가 다시 발행된다 (최소 한 번 전달).
+
+    Returns:
+        int: 발행한 메시지 수
+    """
+    batch = (
+        select(OutboxMessage.id).order_by(OutboxMessage.id).limit(batch_size).with_for_update(skip_locked=True)
+    )
+    messages = session.execute(
+        delete(OutboxMessage)
+        .where(OutboxMessage.id.in_(batch))
+        .returning(OutboxMessage.id, OutboxMessage.task, OutboxMessage.args)
+    ).all()
+
+    if messages:
+        with app.producer_or_acquire() as producer:
+            for message in sorted(messages):
+                app.send_task(message.task, args=message.args, producer=producer)
+    session.commit()
+    return len(messages)
+
+
+def run_relay(session: Session, app: Celery, batch_size: int, interval: float, stop: Event) -> None:
+    """
+    stop 이 설정될 때까지 outbox 발행
+
+    가득 찬 배치를 발행했으면 바로 다음 배치를 가져오고, 아니면 interval 만큼 기다린다.
+    DB/브로커 오류는 기록 후 interval 뒤에 다시 시도한다.
+    """
+    while not stop.is_set():
+        try:
+            relayed = relay_outbox(session, app, batch_size)
+        except Exception:
+            logger.exception("outbox relay failed")
+            session.rollback()
+            relayed = 0
+
+        if relayed < batch_size:
+            stop.wait(interval)
+
+
+if __name__ == "__main__":
+    from config import get_settings
+    from database import SyncSessionLocal
+    from tasks import app
+
+    settings = get_settings()
+    logging.basicConfig(level=logging.INFO)
+
+    stop = Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    with SyncSessionLocal() as session:
+        run_relay(session, app, settings.OUTBOX_RELAY_BATCH_SIZE, settings.OUTBOX_RELAY_INTERVAL, stop)
@@ -0,0 +1,81 @@
+from enum import StrEnum
+from operator import attrgetter
+from typing import Any, Callable, Generic, List, Sequence, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+# ULID 문자열 (Crockford Base32, 26자)
+ULID_PATTERN = r"^[0-9A-HJKMNP-TV-Z]{26}$"
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class SortOrder(StrEnum):
+    """
+    정렬 순서
+
+    DESC: 최신순
+    ASC: 오래된순
+    """
+
+    DESC = "desc"
+    ASC = "asc"
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """커서 기반 페이지 응답 구조"""
+
+    items: List[T]
+    next_cursor: str | None = None
+
+
+def apply_cursor(stmt: Select, key: InstrumentedAttribute, after: str | None, limit: int, order: SortOrder) -> Select:
+    """
+    키셋 페이지네이션 조건 적용
+
+    OFFSET 대신 커서 이후의 key 범위만 조회하고, 다음 페이지 판단을 위해 limit + 1 개를 조회한다.
+
+    Args:
+        stmt: 조회 쿼리
+        key: 정렬 및 커서 기준 컬럼 (ULID)
+        after: 이전 페이지의 next_cursor
+        limit: 페이지 크기
+        order: 정렬 순서
+
+    Returns:
+        Select: 커서 조건이 적용된 쿼리
+    """
+    if order == SortOrder.DESC:
+        if after:
+            stmt = stmt.where(key < after)
+        stmt = stmt.order_by(key.desc())
+    else:
+        if after:
+            stmt = stmt.where(key > after)
+        stmt = stmt.order_by(key.asc())
+
+    return stmt.limit(limit + 1)
+
+
+def build_page(rows: Sequence[Any], limit: int, cursor: Callable[[Any], str] = attrgetter("id")) -> dict:
+    """
+    커서 페이지 구성
+
+    limit + 1 개를 조회한 결과에서 다음 페이지 존재 여부를 판단한다.
+
+    Args:
+        rows: limit + 1 개까지 조회된 행 목록
+        limit: 페이지 크기
+        cursor: 행에서 다음 페이지 커서를 만드는 함수 (기본값: id)
+
+    Returns:
+        dict: items, next_cursor
+    """
+    items = list(rows[:limit])
+    next_cursor = cursor(items[-1]) if len(rows) > limit else None
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,263 @@
+"""
+게시물/댓글 월 단위 파티션 관리
+
+post, comment 는 ULID 기본키(id, uuid 로 저장)로 범위 파티셔닝한다. ULID 앞 10자리가 생성 시각이므로 id 범위가 곧 생성 월이고,
+기본키/외래키/키셋 커서를 바꾸지 않고도 id 조건으로 파티션이 제외(pruning)된다.
+
+- 신규 DB: 배포 시 서버를 시작하기 전에 `python -m partitions` 로 이번 달부터의 파티션과 DEFAULT 파티션을 만든다.
+- 기존 DB: 마이그레이션에서 PARTITIONED_TABLES 순서로 add_legacy_bound(autocommit_block 안에서) 후 convert_to_partitioned 호출
+- 이후 maintain_partitions_task 가 매일(그리고 beat 시작 시) 다음 파티션을 미리 만들고 보관 기간이 지난 파티션을 분리한다.
+  전환 전 기존 테이블({table}_legacy)도 상한 경계가 보관 기간을 지나면 월 파티션과 같이 분리된다.
+
+    $ python -m partitions
+"""
+
+import logging
+import re
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import DBAPIError
+from ulid import ULID
+
+logger = logging.getLogger(__name__)
+
+# ULID 기본키의 시간 부분으로 월 단위 범위 파티셔닝하는 테이블 (참조되는 테이블이 먼저 오도록 정렬)
+PARTITIONED_TABLES = ("post", "comment")
+
+# 파티션 생성/분리를 한 번에 하나만 실행하기 위한 advisory lock 키
+PARTITION_LOCK_KEY = 4_817_302
+
+# 파티션 범위의 상한 ("FOR VALUES FROM (...) TO ('<uuid>')")
+PARTITION_UPPER_BOUND = re.compile(r"TO \('([0-9a-f-]{36})'\)")
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_boundary(month: date) -> str:
+    """해당 월 1일 0시(UTC)에 만들어진 가장 작은 ULID"""
+    ms = int(datetime(month.year, month.month, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    return str(ULID.from_bytes(ms.to_bytes(6, "big") + bytes(10)))
+
+
+def _bound(month: date) -> str:
+    """파티션 범위 경계 (id 는 uuid 컬럼에 저장되므로 month_boundary 를 uuid 로 변환)"""
+    return str(ULID.from_str(month_boundary(month)).to_uuid())
+
+
+def partition_floor(id: str) -> str | None:
+    """
+    ULID 가 속한 월 파티션의 하한
+
+    다른 ULID 보다 나중에 만들어지는 행(게시물 이후의 댓글 등)을 조회할 때 조건에 넣으면
+    그 이전 월의 파티션을 읽지 않는다. 올바른 ULID 가 아니면 None 을 반환한다.
+    """
+    try:
+        created = ULID.from_str(id).datetime
+    except ValueError:
+        return None
+    return month_boundary(date(created.year, created.month, 1))
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def _partitions(connection: Connection, table: str) -> list[str]:
+    return connection.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    ).all()
+
+
+def _lock(connection: Connection) -> None:
+    """트랜잭션이 끝날 때까지 다른 파티션 생성/분리를 기다리게 한다."""
+    connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+
+def create_partitions(connection: Connection, table: str, start: date, months: int) -> list[str]:
+    """
+    start 가 속한 월부터 months 개월의 파티션과 DEFAULT 파티션 생성 (이미 있으면 건너뜀)
+
+    이미 있는 파티션은 DDL 을 실행하지 않으므로 부모 테이블을 잠그지 않는다.
+    범위를 벗어난 id(오래된 created_at 으로 가져온 행 등)는 DEFAULT 파티션에 저장된다.
+    다른 파티션(전환 전 기존 테이블 등)이 이미 범위를 포함하거나 DEFAULT 파티션에 범위 안의 행이 있으면 건너뛴다.
+
+    Returns:
+        list[str]: 만들었거나 이미 있던 파티션 이름
+    """
+    existing = set(_partitions(connection, table))
+    if f"{table}_default" not in existing:
+        connection.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+
+    names = []
+    month = start.replace(day=1)
+    for _ in range(months):
+        name = partition_name(table, month)
+        if name in existing:
+            names.append(name)
+            month = add_months(month, 1)
+            continue
+        try:
+            with connection.begin_nested():
+                connection.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                        f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+                    )
+                )
+            names.append(name)
+        except DBAPIError:
+            logger.warning("partition %s could not be created", name, exc_info=True)
+        month = add_months(month, 1)
+    return names
+
+
+def detach_partitions(connection: Connection, table: str, before: date, archive_schema: str) -> list[str]:
+    """
+    범위 전체가 before 가 속한 월보다 이전인 파티션을 분리해 archive_schema 로 옮긴다.
+
+    파티션 이름이 아니라 범위의 상한으로 판단하므로 전환 전 기존 테이블({table}_legacy)도 함께 분리된다.
+    분리된 테이블은 조회 대상에서 빠지고 그대로 보관되므로 덤프 후 삭제하거나 다시 붙일 수 있다.
+    다른 테이블에서 참조하는 행이 남아 있으면 분리할 수 없으므로 건너뛴다.
+
+    Returns:
+        list[str]: 분리한 파티션 이름
+    """
+    cutoff = UUID(_bound(before))
+    partitions = connection.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    ).all()
+
+    connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+
+    detached = []
+    for name, bound in sorted(partitions):
+        matched = PARTITION_UPPER_BOUND.search(bound)
+        if not matched or UUID(matched.group(1)) > cutoff:
+            continue
+
+        try:
+            with connection.begin_nested():
+                connection.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                connection.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+        except DBAPIError:
+            logger.warning("partition %s could not be detached", name, exc_info=True)
+            continue
+        detached.append(name)
+    return detached
+
+
+def ensure_partitions(connection: Connection, premake_months: int) -> None:
+    """
+    이번 달부터 premake_months 개월의 파티션과 DEFAULT 파티션이 있도록 보장 (배포 시 `python -m partitions`)
+
+    서버가 쓰기를 받기 전에 실행해 beat 의 첫 maintain_partitions_task 전에도 INSERT 가 실패하지 않도록 한다.
+    """
+    _lock(connection)
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    for table in PARTITIONED_TABLES:
+        create_partitions(connection, table, this_month, premake_months + 1)
+
+
+def maintain_partitions(
+    connection: Connection, premake_months: int, retention_months: int | None, archive_schema: str
+) -> None:
+    """이번 달부터 premake_months 개월의 파티션을 만들고, 보관 기간이 지난 파티션을 분리"""
+    _lock(connection)
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    for table in PARTITIONED_TABLES:
+        create_partitions(connection, table, this_month, premake_months + 1)
+        if retention_months is not None:
+            detach_partitions(connection, table, add_months(this_month, -retention_months), archive_schema)
+
+
+def _legacy_bound_name(table: str) -> str:
+    return f"{table}_legacy_bound"
+
+
+def add_legacy_bound(connection: Connection, table: str, until: date) -> None:
+    """
+    전환 전 기존 테이블에 id 상한 CHECK 제약 추가 (op.get_context().autocommit_block() 안에서 호출)
+
+    NOT VALID 로 추가한 뒤 따로 검증하므로 검증하는 동안 쓰기를 막지 않는다.
+    검증된 제약이 있으면 convert_to_partitioned 의 ATTACH PARTITION 이 테이블을 다시 읽지 않는다.
+    추가 이후에는 until 이후의 id 를 쓸 수 없으므로 until 은 다음 달 1일로 정하고 그 전에 전환한다.
+    """
+    name = _legacy_bound_name(table)
+    connection.execute(
+        text(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK (id < '{_bound(until)}') NOT VALID")
+    )
+    connection.execute(text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}"))
+
+
+def convert_to_partitioned(connection: Connection, table: str, until: date, premake_months: int) -> None:
+    """
+    기존 테이블을 월 단위 파티션 테이블로 전환 (Alembic 마이그레이션에서 op.get_bind() 로 호출)
+
+    기존 테이블을 {table}_legacy 로 바꾸고, 모델 정의대로 파티션 부모 테이블을 만든 뒤
+    기존 테이블을 until 이전 범위의 파티션으로 붙인다. 행을 복사하지 않고, add_legacy_bound 로 검증된
+    CHECK 제약 덕분에 범위 확인도 테이블을 읽지 않으므로 테이블 크기와 무관하게 빠르다.
+    기존 테이블을 참조하던 외래키는 부모 테이블을 참조하도록 다시 만든다.
+    참조되는 테이블부터 전환해야 한다 (PARTITIONED_TABLES 순서).
+
+    legacy 파티션은 until 이전의 모든 행을 담으며, until 이 보관 기간을 지나면 detach_partitions 가 통째로 분리한다.
+    """
+    from database import Base
+
+    legacy = f"{table}_legacy"
+
+    # 기존 테이블을 참조하는 외래키
+    references = connection.execute(
+        text(
+            "SELECT conname, conrelid::regclass::text, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE contype = 'f' AND confrelid = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    ).all()
+    for name, referencing, _ in references:
+        connection.execute(text(f"ALTER TABLE {referencing} DROP CONSTRAINT {name}"))
+
+    # 부모 테이블이 같은 이름의 인덱스를 만들 수 있도록 기존 인덱스 이름 변경
+    indexes = connection.scalars(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": table}
+    ).all()
+    connection.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+    for index in indexes:
+        connection.execute(text(f"ALTER INDEX {index} RENAME TO {index}_legacy"))
+
+    Base.metadata.tables[table].create(connection)
+    connection.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{_bound(until)}')"
+        )
+    )
+    # 파티션 범위와 같은 조건이므로 더 이상 필요 없다.
+    connection.execute(text(f"ALTER TABLE {legacy} DROP CONSTRAINT {_legacy_bound_name(table)}"))
+    create_partitions(connection, table, until, premake_months)
+
+    for name, referencing, definition in references:
+        connection.execute(text(f"ALTER TABLE {referencing} ADD CONSTRAINT {name} {definition}"))
+
+
+if __name__ == "__main__":
+    from config import get_settings
+    from database import sync_engine
+
+    settings = get_settings()
+    logging.basicConfig(level=logging.INFO)
+
+    with sync_engine.begin() as connection:
+        ensure_partitions(connection, settings.PARTITION_PREMAKE_MONTHS)
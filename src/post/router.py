@@ -1,22 +1,31 @@
-from typing import Annotated, List
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from auth.schemas import TokenPayload
 from database import AsyncSession
-from dependencies import get_current_user, get_db_session
-from post.service import create, get, get_all, update, delete, update_post_like
+from dependencies import get_current_user, get_db_session, get_primary_read_db_session, get_read_db_session
+from pagination import CursorPage, SortOrder, ULID_PATTERN, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from serializers import JSONBytesResponse, ResponseSerializer
+from export import ExportFormat, export_response
+from member.enums import MemberRole
+from post.service import create, get, get_all, get_all_for_export, search, update, delete, update_post_like
 from post.schemas import (
     CreatePostRequest,
     CreatePostResponse,
     GetPostResponse,
     GetPostListResponse,
+    PostLikeResponse,
+    SearchPostResponse,
     UpdatePostRequest,
     UpdatePostResponse,
 )
 
 router = APIRouter(prefix="/v1", tags=["posts"])
 
+get_posts_serializer = ResponseSerializer(CursorPage[GetPostListResponse])
+search_posts_serializer = ResponseSerializer(CursorPage[SearchPostResponse])
+
 
 @router.post("/post", response_model=CreatePostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
@@ -29,13 +38,42 @@ async def create_post(
 
 
 @router.get("/post/{id}", response_model=GetPostResponse, status_code=status.HTTP_200_OK)
-async def get_post(db_session: Annotated[AsyncSession, Depends(get_db_session)], id: str):
-    return await get(db_session, id)
+async def get_post(db_session: Annotated[AsyncSession, Depends(get_primary_read_db_session)], id: str):
+    return JSONBytesResponse(await get(db_session, id))
+
+
+@router.get("/posts", response_model=CursorPage[GetPostListResponse], status_code=status.HTTP_200_OK)
+async def get_posts(
+    db_session: Annotated[AsyncSession, Depends(get_read_db_session)],
+    after: Annotated[str | None, Query(pattern=ULID_PATTERN)] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    order: SortOrder = SortOrder.DESC,
+):
+    return get_posts_serializer(await get_all(db_session, after, limit, order))
+
 
+@router.get("/posts/search", response_model=CursorPage[SearchPostResponse], status_code=status.HTTP_200_OK)
+async def search_posts(
+    db_session: Annotated[AsyncSession, Depends(get_read_db_session)],
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    after: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    return search_posts_serializer(await search(db_session, q, after, limit))
+
+
+@router.get("/posts/export", status_code=status.HTTP_200_OK)
+async def export_posts(
+    current_user: Annotated[TokenPayload, Depends(get_current_user)],
+    format: ExportFormat = ExportFormat.NDJSON,
+):
+    if current_user.role != MemberRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=[{"message": "권한이 없습니다."}],
+        )
 
-@router.get("/posts", response_model=List[GetPostListResponse], status_code=status.HTTP_200_OK)
-async def get_posts(db_session: Annotated[AsyncSession, Depends(get_db_session)]):
-    return await get_all(db_session)
+    return export_response(get_all_for_export(), format, filename="posts")
 
 
 @router.put("/post/{id}", response_model=UpdatePostResponse, status_code=status.HTTP_200_OK)
@@ -58,7 +96,7 @@ async def delete_post(
     return await delete(db_session, id, current_user.sub)
 
 
-@router.post("/post/{id}/like", status_code=status.HTTP_200_OK)
+@router.post("/post/{id}/like", response_model=PostLikeResponse, status_code=status.HTTP_200_OK)
 async def click_post_like(
     db_session: Annotated[AsyncSession, Depends(get_db_session)],
     current_user: Annotated[TokenPayload, Depends(get_current_user)],
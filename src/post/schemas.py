@@ -49,3 +49,21 @@ class GetPostListResponse(BaseModel):
     publisher_name: str
     title: str
     created_at: datetime
+
+
+class PostLikeResponse(BaseModel):
+    """게시물 좋아요 응답 구조"""
+
+    liked: bool
+    like_count: int
+
+
+class SearchPostResponse(BaseModel):
+    """게시물 검색 응답 구조"""
+
+    id: str
+    publisher_name: str
+    title: str
+    snippet: str
+    rank: float
+    created_at: datetime
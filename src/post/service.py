@@ -1,95 +1,311 @@
+import base64
+import html
 from datetime import datetime
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.engine import ScalarResult
+from sqlalchemy import Float, Row, Select, delete as delete_stmt, func, insert, literal, select, tuple_, update as update_stmt
 from ulid import ULID
 
-from post.schemas import CreatePostRequest, UpdatePostRequest
-from models import Post, PostLike
+from cache import TwoTierCache
+from config import get_settings
+from likes import LikeDeltaBuffer, apply_like_delta, toggle_like
+from pagination import SortOrder, apply_cursor, build_page
+from serializers import ResponseSerializer
+from post.schemas import CreatePostRequest, GetPostResponse, UpdatePostRequest
+from models import Comment, CommentLike, Member, Post, PostLike
+from outbox import enqueue_task
+from purge import bounded_count
+from redis_client import redis_client
+from tasks import purge_post_task
 
+settings = get_settings()
 
-async def create(db_session: AsyncSession, create_post_request: CreatePostRequest):
-    post = Post(
-        id=str(ULID()),
-        member_id=create_post_request.publisher_id,
-        title=create_post_request.title,
-        content=create_post_request.content,
-        like_count=0,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+post_serializer = ResponseSerializer(GetPostResponse)
 
-    db_session.add(post)
-    await db_session.flush()
-    await db_session.refresh(post)
-    return post
+# 게시물 단건 조회 응답 캐시 (게시물 id -> 직렬화된 GetPostResponse)
+post_cache = TwoTierCache(
+    redis_client,
+    namespace="post",
+    maxsize=settings.POST_CACHE_SIZE,
+    local_ttl=settings.POST_CACHE_LOCAL_TTL,
+    remote_ttl=settings.POST_CACHE_REMOTE_TTL,
+)
 
+# write-behind 모드에서 게시물 좋아요 수 증감을 모아두는 버퍼
+post_like_buffer = LikeDeltaBuffer(redis_client, "post") if settings.LIKE_COUNT_MODE == "write_behind" else None
 
-async def get(db_session: AsyncSession, id: str):
-    _post = await db_session.scalar(select(Post).where(Post.id == id))
+# 삭제 표시되지 않은 게시물과 작성자 (Member 를 조인한 조회에서 사용)
+VISIBLE = (Post.deleted_at.is_(None), Member.deleted_at.is_(None))
 
-    if not _post:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "게시물을 찾을 수 없습니다."}])
+# 작성자가 삭제 표시되지 않은 게시물 (Member 를 조인하지 않는 조회에서 사용)
+AUTHOR_VISIBLE = select(Member.id).where(Member.id == Post.member_id, Member.deleted_at.is_(None)).exists()
 
-    return _post
 
+async def create(db_session: AsyncSession, create_post_request: CreatePostRequest) -> Row:
+    """
+    게시물 생성
+
+    INSERT ... RETURNING 한 번으로 저장한다.
+
+    Returns:
+        Row: id
+    """
+    now = datetime.now()
+    return (
+        await db_session.execute(
+            insert(Post)
+            .values(
+                id=str(ULID()),
+                member_id=create_post_request.publisher_id,
+                title=create_post_request.title,
+                content=create_post_request.content,
+                like_count=0,
+                created_at=now,
+                updated_at=now,
+            )
+            .returning(Post.id)
+        )
+    ).one()
 
-async def get_all(db_session: AsyncSession) -> ScalarResult[Post]:
-    return await db_session.scalars(select(Post))
 
+async def get(db_session: AsyncSession, id: str) -> bytes:
+    """
+    게시물 조회
 
-async def update(db_session: AsyncSession, id: str, update_post_request: UpdatePostRequest) -> Post:
-    _post = await db_session.scalar(select(Post).where(Post.id == id))
+    프로세스 내 캐시 -> Redis -> DB 순으로 조회하고, DB 에서 읽은 결과는 두 캐시에 저장한다.
+    DB 에서 읽는 동안 수정/삭제로 무효화되었거나 Redis 에 접근할 수 없으면 읽은 결과를 저장하지 않는다.
+
+    Returns:
+        bytes: 직렬화된 GetPostResponse
+    """
+    cached, generation = await post_cache.lookup(id)
+    if cached is not None:
+        return cached
+
+    _post = (
+        await db_session.execute(
+            select(
+                Post.id,
+                Member.name.label("publisher_name"),
+                Post.title,
+                Post.content,
+                Post.created_at,
+                Post.updated_at,
+            )
+            .join(Member, Post.member_id == Member.id)
+            .where(Post.id == id, *VISIBLE)
+        )
+    ).first()
 
     if not _post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "게시물을 찾을 수 없습니다."}])
 
-    if _post.member_id != update_post_request.publisher_id:
+    post = post_serializer.dump_json(_post)
+    if generation is not None:
+        await post_cache.set(id, post, generation)
+    return post
+
+
+async def get_all(db_session: AsyncSession, after: str | None, limit: int, order: SortOrder) -> dict:
+    """
+    게시물 목록 조회
+
+    ULID 기본키가 시간순으로 정렬된다는 점을 이용한 키셋 페이지네이션.
+    OFFSET 없이 기본키 인덱스 범위 탐색만 하므로 페이지 깊이와 무관하게 비용이 일정하다.
+    작성자 이름은 조인으로 함께 조회하고, 응답에 없는 content 컬럼은 읽지 않는다.
+
+    Args:
+        after: 이전 페이지의 next_cursor (해당 게시물 이후부터 조회)
+        limit: 페이지 크기
+        order: 정렬 순서
+
+    Returns:
+        dict: items, next_cursor
+    """
+    stmt = select(
+        Post.id,
+        Member.name.label("publisher_name"),
+        Post.title,
+        Post.created_at,
+    ).join(Member, Post.member_id == Member.id).where(*VISIBLE)
+    stmt = apply_cursor(stmt, Post.id, after, limit, order)
+    rows = (await db_session.execute(stmt)).all()
+    return build_page(rows, limit)
+
+
+def get_all_for_export() -> Select:
+    """게시물 목록 내보내기 쿼리 (작성 순)"""
+    return select(
+        Post.id,
+        Post.member_id,
+        Post.title,
+        Post.content,
+        Post.like_count,
+        Post.created_at,
+        Post.updated_at,
+    ).where(Post.deleted_at.is_(None), AUTHOR_VISIBLE).order_by(Post.id)
+
+
+# 검색 설정: 한국어 형태소 분석 사전이 없으므로 공백 단위로 분리하는 simple 사용
+SEARCH_CONFIG = "simple"
+# ts_headline 은 본문을 이스케이프하지 않으므로 강조 구간을 제어 문자로 표시하고, HTML 이스케이프 후 <mark> 로 바꾼다.
+SNIPPET_START, SNIPPET_STOP = "\x02", "\x03"
+SNIPPET_OPTIONS = f'StartSel="{SNIPPET_START}", StopSel="{SNIPPET_STOP}", MaxWords=35, MinWords=15, MaxFragments=2'
+
+
+def _render_snippet(snippet: str) -> str:
+    """ts_headline 결과를 HTML 이스케이프하고 강조 구간을 <mark> 로 감싸기"""
+    return html.escape(snippet).replace(SNIPPET_START, "<mark>").replace(SNIPPET_STOP, "</mark>")
+
+
+def _encode_search_cursor(row) -> str:
+    return base64.urlsafe_b64encode(f"{row.rank!r}:{row.id}".encode()).decode()
+
+
+def _decode_search_cursor(cursor: str) -> tuple[float, str]:
+    try:
+        rank, id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        return float(rank), id
+    except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail=[{"message": "게시물에 대한 권한이 없습니다."}]
+            status_code=status.HTTP_400_BAD_REQUEST, detail=[{"message": "검색 커서가 올바르지 않습니다."}]
         )
 
-    for field, value in update_post_request.model_dump(exclude_unset=True).items():
-        setattr(_post, field, value)
 
-    await db_session.commit()
-    await db_session.refresh(_post)
+async def search(db_session: AsyncSession, q: str, after: str | None, limit: int) -> dict:
+    """
+    게시물 검색
 
-    return _post
+    search_vector 의 GIN 인덱스로 일치하는 게시물을 찾고 ts_rank_cd 순(동점은 id 역순)으로 정렬한다.
+    (rank, id) 키셋으로 페이지를 나누고, 비용이 큰 ts_headline 은 해당 페이지의 행에만 계산한다.
+    snippet 은 HTML 이스케이프되어 있고 검색어 일치 구간만 <mark> 로 감싼다.
 
+    Args:
+        q: 검색어 (websearch 문법: "구문", -제외, OR)
+        after: 이전 페이지의 next_cursor
+        limit: 페이지 크기
 
-async def update_post_like(db_session: AsyncSession, id: str, clicker_id: str) -> None:
-    _post = await db_session.scalar(select(Post).where(Post.id == id))
+    Returns:
+        dict: items, next_cursor
+    """
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(Post.search_vector, query)
 
-    if not _post:
+    matched = select(Post.id, rank.label("rank")).where(
+        Post.search_vector.op("@@")(query), Post.deleted_at.is_(None), AUTHOR_VISIBLE
+    )
+    if after:
+        after_rank, after_id = _decode_search_cursor(after)
+        matched = matched.where(tuple_(rank, Post.id) < tuple_(literal(after_rank, Float), literal(after_id, Post.id.type)))
+    matched = matched.order_by(rank.desc(), Post.id.desc()).limit(limit + 1).subquery()
+
+    stmt = (
+        select(
+            matched.c.id,
+            Member.name.label("publisher_name"),
+            Post.title,
+            func.ts_headline(SEARCH_CONFIG, Post.content, query, SNIPPET_OPTIONS).label("snippet"),
+            matched.c.rank,
+            Post.created_at,
+        )
+        .join(Post, Post.id == matched.c.id)
+        .join(Member, Post.member_id == Member.id)
+        .order_by(matched.c.rank.desc(), matched.c.id.desc())
+    )
+    rows = (await db_session.execute(stmt)).all()
+    page = build_page(rows, limit, cursor=_encode_search_cursor)
+    page["items"] = [{**row._mapping, "snippet": _render_snippet(row.snippet)} for row in page["items"]]
+    return page
+
+
+async def _raise_write_error(db_session: AsyncSession, id: str) -> None:
+    """수정할 게시물이 없을 때 없는 게시물(404)인지 권한 없음(403)인지 확인해 예외 발생"""
+    if await db_session.scalar(select(Post.id).where(Post.id == id, Post.deleted_at.is_(None))) is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "게시물을 찾을 수 없습니다."}])
 
-    _post_like = await db_session.scalar(
-        select(PostLike).where(PostLike.member_id == clicker_id, PostLike.post_id == id)
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=[{"message": "게시물에 대한 권한이 없습니다."}])
+
+
+async def update(db_session: AsyncSession, id: str, update_post_request: UpdatePostRequest) -> Row:
+    """
+    게시물 수정
+
+    작성자 확인을 WHERE 조건에 넣은 UPDATE ... RETURNING 한 번으로 수정한다.
+    수정된 행이 없을 때만 원인을 확인하기 위해 추가로 조회한다.
+
+    Returns:
+        Row: id
+    """
+    _post = (
+        await db_session.execute(
+            update_stmt(Post)
+            .where(Post.id == id, Post.member_id == update_post_request.publisher_id, Post.deleted_at.is_(None))
+            .values(**update_post_request.model_dump(exclude_unset=True, exclude={"publisher_id"}))
+            .returning(Post.id)
+            .execution_options(synchronize_session=False)
+        )
+    ).first()
+
+    if not _post:
+        await _raise_write_error(db_session, id)
+
+    await db_session.commit()
+    await post_cache.invalidate(id)
+
+    return _post
+
+
+async def update_post_like(db_session: AsyncSession, id: str, clicker_id: str) -> dict:
+    _post_like = await toggle_like(
+        db_session, Post, PostLike, PostLike.post_id, id, clicker_id, update_count=post_like_buffer is None
     )
 
-    if _post_like:
-        await db_session.delete(_post_like)
-        _post.like_count -= 1
-    else:
-        post_like = PostLike(post_id=id, member_id=clicker_id)
-        db_session.add(post_like)
-        _post.like_count += 1
+    if not _post_like:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "게시물을 찾을 수 없습니다."}])
 
     await db_session.commit()
+    await post_cache.invalidate(id)
+
+    return await apply_like_delta(db_session, post_like_buffer, Post, id, _post_like)
 
 
 async def delete(db_session: AsyncSession, id: str, publisher_id: str) -> None:
-    _post = await db_session.scalar(select(Post).where(Post.id == id))
+    """
+    게시물 삭제
+
+    삭제 표시(deleted_at)와 함께 딸린 댓글, 좋아요, 댓글의 좋아요 수를 PURGE_SYNC_THRESHOLD 를 넘는지 알 수 있을 만큼만 센다.
+    적으면 바로 삭제하고 댓글, 좋아요는 DB 의 ON DELETE CASCADE 로 함께 삭제된다.
+    많으면 삭제 표시와 purge_post_task(outbox)만 커밋하고 작업이 나누어 삭제한다. 삭제 표시된 게시물은 즉시 조회에서 제외된다.
+    """
+    limit = settings.PURGE_SYNC_THRESHOLD + 1
+    _post = (
+        await db_session.execute(
+            update_stmt(Post)
+            .where(Post.id == id, Post.member_id == publisher_id, Post.deleted_at.is_(None))
+            .values(deleted_at=datetime.now())
+            .returning(
+                Post.id,
+                bounded_count(
+                    limit,
+                    select(Comment.id).where(Comment.post_id == id),
+                    select(PostLike.member_id).where(PostLike.post_id == id),
+                    select(CommentLike.member_id)
+                    .join(Comment, CommentLike.comment_id == Comment.id)
+                    .where(Comment.post_id == id),
+                ).label("children"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    ).first()
 
     if not _post:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=[{"message": "게시물을 찾을 수 없습니다."}])
+        await _raise_write_error(db_session, id)
 
-    if _post.member_id != publisher_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail=[{"message": "게시물에 대한 권한이 없습니다."}]
-        )
+    if _post.children >= limit:
+        await enqueue_task(db_session, purge_post_task, id)
+    else:
+        await db_session.execute(delete_stmt(Post).where(Post.id == id))
 
-    await db_session.delete(_post)
+    await db_session.commit()
+    await post_cache.invalidate(id)
@@ -0,0 +1,127 @@
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+from redis import Redis as SyncRedis
+from redis.exceptions import LockError
+from sqlalchemy import ColumnElement, ScalarSelect, Select, delete, func, select, true, union_all
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from cache import invalidate_many
+from likes import recount_like_counts
+from models import Comment, CommentLike, Member, Post, PostLike
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def purge_lock(redis: SyncRedis, name: str, timeout: float) -> Iterator[bool]:
+    """
+    purge 작업이 같은 대상을 동시에 처리하지 않도록 Redis 락을 잡는다.
+
+    이미 다른 작업이 잡고 있으면 기다리지 않고 False 를 내주며, 호출하는 쪽은 처리를 건너뛴다.
+
+        with purge_lock(redis, f"purge:member:{member_id}", timeout) as acquired:
+            if acquired:
+                purge_member(...)
+    """
+    lock = redis.lock(name, timeout=timeout)
+    if not lock.acquire(blocking=False):
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("purge lock %s expired before release", name)
+
+
+def bounded_count(limit: int, *queries: Select) -> ScalarSelect:
+    """
+    여러 쿼리의 행 수 합계를 쿼리별 최대 limit 개까지만 세는 스칼라 서브쿼리
+
+    하위 행이 아무리 많아도 limit 개만 읽으므로 삭제 방식(즉시/나누어 삭제)을 정하는 데 쓴다.
+    """
+    counted = union_all(*[query.limit(limit) for query in queries]).subquery()
+    return select(func.count()).select_from(counted).scalar_subquery()
+
+
+def _delete_in_batches(session: Session, key: InstrumentedAttribute, condition: ColumnElement, batch_size: int) -> int:
+    """
+    condition 에 해당하는 행을 batch_size 개씩 삭제하고 배치마다 커밋
+
+    한 번에 잠그는 행 수를 제한해 다른 요청이 오래 기다리지 않도록 한다.
+
+    Returns:
+        int: 삭제한 행 수
+    """
+    model = key.class_
+    total = 0
+    while True:
+        batch = select(key).where(condition).limit(batch_size)
+        deleted = session.execute(delete(model).where(condition, key.in_(batch)).returning(key)).all()
+        session.commit()
+        total += len(deleted)
+        if len(deleted) < batch_size:
+            return total
+
+
+def _purge_member_likes(
+    session: Session, target: type, like: type, like_target_id: InstrumentedAttribute, member_id: str, batch_size: int
+) -> None:
+    """회원의 좋아요 기록을 나누어 삭제하고, 대상의 like_count 를 좋아요 기록 수로 다시 계산"""
+    while True:
+        batch = select(like_target_id).where(like.member_id == member_id).limit(batch_size)
+        target_ids = session.scalars(
+            delete(like).where(like.member_id == member_id, like_target_id.in_(batch)).returning(like_target_id)
+        ).all()
+        if target_ids:
+            session.execute(recount_like_counts(target, like, like_target_id, list(target_ids)))
+        session.commit()
+        if len(target_ids) < batch_size:
+            return
+
+
+def purge_post(session: Session, post_id: str, batch_size: int) -> None:
+    """
+    게시물과 딸린 댓글, 좋아요를 나누어 삭제
+
+    댓글의 좋아요는 댓글 삭제 시 ON DELETE CASCADE 로 함께 삭제된다.
+    이미 삭제된 게시물이면 아무것도 하지 않는다.
+    """
+    _delete_in_batches(session, Comment.id, Comment.post_id == post_id, batch_size)
+    _delete_in_batches(session, PostLike.member_id, PostLike.post_id == post_id, batch_size)
+    session.execute(delete(Post).where(Post.id == post_id))
+    session.commit()
+
+
+def purge_member(session: Session, redis: SyncRedis, member_id: str, batch_size: int) -> None:
+    """
+    회원과 회원이 작성한 게시물, 댓글, 좋아요를 나누어 삭제
+
+    회원이 누른 좋아요를 지운 뒤에는 대상의 like_count 를 다시 계산한다.
+    게시물 단건 캐시는 먼저 무효화해 삭제가 끝나기 전에도 캐시된 게시물이 조회되지 않도록 한다.
+    """
+    after = None
+    while post_ids := session.scalars(
+        select(Post.id)
+        .where(Post.member_id == member_id, Post.id > after if after else true())
+        .order_by(Post.id)
+        .limit(batch_size)
+    ).all():
+        invalidate_many(redis, "post", list(post_ids))
+        after = post_ids[-1]
+
+    _purge_member_likes(session, Post, PostLike, PostLike.post_id, member_id, batch_size)
+    _purge_member_likes(session, Comment, CommentLike, CommentLike.comment_id, member_id, batch_size)
+    _delete_in_batches(session, Comment.id, Comment.member_id == member_id, batch_size)
+
+    while post_ids := session.scalars(select(Post.id).where(Post.member_id == member_id).limit(batch_size)).all():
+        for post_id in post_ids:
+            purge_post(session, post_id, batch_size)
+
+    session.execute(delete(Member).where(Member.id == member_id))
+    session.commit()
@@ -0,0 +1,98 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from random import random
+from time import perf_counter
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, event
+
+from config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 느린 쿼리 로그에 남기는 SQL 최대 길이
+MAX_LOGGED_STATEMENT_LENGTH = 2000
+
+
+class QueryStats:
+    """
+    쿼리 실행 통계
+
+    track_queries 로 감싼 구간에서 실행된 쿼리 수와 실행 시간(초) 합계.
+    구간이 중첩되면 바깥 구간에도 함께 더해진다.
+    """
+
+    def __init__(self, parent: "QueryStats | None" = None):
+        self.count = 0
+        self.duration = 0.0
+        self.parent = parent
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    현재 컨텍스트(요청)에서 실행되는 쿼리 집계
+
+        with track_queries() as queries:
+            ...
+        queries.count, queries.duration
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _redact(parameters: Any) -> Any:
+    """바인딩 값을 타입 이름으로 바꿔 로그에 값이 남지 않도록 한다."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany
+            return [_redact(parameters[0]), f"... {len(parameters)} rows"]
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = perf_counter() - conn.info["query_started"].pop()
+
+    stats = _current_stats.get()
+    while stats is not None:
+        stats.count += 1
+        stats.duration += duration
+        stats = stats.parent
+
+    if duration * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS and random() < settings.SLOW_QUERY_SAMPLE_RATE:
+        logger.warning(
+            "slow query (%.1f ms): %s params=%s",
+            duration * 1000,
+            statement[:MAX_LOGGED_STATEMENT_LENGTH],
+            _redact(parameters),
+        )
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각을 정리한다.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에 쿼리 집계 및 느린 쿼리 로그 이벤트 등록 (비동기 엔진은 sync_engine 을 넘긴다)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
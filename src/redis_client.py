@@ -0,0 +1,11 @@
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+from config import get_settings
+
+settings = get_settings()
+
+redis_client = Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0)
+
+# Celery 워커 등 동기 코드에서 사용하는 클라이언트
+sync_redis_client = SyncRedis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0)
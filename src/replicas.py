@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from itertools import count
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from query_stats import instrument_engine
+
+logger = logging.getLogger(__name__)
+
+# 복제 지연(초), 수신한 WAL 을 모두 재생했으면 0, 복제본이 아니면 NULL
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class ReplicaPool:
+    """
+    읽기 전용 복제본 풀
+
+    복제본마다 엔진을 만들고 check_interval 마다 복제 지연을 확인해 max_lag 이내인 복제본만 순환에 포함한다.
+    접속할 수 없거나 지연이 큰 복제본은 자동으로 제외되고, 지연이 회복되면 다시 포함된다.
+    사용할 복제본이 없으면 sessionmaker 는 None 을 반환하고 호출하는 쪽에서 기본 DB 를 사용한다.
+    """
+
+    def __init__(self, urls: list[str], max_lag: float, check_interval: float, **engine_options):
+        self.engines: list[AsyncEngine] = [create_async_engine(url, **engine_options) for url in urls]
+        for engine in self.engines:
+            instrument_engine(engine.sync_engine)
+        # 조회 전용이므로 AUTOCOMMIT 으로 BEGIN/COMMIT 왕복을 생략한다.
+        self.sessionmakers = [
+            async_sessionmaker(
+                engine.execution_options(isolation_level="AUTOCOMMIT"),
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            )
+            for engine in self.engines
+        ]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        # 첫 확인 전까지는 순환에서 제외
+        self.healthy: list[int] = []
+        self._counter = count()
+        self._monitor: asyncio.Task | None = None
+
+    def sessionmaker(self) -> async_sessionmaker | None:
+        """순환 중인 복제본의 세션 팩토리 (라운드 로빈)"""
+        healthy = self.healthy
+        if not healthy:
+            return None
+        return self.sessionmakers[healthy[next(self._counter) % len(healthy)]]
+
+    async def _lag(self, engine: AsyncEngine) -> float | None:
+        """복제 지연(초), 복제본이 아니거나 아직 재생한 트랜잭션이 없어 알 수 없으면 None"""
+        async with engine.connect() as connection:
+            lag = await connection.scalar(REPLICATION_LAG_QUERY)
+        return None if lag is None else float(lag)
+
+    async def _check(self) -> None:
+        healthy = []
+        for i, engine in enumerate(self.engines):
+            try:
+                lag = await asyncio.wait_for(self._lag(engine), timeout=self.check_interval)
+                if lag is None:
+                    logger.warning(
+                        "replica %s replication lag unknown (not in recovery or nothing replayed)", engine.url.host
+                    )
+            except Exception:
+                lag = None
+                logger.warning("replica %s check failed", engine.url.host, exc_info=True)
+
+            in_rotation = lag is not None and lag <= self.max_lag
+            if in_rotation:
+                healthy.append(i)
+            if in_rotation != (i in self.healthy):
+                logger.warning(
+                    "replica %s %s rotation (lag: %s)", engine.url.host, "joined" if in_rotation else "left", lag
+                )
+        self.healthy = healthy
+
+    async def _run(self) -> None:
+        while True:
+            await self._check()
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        """복제 지연 확인 시작"""
+        if self.engines and self._monitor is None:
+            self._monitor = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+        self.healthy = []
+        for engine in self.engines:
+            await engine.dispose()
@@ -0,0 +1,85 @@
+from collections.abc import Callable
+from types import UnionType
+from typing import Any, Generic, TypeVar, Union, get_args, get_origin
+
+from fastapi import Response, status
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined, to_json
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class JSONBytesResponse(Response):
+    """이미 직렬화된 JSON 바이트를 그대로 내보내는 응답"""
+
+    media_type = "application/json"
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _reader(type_: Any) -> Callable[[Any], Any]:
+    """
+    응답 타입 구조대로 값을 읽어 JSON 으로 직렬화할 수 있는 dict/list 로 바꾸는 함수 생성
+
+    모델은 필드 이름으로 속성(dict 는 키)을 읽고, 없으면 필드 기본값을 쓴다.
+    말단 값은 검증이나 변환 없이 그대로 두므로 DB 에서 읽은 값을 EmailStr 등의 검증 비용 없이 직렬화한다.
+    """
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        fields = [
+            (name, _reader(field.annotation), None if field.default is PydanticUndefined else field.default)
+            for name, field in type_.model_fields.items()
+        ]
+
+        def read_model(value: Any) -> dict:
+            get = value.get if isinstance(value, dict) else lambda name, default: getattr(value, name, default)
+            result = {}
+            for name, read, default in fields:
+                field = get(name, _MISSING)
+                result[name] = default if field is _MISSING else read(field)
+            return result
+
+        return read_model
+
+    origin = get_origin(type_)
+    if origin in (Union, UnionType):
+        readers = [_reader(arg) for arg in get_args(type_) if arg is not type(None)]
+        if len(readers) != 1:
+            return _identity
+        read = readers[0]
+        return lambda value: None if value is None else read(value)
+    if origin is list:
+        read = _reader(get_args(type_)[0])
+        return _identity if read is _identity else lambda value: [read(item) for item in value]
+    if origin is dict:
+        read = _reader(get_args(type_)[1])
+        return _identity if read is _identity else lambda value: {key: read(item) for key, item in value.items()}
+    return _identity
+
+
+class ResponseSerializer(Generic[T]):
+    """
+    응답 직렬화기
+
+    응답 타입별로 값을 읽는 함수를 미리 만들어 두고, ORM 객체/행의 속성을 검증 없이 바로 JSON 바이트로 직렬화한다.
+    라우터에서 Response 를 반환하면 FastAPI 의 response_model 검증과 jsonable_encoder, 표준 json 인코딩을 건너뛴다.
+    response_model 은 문서화를 위해 그대로 지정한다.
+
+        get_posts_serializer = ResponseSerializer(CursorPage[GetPostListResponse])
+
+        @router.get("/posts", response_model=CursorPage[GetPostListResponse])
+        async def get_posts(...):
+            return get_posts_serializer(await get_all(...))
+    """
+
+    def __init__(self, type_: type[T]):
+        self.read = _reader(type_)
+
+    def dump_json(self, content: Any) -> bytes:
+        return to_json(self.read(content))
+
+    def __call__(self, content: Any, status_code: int = status.HTTP_200_OK) -> JSONBytesResponse:
+        return JSONBytesResponse(content=self.dump_json(content), status_code=status_code)
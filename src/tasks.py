@@ -1,9 +1,20 @@
+from datetime import datetime, timedelta
 from time import sleep
 import random
 
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import beat_init
+from sqlalchemy import select
 
 from config import get_settings
+from database import SyncSessionLocal, sync_engine
+from likes import flush_like_deltas, repair_like_counts
+from mailer import DomainRateLimiter, EmailQueue, MailPriority, SMTPPool, dispatch_emails
+from models import Comment, CommentLike, Member, Post, PostLike
+from partitions import maintain_partitions
+from purge import purge_lock, purge_member, purge_post
+from redis_client import sync_redis_client
 
 settings = get_settings()
 
@@ -13,12 +24,69 @@ app = Celery(
     backend=f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/0",
 )
 
+app.conf.beat_schedule = {
+    "dispatch-emails": {
+        "task": "tasks.dispatch_emails_task",
+        "schedule": settings.EMAIL_DISPATCH_INTERVAL,
+        "options": {"expires": settings.EMAIL_DISPATCH_INTERVAL},
+    },
+    "purge-deleted": {
+        "task": "tasks.purge_deleted_task",
+        "schedule": settings.PURGE_SWEEP_INTERVAL,
+    },
+    "maintain-partitions": {
+        "task": "tasks.maintain_partitions_task",
+        "schedule": crontab(hour=0, minute=5),
+    },
+}
 
-@app.task
-def send_welcome_email_task():
-    print("send_welcome_email_task start!")
-    sleep(5)
-    print("task success!")
+if settings.LIKE_COUNT_MODE == "write_behind":
+    app.conf.beat_schedule["flush-like-counts"] = {
+        "task": "tasks.flush_like_counts_task",
+        "schedule": settings.LIKE_FLUSH_INTERVAL,
+    }
+
+
+# 메일 큐와 발송 한도는 Redis 에 두어 모든 워커가 공유하고, SMTP 커넥션은 워커 프로세스마다 풀로 재사용한다.
+email_queue = EmailQueue(sync_redis_client)
+domain_rate_limiter = DomainRateLimiter(
+    sync_redis_client, settings.EMAIL_DOMAIN_RATE_LIMIT, settings.EMAIL_DOMAIN_RATE_WINDOW
+)
+smtp_pool = SMTPPool(
+    settings.SMTP_HOST,
+    settings.SMTP_PORT,
+    settings.SMTP_POOL_SIZE,
+    username=settings.SMTP_USERNAME,
+    password=settings.SMTP_PASSWORD,
+    starttls=settings.SMTP_STARTTLS,
+    timeout=settings.SMTP_TIMEOUT,
+)
+
+
+@app.task(ignore_result=True)
+def send_welcome_email_task(email: str, name: str):
+    """
+    가입 환영 메일을 transactional 큐에 추가 (발송은 dispatch_emails_task)
+    """
+    email_queue.push(email, "가입을 환영합니다", f"{name}님, 가입을 환영합니다.", MailPriority.TRANSACTIONAL)
+
+
+@app.task(ignore_result=True)
+def dispatch_emails_task():
+    """
+    메일 큐를 배치로 꺼내 SMTP 커넥션 풀로 발송 (transactional 큐 우선, 수신 도메인별 발송 한도 적용)
+    """
+    dispatch_emails(
+        email_queue,
+        domain_rate_limiter,
+        smtp_pool,
+        settings.MAIL_FROM,
+        settings.EMAIL_BATCH_SIZE,
+        settings.EMAIL_DISPATCH_MAX_SECONDS,
+        settings.EMAIL_DISPATCH_BATCH_SECONDS,
+        settings.EMAIL_MAX_ATTEMPTS,
+        settings.EMAIL_RETRY_DELAY,
+    )
 
 
 @app.task(bind=True, autoretry_for=(Exception,), retry_kwargs={"max_retries": 3, "countdown": 5})
@@ -34,3 +102,117 @@ def test_job(self):
     except Exception as e:
         print("Exception!!!")
         raise e
+
+
+@app.task(ignore_result=True)
+def flush_like_counts_task():
+    """
+    write-behind 모드에서 Redis 에 누적된 좋아요 수 증감을 게시물/댓글에 일괄 반영
+
+    반영 후 버퍼에서 누락된 대상이 있는지 일부씩 확인해 다시 계산한다.
+    """
+    with SyncSessionLocal() as session:
+        for target, like, like_target_id, namespace in (
+            (Post, PostLike, PostLike.post_id, "post"),
+            (Comment, CommentLike, CommentLike.comment_id, "comment"),
+        ):
+            flush_like_deltas(
+                session,
+                sync_redis_client,
+                target,
+                like,
+                like_target_id,
+                namespace,
+                settings.LIKE_FLUSH_BATCH_SIZE,
+            )
+            repair_like_counts(
+                session,
+                sync_redis_client,
+                target,
+                like,
+                like_target_id,
+                namespace,
+                settings.LIKE_FLUSH_BATCH_SIZE,
+            )
+
+
+@app.task(ignore_result=True)
+def purge_post_task(post_id: str):
+    """
+    삭제 표시된 게시물과 딸린 댓글, 좋아요를 PURGE_BATCH_SIZE 단위로 삭제
+    """
+    with purge_lock(sync_redis_client, f"purge:post:{post_id}", settings.PURGE_LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            return
+        with SyncSessionLocal() as session:
+            purge_post(session, post_id, settings.PURGE_BATCH_SIZE)
+
+
+@app.task(ignore_result=True)
+def purge_member_task(member_id: str):
+    """
+    삭제 표시된 회원과 작성한 게시물, 댓글, 좋아요를 PURGE_BATCH_SIZE 단위로 삭제
+    """
+    with purge_lock(sync_redis_client, f"purge:member:{member_id}", settings.PURGE_LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            return
+        with SyncSessionLocal() as session:
+            purge_member(session, sync_redis_client, member_id, settings.PURGE_BATCH_SIZE)
+
+
+@app.task(ignore_result=True)
+def purge_deleted_task():
+    """
+    삭제 표시 후 PURGE_SWEEP_INTERVAL 이 지나도록 남아 있는 회원/게시물 삭제 (purge 작업 유실 대비)
+
+    한 번에 하나의 정리 작업만 실행하고, 오래된 순으로 PURGE_SWEEP_LIMIT 개씩만 처리한다.
+    purge_member_task/purge_post_task 가 처리 중인 대상은 건너뛴다.
+    """
+    deleted_before = datetime.now() - timedelta(seconds=settings.PURGE_SWEEP_INTERVAL)
+
+    with purge_lock(sync_redis_client, "purge:sweep", settings.PURGE_LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            return
+
+        with SyncSessionLocal() as session:
+            member_ids = session.scalars(
+                select(Member.id)
+                .where(Member.deleted_at < deleted_before)
+                .order_by(Member.deleted_at)
+                .limit(settings.PURGE_SWEEP_LIMIT)
+            ).all()
+            for member_id in member_ids:
+                with purge_lock(sync_redis_client, f"purge:member:{member_id}", settings.PURGE_LOCK_TIMEOUT) as acquired:
+                    if acquired:
+                        purge_member(session, sync_redis_client, member_id, settings.PURGE_BATCH_SIZE)
+
+            post_ids = session.scalars(
+                select(Post.id)
+                .where(Post.deleted_at < deleted_before)
+                .order_by(Post.deleted_at)
+                .limit(settings.PURGE_SWEEP_LIMIT)
+            ).all()
+            for post_id in post_ids:
+                with purge_lock(sync_redis_client, f"purge:post:{post_id}", settings.PURGE_LOCK_TIMEOUT) as acquired:
+                    if acquired:
+                        purge_post(session, post_id, settings.PURGE_BATCH_SIZE)
+
+
+@app.task(ignore_result=True)
+def maintain_partitions_task():
+    """
+    게시물/댓글의 다음 월 파티션을 미리 만들고 보관 기간이 지난 파티션을 분리
+    """
+    with sync_engine.begin() as connection:
+        maintain_partitions(
+            connection,
+            settings.PARTITION_PREMAKE_MONTHS,
+            settings.PARTITION_RETENTION_MONTHS,
+            settings.PARTITION_ARCHIVE_SCHEMA,
+        )
+
+
+@beat_init.connect
+def maintain_partitions_on_beat_start(**kwargs):
+    """beat 시작 시 다음 정기 실행을 기다리지 않고 파티션을 한 번 정리"""
+    maintain_partitions_task.delay()
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 import sys
 from pathlib import Path
 
@@ -9,9 +10,28 @@ from httpx import AsyncClient, ASGITransport
 import pytest
 
 from main import app
+from query_stats import track_queries
 
 
 @pytest.fixture(scope="session")
 async def test_client():
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost:8000/v1") as client:
         yield client
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    구간에서 실행된 쿼리 수가 limit 이하인지 검증 (N+1 회귀 방지)
+
+        with assert_max_queries(2):
+            await test_client.get("/posts")
+    """
+
+    @contextmanager
+    def _assert_max_queries(limit: int):
+        with track_queries() as queries:
+            yield queries
+        assert queries.count <= limit, f"쿼리 {queries.count}회 실행 (최대 {limit}회)"
+
+    return _assert_max_queries
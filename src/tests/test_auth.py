@@ -1,5 +1,14 @@
+from uuid import uuid4
+
 import pytest
 
+from redis.exceptions import ConnectionError
+
+from auth.revocation import BloomFilter, TokenDenylist
+from auth.service import create_access_token
+from dependencies import get_current_user, token_cache
+from member.enums import MemberRole
+
 
 @pytest.mark.asyncio(loop_scope="session")
 async def test_success_auth(test_client):
@@ -13,3 +22,39 @@ async def test_fail_auth(test_client):
     response = await test_client.post("/login", data={"username": "admin@email.com", "password": "wrong"})
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_verified_token_cache():
+    token = create_access_token(payload={"sub": "member-id", "role": MemberRole.USER})
+    hits = token_cache.hits
+
+    first = await get_current_user(token)
+    second = await get_current_user(token)
+
+    assert second is first
+    assert token_cache.hits == hits + 1
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    jtis = [str(uuid4()) for _ in range(1000)]
+    for jti in jtis:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in jtis)
+
+
+class UnavailableRedis:
+    async def exists(self, *keys):
+        raise ConnectionError("redis unavailable")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_revocation_check_falls_back_to_bloom_filter_when_redis_fails():
+    denylist = TokenDenylist(UnavailableRedis(), capacity=1000, error_rate=0.001, rebuild_interval=3600)
+    revoked = str(uuid4())
+    denylist.bloom.add(revoked)
+
+    assert await denylist.is_revoked(revoked)
+    assert not await denylist.is_revoked(str(uuid4()))
@@ -0,0 +1,46 @@
+from uuid import uuid4
+
+import pytest
+from freezegun import freeze_time
+
+from cache import LRUCache, TwoTierCache
+from redis_client import redis_client
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.evictions == 1
+
+
+def test_lru_cache_expires_after_ttl():
+    with freeze_time("2025-01-01 00:00:00") as frozen_time:
+        cache = LRUCache(maxsize=10, ttl=30)
+        cache.set("a", b"1")
+        frozen_time.tick(31)
+
+        assert cache.get("a") is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_two_tier_cache_rejects_fill_invalidated_during_read():
+    cache = TwoTierCache(redis_client, namespace=f"test-{uuid4()}", maxsize=10, local_ttl=30, remote_ttl=60)
+    key = str(uuid4())
+
+    cached, generation = await cache.lookup(key)
+    await cache.invalidate(key)
+    await cache.set(key, b"stale", generation)
+
+    assert cached is None
+    assert await cache.get(key) is None
+
+    _, generation = await cache.lookup(key)
+    await cache.set(key, b"fresh", generation)
+
+    assert await cache.get(key) == b"fresh"
@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_post_comments_page(test_client, assert_max_queries):
+    posts = (await test_client.get("/posts", params={"limit": 1})).json()["items"]
+
+    if not posts:
+        pytest.skip("게시물이 필요합니다.")
+
+    with assert_max_queries(1):
+        response = await test_client.get(f"/post/{posts[0]['id']}/comments", params={"limit": 2, "order": "desc"})
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) <= 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_post_comments_invalid_order(test_client):
+    response = await test_client.get("/post/01J0000000000000000000000/comments", params={"order": "random"})
+
+    assert response.status_code == 422
@@ -0,0 +1,75 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import text
+from ulid import ULID
+
+import key_migration
+from database import sync_engine
+from db_types import ULIDType, UUIDType
+
+LEGACY_SCHEMA = "key_migration_test_source"
+
+
+def create_legacy_tables(connection) -> None:
+    """모델과 같은 구조에 키만 text 인 전환 전 테이블 생성"""
+    connection.execute(text(f"CREATE SCHEMA {LEGACY_SCHEMA}"))
+    for name in key_migration.KEY_TABLES:
+        connection.execute(
+            text(f"CREATE TABLE {LEGACY_SCHEMA}.{name} (LIKE public.{name} INCLUDING DEFAULTS INCLUDING GENERATED)")
+        )
+        for column in key_migration._table(name).columns:
+            if isinstance(column.type, (ULIDType, UUIDType)):
+                connection.execute(text(f"ALTER TABLE {LEGACY_SCHEMA}.{name} ALTER COLUMN {column.name} TYPE text"))
+
+
+def test_parent_update_after_constrain_keeps_shadow_children(monkeypatch):
+    monkeypatch.setattr(key_migration, "SOURCE_SCHEMA", LEGACY_SCHEMA)
+    now = datetime.now()
+    member_id, post_id, comment_id = str(uuid4()), str(ULID()), str(ULID())
+
+    with sync_engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            create_legacy_tables(connection)
+            connection.execute(
+                text(
+                    f"""
+                    INSERT INTO {LEGACY_SCHEMA}.member (id, email, password, address, name, role, created_at)
+                    VALUES (:member_id, :email, 'password', 'address', 'member', 'USER', :now);
+                    INSERT INTO {LEGACY_SCHEMA}.post (id, member_id, title, content, like_count, created_at, updated_at)
+                    VALUES (:post_id, :member_id, 'title', 'content', 1, :now, :now);
+                    INSERT INTO {LEGACY_SCHEMA}.comment (id, member_id, post_id, content, like_count, created_at, updated_at)
+                    VALUES (:comment_id, :member_id, :post_id, 'comment', 1, :now, :now);
+                    INSERT INTO {LEGACY_SCHEMA}.post_like (post_id, member_id) VALUES (:post_id, :member_id);
+                    INSERT INTO {LEGACY_SCHEMA}.comment_like (comment_id, member_id) VALUES (:comment_id, :member_id);
+                    """
+                ),
+                {
+                    "member_id": member_id,
+                    "email": f"{uuid4().hex[:12]}@email.com",
+                    "post_id": post_id,
+                    "comment_id": comment_id,
+                    "now": now,
+                },
+            )
+
+            key_migration.prepare(connection, premake_months=1)
+            for name in key_migration.KEY_TABLES:
+                key_migration.backfill(connection, name, batch_size=100)
+            key_migration.constrain(connection)
+
+            connection.execute(text(f"UPDATE {LEGACY_SCHEMA}.member SET name = 'renamed'"))
+            connection.execute(text(f"UPDATE {LEGACY_SCHEMA}.post SET like_count = like_count + 1, deleted_at = now()"))
+            connection.execute(text(f"UPDATE {LEGACY_SCHEMA}.comment SET content = 'edited'"))
+
+            shadow = key_migration.SHADOW_SCHEMA
+            counts = {
+                name: connection.scalar(text(f"SELECT count(*) FROM {shadow}.{name}"))
+                for name in key_migration.KEY_TABLES
+            }
+            assert counts == {name: 1 for name in key_migration.KEY_TABLES}
+            assert connection.scalar(text(f"SELECT name FROM {shadow}.member")) == "renamed"
+            assert connection.scalar(text(f"SELECT like_count FROM {shadow}.post")) == 2
+        finally:
+            transaction.rollback()
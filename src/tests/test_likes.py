@@ -0,0 +1,62 @@
+from uuid import uuid4
+
+from sqlalchemy import delete, func, insert, select
+
+from database import SyncSessionLocal
+from likes import flush_like_deltas, repair_like_counts
+from models import Member, Post, PostLike
+from redis_client import sync_redis_client
+from tests.test_purge import create_member, create_post
+
+
+def test_like_counts_after_flush_match_like_rows():
+    namespace = f"post_test_{uuid4().hex[:8]}"
+    key = f"like_delta:{namespace}"
+
+    with SyncSessionLocal() as session:
+        member_ids = [create_member(session) for _ in range(3)]
+        buffered_id, lost_id = create_post(session, member_ids[0]), create_post(session, member_ids[0])
+        session.execute(
+            insert(PostLike),
+            [{"post_id": buffered_id, "member_id": member_id} for member_id in member_ids]
+            + [{"post_id": lost_id, "member_id": member_id} for member_id in member_ids[:2]],
+        )
+        session.commit()
+        # buffered_id 는 증감이 누적되었고, lost_id 는 누적 전에 프로세스가 종료된 경우
+        sync_redis_client.hincrby(key, buffered_id, 3)
+
+        try:
+            assert flush_like_deltas(session, sync_redis_client, Post, PostLike, PostLike.post_id, namespace, 1) == 1
+            assert repair_like_counts(
+                session, sync_redis_client, Post, PostLike, PostLike.post_id, namespace, 1_000_000
+            ) >= 1
+
+            for post_id in (buffered_id, lost_id):
+                likes = session.scalar(select(func.count()).select_from(PostLike).where(PostLike.post_id == post_id))
+                assert session.scalar(select(Post.like_count).where(Post.id == post_id)) == likes
+            assert not sync_redis_client.exists(key, f"{key}:flushing", f"{key}:repair_cursor")
+        finally:
+            sync_redis_client.delete(key, f"{key}:flushing", f"{key}:repair_cursor")
+            session.execute(delete(Member).where(Member.id.in_(member_ids)))
+            session.commit()
+
+
+def test_repair_like_counts_skips_pending_deltas():
+    namespace = f"post_test_{uuid4().hex[:8]}"
+    key = f"like_delta:{namespace}"
+
+    with SyncSessionLocal() as session:
+        member_id = create_member(session)
+        post_id = create_post(session, member_id)
+        session.execute(insert(PostLike).values(post_id=post_id, member_id=member_id))
+        session.commit()
+        sync_redis_client.hincrby(key, post_id, 1)
+
+        try:
+            repair_like_counts(session, sync_redis_client, Post, PostLike, PostLike.post_id, namespace, 1_000_000)
+            # 반영 대기 중인 증감은 flush_like_deltas 가 다시 계산한다.
+            assert session.scalar(select(Post.like_count).where(Post.id == post_id)) == 0
+        finally:
+            sync_redis_client.delete(key, f"{key}:repair_cursor")
+            session.execute(delete(Member).where(Member.id == member_id))
+            session.commit()
@@ -0,0 +1,167 @@
+import json
+import socket
+from time import monotonic, time
+from uuid import uuid4
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from mailer import DomainRateLimiter, EmailQueue, MailPriority, SMTPPool, dispatch_emails, send_batch
+from redis_client import sync_redis_client
+
+
+class RecordingHandler:
+    """받은 메일과 세션 수를 기록하고, bounce.test 수신자는 거부, retry.test 수신자는 일시 거부하는 SMTP 서버"""
+
+    def __init__(self):
+        self.sessions = 0
+        self.recipients = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.endswith("@bounce.test"):
+            return "550 mailbox unavailable"
+        if address.endswith("@retry.test"):
+            return "451 try again later"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def smtp_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def test_send_batch_reuses_pooled_connections(smtp_server):
+    handler, port = smtp_server
+    pool = SMTPPool("127.0.0.1", port, size=4)
+    messages = [{"to": f"member{i}@email.com", "subject": "subject", "body": "body"} for i in range(500)]
+    bounced = {"to": "member@bounce.test", "subject": "subject", "body": "body"}
+
+    first = send_batch(pool, "noreply@localhost", messages[:250] + [bounced])
+    second = send_batch(pool, "noreply@localhost", messages[250:])
+    pool.close()
+
+    assert len(first.sent) + len(second.sent) == 500
+    assert first.failed == [bounced] and not first.retry and not second.retry
+    assert sorted(handler.recipients) == sorted(message["to"] for message in messages)
+    assert handler.sessions <= 4
+
+
+def test_send_batch_leaves_messages_unsent_after_deadline(smtp_server):
+    handler, port = smtp_server
+    pool = SMTPPool("127.0.0.1", port, size=2)
+    messages = [{"to": f"member{i}@email.com", "subject": "subject", "body": "body"} for i in range(4)]
+
+    result = send_batch(pool, "noreply@localhost", messages, deadline=monotonic())
+    pool.close()
+
+    assert sorted(message["to"] for message in result.unsent) == sorted(message["to"] for message in messages)
+    assert not result.sent and not result.retry and handler.recipients == []
+
+
+@pytest.fixture
+def email_queue():
+    queue = EmailQueue(sync_redis_client, namespace=f"test-email-{uuid4()}")
+    yield queue
+    sync_redis_client.delete(
+        *[queue._queue_key(priority) for priority in MailPriority], queue.deferred_key, queue.processing_key
+    )
+
+
+def test_domain_rate_limiter_caps_each_domain_per_window():
+    limiter = DomainRateLimiter(sync_redis_client, limit=2, window=60)
+    domain, other = f"{uuid4()}.test", f"{uuid4()}.test"
+
+    assert limiter.acquire({domain: 3, other: 1}) == {domain: 2, other: 1}
+    assert limiter.acquire({domain: 1, other: 2}) == {domain: 0, other: 1}
+    assert limiter.acquire({other: 1}) == {other: 0}
+    [counter] = sync_redis_client.keys(f"email:rate:{domain}:*")
+    assert int(sync_redis_client.get(counter)) == 2
+
+
+def test_email_queue_pops_transactional_first(email_queue):
+    email_queue.push("bulk@email.com", "subject", "body", MailPriority.BULK)
+    email_queue.push("signup@email.com", "subject", "body")
+
+    first = email_queue.pop_batch(1)
+    second = email_queue.pop_batch(10)
+
+    assert [message["to"] for message in first + second] == ["signup@email.com", "bulk@email.com"]
+    assert email_queue.pop_batch(10) == []
+
+
+def test_email_queue_promotes_due_messages(email_queue):
+    email_queue.push("later@email.com", "subject", "body")
+    email_queue.push("due@email.com", "subject", "body")
+    later, due = email_queue.pop_batch(2)
+
+    email_queue.defer([later], time() + 60)
+    email_queue.defer([due], time() - 1)
+
+    assert email_queue.promote_due() == 1
+    assert [message["to"] for message in email_queue.pop_batch(10)] == ["due@email.com"]
+    assert sync_redis_client.zcard(email_queue.deferred_key) == 1
+
+
+def test_email_queue_requeues_unacknowledged_messages(email_queue):
+    email_queue.push("first@email.com", "subject", "body")
+    email_queue.push("second@email.com", "subject", "body")
+    first, second = email_queue.pop_batch(2)
+    email_queue.ack([first])
+
+    assert email_queue.requeue_processing() == 1
+    assert email_queue.pop_batch(10) == [second]
+
+
+def test_dispatch_emails_retries_with_backoff_then_drops(smtp_server, email_queue):
+    handler, port = smtp_server
+    pool = SMTPPool("127.0.0.1", port, size=2)
+    limiter = DomainRateLimiter(sync_redis_client, limit=100, window=60)
+    email_queue.push("member@retry.test", "subject", "body")
+    email_queue.push("member@email.com", "subject", "body")
+
+    def dispatch():
+        return dispatch_emails(
+            email_queue,
+            limiter,
+            pool,
+            "noreply@localhost",
+            batch_size=10,
+            max_seconds=10,
+            batch_seconds=10,
+            max_attempts=2,
+            retry_delay=30,
+        )
+
+    started = time()
+    assert dispatch() == 1
+
+    [(item, until)] = sync_redis_client.zrange(email_queue.deferred_key, 0, -1, withscores=True)
+    assert json.loads(item)["attempts"] == 1
+    assert started + 30 <= until <= time() + 30
+
+    sync_redis_client.zadd(email_queue.deferred_key, {item: 0})
+    assert dispatch() == 0
+    pool.close()
+
+    assert handler.recipients == ["member@email.com"]
+    assert sync_redis_client.zcard(email_queue.deferred_key) == 0
+    assert sync_redis_client.hlen(email_queue.processing_key) == 0
+    assert email_queue.pop_batch(10) == []
@@ -0,0 +1,17 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_join_with_same_email(test_client):
+    email = f"{uuid4().hex[:12]}@email.com"
+    join_request = {"email": email, "password": "password", "address": "address", "name": "member"}
+
+    responses = await asyncio.gather(*[test_client.post("/join", json=join_request) for _ in range(5)])
+
+    assert sorted(response.status_code for response in responses) == [201, 400, 400, 400, 400]
+
+    token = (await test_client.post("/login", data={"username": email, "password": "password"})).json()["token"]
+    await test_client.delete("/member", headers={"Authorization": f"Bearer {token}"})
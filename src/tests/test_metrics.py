@@ -0,0 +1,54 @@
+from fastapi import FastAPI
+from fastapi.middleware import Middleware
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+import pytest
+
+from cache import LRUCache
+from metrics import CACHE_STATS, MetricsMiddleware, render_metrics
+
+app = FastAPI(middleware=[Middleware(MetricsMiddleware)])
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: str):
+    return {"id": item_id}
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_metrics_grouped_by_route_template():
+    before = sample("http_responses_total", method="GET", route="/items/{item_id}", status="200")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for item_id in ("a", "b", "c"):
+            response = await client.get(f"/items/{item_id}")
+            assert response.headers["server-timing"].startswith("app;dur=")
+        await client.get("/unknown")
+
+    assert sample("http_responses_total", method="GET", route="/items/{item_id}", status="200") == before + 3
+    assert sample("http_responses_total", method="GET", route="<unmatched>", status="404") >= 1
+    assert sample("http_request_duration_seconds_count", method="GET", route="/items/{item_id}") >= 3
+    assert sample("http_response_size_bytes_sum", method="GET", route="/items/{item_id}") >= 3 * len(b'{"id":"a"}')
+    assert sample("http_requests_in_progress", method="GET") == 0
+
+    content, _ = render_metrics()
+    assert b'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/items/{item_id}"}' in content
+
+
+def test_cache_stats_exported():
+    cache = LRUCache(maxsize=1, ttl=60)
+    CACHE_STATS.register("test", cache.stats)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("b")
+    cache.get("a")
+
+    assert sample("cache_hits_total", cache="test", tier="local") == 1
+    assert sample("cache_misses_total", cache="test") == 1
+    assert sample("cache_evictions_total", cache="test") == 1
+    assert sample("cache_hit_rate", cache="test") == 0.5
+    assert b'cache_size{cache="test"} 1.0' in render_metrics()[0]
@@ -0,0 +1,69 @@
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from database import AsyncSessionLocal, sync_engine
+from models import OutboxMessage
+from outbox import enqueue_task, relay_outbox
+from tasks import send_welcome_email_task
+
+
+class FakeCelery:
+    def __init__(self):
+        self.sent = []
+
+    @contextmanager
+    def producer_or_acquire(self):
+        yield None
+
+    def send_task(self, name, args, producer):
+        self.sent.append((name, args))
+
+
+@contextmanager
+def rolled_back_session():
+    """relay_outbox 의 커밋을 세이브포인트로 처리하고 끝나면 롤백하는 세션 (다른 대기 메시지를 지우지 않는다)"""
+    with sync_engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+            yield session
+        transaction.rollback()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_join_relays_welcome_email_through_outbox(test_client):
+    email = f"{uuid4().hex[:12]}@email.com"
+    join_request = {"email": email, "password": "password", "address": "address", "name": "member"}
+    assert (await test_client.post("/join", json=join_request)).status_code == 201
+
+    app = FakeCelery()
+    with rolled_back_session() as session:
+        while relay_outbox(session, app, 100):
+            pass
+
+    assert ("tasks.send_welcome_email_task", [email, "member"]) in app.sent
+
+    with Session(sync_engine) as session:
+        session.execute(delete(OutboxMessage).where(OutboxMessage.args.contains([email])))
+        session.commit()
+    token = (await test_client.post("/login", data={"username": email, "password": "password"})).json()["token"]
+    await test_client.delete("/member", headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_rolled_back_enqueue_relays_nothing():
+    email = f"{uuid4().hex[:12]}@email.com"
+
+    async with AsyncSessionLocal() as db_session:
+        await enqueue_task(db_session, send_welcome_email_task, email, "member")
+        await db_session.rollback()
+
+    app = FakeCelery()
+    with rolled_back_session() as session:
+        while relay_outbox(session, app, 100):
+            pass
+
+    assert all(email not in args for _, args in app.sent)
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_posts_page(test_client, assert_max_queries):
+    with assert_max_queries(1):
+        response = await test_client.get("/posts", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) <= 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_posts_next_page(test_client):
+    first_page = (await test_client.get("/posts", params={"limit": 1})).json()
+
+    if first_page["next_cursor"] is None:
+        pytest.skip("게시물이 2개 이상 필요합니다.")
+
+    response = await test_client.get("/posts", params={"limit": 1, "after": first_page["next_cursor"]})
+
+    assert response.status_code == 200
+    assert response.json()["items"][0]["id"] < first_page["items"][0]["id"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_posts_invalid_cursor(test_client):
+    response = await test_client.get("/posts", params={"after": "not-a-ulid"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_posts_limit_exceeded(test_client):
+    response = await test_client.get("/posts", params={"limit": 1000})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_post_like_count(test_client):
+    token = (await test_client.post("/login", data={"username": "admin@email.com", "password": "password"})).json()[
+        "token"
+    ]
+    headers = {"Authorization": f"Bearer {token}"}
+    post_id = (
+        await test_client.post("/post", json={"title": "like test", "content": "like test"}, headers=headers)
+    ).json()["id"]
+
+    responses = await asyncio.gather(*[test_client.post(f"/post/{post_id}/like", headers=headers) for _ in range(20)])
+    assert all(response.status_code == 200 for response in responses)
+
+    result = (await test_client.post(f"/post/{post_id}/like", headers=headers)).json()
+
+    assert result["like_count"] == (1 if result["liked"] else 0)
+
+    await test_client.delete(f"/post/{post_id}", headers=headers)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_search_snippet_escapes_html(test_client):
+    token = (await test_client.post("/login", data={"username": "admin@email.com", "password": "password"})).json()[
+        "token"
+    ]
+    headers = {"Authorization": f"Bearer {token}"}
+    post_id = (
+        await test_client.post(
+            "/post", json={"title": "snippet test", "content": "<img src=x onerror=alert(1)> snippetxss"}, headers=headers
+        )
+    ).json()["id"]
+
+    response = await test_client.get("/posts/search", params={"q": "snippetxss"})
+    snippet = next(item["snippet"] for item in response.json()["items"] if item["id"] == post_id)
+
+    assert "<" not in snippet.replace("<mark>", "").replace("</mark>", "")
+    assert "&gt;" in snippet
+    assert "<mark>snippetxss</mark>" in snippet
+
+    await test_client.delete(f"/post/{post_id}", headers=headers)
@@ -0,0 +1,93 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, func, insert, select, update
+from ulid import ULID
+
+from config import get_settings
+from database import SyncSessionLocal
+from models import Member, OutboxMessage, Post, PostLike
+from purge import purge_member
+from redis_client import sync_redis_client
+
+
+def create_member(session) -> str:
+    member_id = str(uuid4())
+    session.execute(
+        insert(Member).values(
+            id=member_id,
+            email=f"{uuid4().hex[:12]}@email.com",
+            password="password",
+            address="address",
+            name="member",
+            created_at=datetime.now(),
+        )
+    )
+    return member_id
+
+
+def create_post(session, member_id: str) -> str:
+    post_id = str(ULID())
+    now = datetime.now()
+    session.execute(
+        insert(Post).values(
+            id=post_id, member_id=member_id, title="title", content="content", created_at=now, updated_at=now
+        )
+    )
+    return post_id
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_large_member_delete_defers_to_purge_task(test_client, assert_max_queries, monkeypatch):
+    monkeypatch.setattr(get_settings(), "PURGE_SYNC_THRESHOLD", 2)
+    email = f"{uuid4().hex[:12]}@email.com"
+    join_request = {"email": email, "password": "password", "address": "address", "name": "member"}
+    await test_client.post("/join", json=join_request)
+    token = (await test_client.post("/login", data={"username": email, "password": "password"})).json()["token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    for i in range(5):
+        await test_client.post("/post", json={"title": f"post {i}", "content": "content"}, headers=headers)
+
+    with assert_max_queries(2):
+        response = await test_client.delete("/member", headers=headers)
+
+    assert response.status_code == 204
+    with SyncSessionLocal() as session:
+        member_id = session.scalar(select(Member.id).where(Member.email == email))
+        assert session.scalar(select(func.count()).select_from(Post).where(Post.member_id == member_id)) == 5
+        assert session.scalar(
+            select(func.count())
+            .select_from(OutboxMessage)
+            .where(
+                OutboxMessage.task == "tasks.purge_member_task", OutboxMessage.args.contains([member_id])
+            )
+        ) == 1
+
+        session.execute(delete(OutboxMessage).where(OutboxMessage.args.contains([member_id])))
+        session.commit()
+        purge_member(session, sync_redis_client, member_id, batch_size=2)
+        assert session.scalar(select(func.count()).select_from(Member).where(Member.id == member_id)) == 0
+
+
+def test_purge_member_recounts_likes_of_liked_posts():
+    with SyncSessionLocal() as session:
+        deleted_id, author_id = create_member(session), create_member(session)
+        post_id = create_post(session, author_id)
+        session.execute(
+            insert(PostLike),
+            [{"post_id": post_id, "member_id": deleted_id}, {"post_id": post_id, "member_id": author_id}],
+        )
+        # 집계가 어긋나 있어도 좋아요 기록 수로 다시 계산한다.
+        session.execute(update(Post).where(Post.id == post_id).values(like_count=5))
+        session.execute(update(Member).where(Member.id == deleted_id).values(deleted_at=datetime.now()))
+        session.commit()
+
+        purge_member(session, sync_redis_client, deleted_id, batch_size=1)
+
+        likes = session.scalar(select(func.count()).select_from(PostLike).where(PostLike.post_id == post_id))
+        assert likes == 1
+        assert session.scalar(select(Post.like_count).where(Post.id == post_id)) == likes
+
+        session.execute(delete(Member).where(Member.id == author_id))
+        session.commit()
@@ -0,0 +1,42 @@
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+from pydantic import TypeAdapter
+
+from member.enums import MemberRole
+from member.schemas import GetMemberResponse
+from pagination import CursorPage
+from post.schemas import GetPostListResponse
+from serializers import ResponseSerializer
+
+
+def test_serializer_matches_response_model():
+    now = datetime.now()
+    members = [
+        SimpleNamespace(
+            id="member-id",
+            email="member@email.com",
+            address="address",
+            name="member",
+            role=MemberRole.USER,
+            created_at=now,
+        )
+    ]
+    adapter = TypeAdapter(List[GetMemberResponse])
+
+    assert ResponseSerializer(List[GetMemberResponse]).dump_json(members) == adapter.dump_json(
+        adapter.validate_python(members, from_attributes=True)
+    )
+
+
+def test_serializer_nested_page():
+    page = {
+        "items": [SimpleNamespace(id="post-id", publisher_name="member", title="title", created_at=datetime.now())],
+        "next_cursor": None,
+    }
+    adapter = TypeAdapter(CursorPage[GetPostListResponse])
+
+    assert ResponseSerializer(CursorPage[GetPostListResponse]).dump_json(page) == adapter.dump_json(
+        adapter.validate_python(page, from_attributes=True)
+    )
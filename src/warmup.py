@@ -0,0 +1,69 @@
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from auth.service import hash_executor
+from config import get_settings
+from database import AsyncSessionLocal, engine, replica_pool
+from pagination import SortOrder
+from post.service import get, get_all
+from redis_client import redis_client
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def _warm_engine(engine: AsyncEngine) -> None:
+    """커넥션 풀의 기본 크기만큼 동시에 접속해 커넥션을 미리 만든다."""
+
+    async def connect():
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*[connect() for _ in range(engine.pool.size())])
+
+
+async def _warm_redis() -> None:
+    await asyncio.gather(*[redis_client.ping() for _ in range(settings.WARMUP_REDIS_CONNECTIONS)])
+
+
+async def _prime_post_cache() -> None:
+    """최근 게시물 목록과 단건 조회를 한 번씩 실행해 캐시와 쿼리 컴파일 캐시를 채운다."""
+    async with AsyncSessionLocal() as session:
+        page = await get_all(session, None, settings.WARMUP_POST_COUNT, SortOrder.DESC)
+        for post in page["items"]:
+            await get(session, post.id)
+
+
+def _warm_hash_executor() -> None:
+    # 프로세스 풀은 작업을 받을 때 워커 프로세스를 만들므로 빈 작업으로 미리 띄운다.
+    for _ in range(settings.PASSWORD_HASH_WORKERS):
+        hash_executor.submit(int)
+
+
+async def warmup() -> None:
+    """
+    서버 시작 시 예열
+
+    DB(기본, 복제본) 커넥션 풀과 Redis 커넥션을 미리 만들고, 최근 게시물로 게시물 캐시를 채우고,
+    비밀번호 해싱 풀의 워커를 띄운다. 배포 직후 첫 요청이 접속과 캐시 미스 비용을 치르지 않도록 한다.
+    예열에 실패해도 서버는 시작하며, 해당 자원은 첫 요청에서 평소처럼 준비된다.
+    """
+    _warm_hash_executor()
+
+    steps = {
+        "database": _warm_engine(engine),
+        "redis": _warm_redis(),
+        **{f"replica {e.url.host}": _warm_engine(e) for e in replica_pool.engines},
+    }
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    for name, result in zip(steps, results):
+        if isinstance(result, Exception):
+            logger.warning("warmup of %s failed", name, exc_info=result)
+
+    try:
+        await _prime_post_cache()
+    except Exception:
+        logger.warning("warmup of post cache failed", exc_info=True)